@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark row parsing on the test fixtures.
+
+Compares, for every result set in tests/fixtures/, the per-row loop the
+endpoints used to run:
+
+    [Model(**dict(zip(headers, row))) for row in rows]
+
+with parse_rows(), which builds each row's input with a cached converter
+and validates the whole list through a cached TypeAdapter(list[Model]).
+Fixture rows are repeated to --rows rows (default 500, a full league table)
+so per-call overhead does not dominate.
+
+Usage:
+    python examples/benchmark_parsing.py
+    python examples/benchmark_parsing.py --rows 30 --repeat 10
+"""
+
+import argparse
+import json
+import timeit
+from pathlib import Path
+
+from goldsberry.models.base import parse_rows
+from goldsberry.models.game import (
+    PlayerBoxscoreAdvanced,
+    PlayerBoxscoreTraditional,
+    TeamBoxscoreAdvanced,
+    TeamBoxscoreTraditional,
+)
+from goldsberry.models.league import PlayerStats
+from goldsberry.models.league import TeamStats as LeagueTeamStats
+from goldsberry.models.player import CareerTotals, GameLog, PlayerInfo, SeasonTotals
+from goldsberry.models.team import Coach, RosterPlayer, TeamGameLog
+from goldsberry.models.team import TeamStats as TeamSeasonStats
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+# (fixture, result set index, model)
+CASES = [
+    ("league/player_stats_response.json", 0, PlayerStats),
+    ("league/team_stats_response.json", 0, LeagueTeamStats),
+    ("team/season_stats_response.json", 0, TeamSeasonStats),
+    ("team/game_logs_response.json", 0, TeamGameLog),
+    ("team/roster_response.json", 0, RosterPlayer),
+    ("team/roster_response.json", 1, Coach),
+    ("game/boxscore_traditional_response.json", 0, PlayerBoxscoreTraditional),
+    ("game/boxscore_traditional_response.json", 1, TeamBoxscoreTraditional),
+    ("game/boxscore_advanced_response.json", 0, PlayerBoxscoreAdvanced),
+    ("game/boxscore_advanced_response.json", 1, TeamBoxscoreAdvanced),
+    ("player/career_stats_response.json", 0, SeasonTotals),
+    ("player/career_stats_response.json", 1, CareerTotals),
+    ("player/game_logs_response.json", 0, GameLog),
+    ("player/player_list_response.json", 0, PlayerInfo),
+]
+
+
+def loop_parse(model_class, headers, rows):
+    """The per-row loop."""
+    return [model_class(**dict(zip(headers, row))) for row in rows]
+
+
+def best_time(func, number, repeat):
+    """Best time per call in milliseconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1000
+
+
+def main():
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500, help="rows per result set")
+    parser.add_argument("--number", type=int, default=20, help="calls per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="timings (best is kept)")
+    args = parser.parse_args()
+
+    print(f"{'fixture':<44} {'model':<26} {'loop ms':>9} {'batch ms':>9} {'speedup':>8}")
+    total_loop = total_batch = 0.0
+    for fixture, index, model_class in CASES:
+        result_set = json.loads((FIXTURES / fixture).read_text())["resultSets"][index]
+        headers = result_set["headers"]
+        rows = (result_set["rowSet"] * args.rows)[: args.rows]
+
+        assert parse_rows(model_class, headers, rows) == loop_parse(model_class, headers, rows)
+        loop = best_time(
+            lambda model_class=model_class, headers=headers, rows=rows: loop_parse(
+                model_class, headers, rows
+            ),
+            args.number,
+            args.repeat,
+        )
+        batch = best_time(
+            lambda model_class=model_class, headers=headers, rows=rows: parse_rows(
+                model_class, headers, rows
+            ),
+            args.number,
+            args.repeat,
+        )
+        total_loop += loop
+        total_batch += batch
+
+        name = f"{fixture}[{index}]"
+        speedup = loop / batch
+        print(f"{name:<44} {model_class.__name__:<26} {loop:>9.2f} {batch:>9.2f} {speedup:>7.2f}x")
+
+    print(f"{'total':<71} {total_loop:>9.2f} {total_batch:>9.2f} {total_loop / total_batch:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,31 +2,47 @@
 
 Provides both synchronous and asynchronous interfaces with:
 - Configurable timeouts and retries
-- Exponential backoff for transient failures
+- Jittered exponential backoff, Retry-After and a retry budget (see
+  goldsberry.client.retry)
 - Rate limiting to avoid API blocks
 - Comprehensive error handling
 - Request/response logging support
+- Optional response caching (see goldsberry.client.cache)
+- Coalescing of identical concurrent requests (single-flight)
+- Batched fetching with bounded concurrency (get_many / get_many_async)
+- Configurable connection pooling, keep-alive and optional HTTP/2
+- Optional hedged async requests for tail latency (see goldsberry.client.hedging)
+- Optional request lifecycle metrics (see goldsberry.client.metrics)
+- Event hooks for tracing and logging (see goldsberry.client.hooks)
+- Per-stage fetch timing (see goldsberry.client.profiling)
+- JSON decoding from raw bytes, with orjson when installed (see goldsberry.client.decoding)
+- Streaming of large result sets row by row (see goldsberry.client.streaming)
 """
 
 import asyncio
+import importlib.util
 import logging
+import math
+import threading
 import time
-from typing import Any, Optional
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Union
 from urllib.parse import urljoin
 
 import httpx
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-    before_sleep_log,
-)
 
+from .batch import BatchRequest, BatchResult, normalize_request
+from .breaker import BreakerState, CircuitBreaker, CircuitBreakerRegistry
+from .cache import ResponseCache, make_cache_key
+from .cassette import Cassette
+from .decoding import JSONDecoder, default_decoder
 from .exceptions import (
     CircuitBreakerError,
     ConfigurationError,
     HTTPError,
+    NBAAPIError,
     NetworkError,
     NotFoundError,
     ParseError,
@@ -34,9 +50,32 @@ from .exceptions import (
     ServerError,
     TimeoutError as NBATimeoutError,
 )
+from .hedging import HedgePolicy
+from .hooks import (
+    BreakerChangeEvent,
+    CacheHitEvent,
+    ClientHooks,
+    Hook,
+    RateLimitWaitEvent,
+    RequestEvent,
+    ResponseEvent,
+    RetryEvent,
+)
+from .log import log_debug, log_request, log_response
+from .metrics import ClientMetrics, async_trace_events, trace_events
+from .negative import NegativeCache, is_empty_result
+from .profiling import current_stats, detach_stats
+from .ratelimit import RateLimiter
+from .retry import AsyncRetryCallback, RetryCallback, RetryPolicy, parse_retry_after
+from .singleflight import AsyncSingleFlight, SingleFlight
+from .stale import StalePolicy, StaleResponse
+from .streaming import StreamItem, aiter_result_sets, iter_result_sets
 
 logger = logging.getLogger(__name__)
 
+# Cache TTL: fixed seconds, None (never expire), or a callable deciding per request
+CacheTTL = Union[None, float, Callable[[str, Optional[dict[str, Any]]], Optional[float]]]
+
 
 # Default headers that mimic a browser to avoid blocking
 DEFAULT_HEADERS = {
@@ -53,123 +92,16 @@ DEFAULT_HEADERS = {
 }
 
 
-class RateLimiter:
-    """Token bucket rate limiter for API requests.
-
-    Thread-safe implementation that ensures minimum time between requests.
-    """
-
-    def __init__(self, min_interval: float = 0.6) -> None:
-        """Initialize rate limiter.
-
-        Args:
-            min_interval: Minimum seconds between requests (default 0.6s)
-        """
-        self.min_interval = min_interval
-        self._last_request_time: float = 0.0
-        self._lock = asyncio.Lock()
-
-    async def acquire(self) -> None:
-        """Wait if necessary to respect rate limit (async)."""
-        async with self._lock:
-            current_time = time.time()
-            time_since_last = current_time - self._last_request_time
-
-            if time_since_last < self.min_interval:
-                wait_time = self.min_interval - time_since_last
-                logger.debug(f"Rate limiting: waiting {wait_time:.2f}s")
-                await asyncio.sleep(wait_time)
-
-            self._last_request_time = time.time()
-
-    def acquire_sync(self) -> None:
-        """Wait if necessary to respect rate limit (sync)."""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-
-        if time_since_last < self.min_interval:
-            wait_time = self.min_interval - time_since_last
-            logger.debug(f"Rate limiting: waiting {wait_time:.2f}s")
-            time.sleep(wait_time)
-
-        self._last_request_time = time.time()
-
-
-class CircuitBreaker:
-    """Circuit breaker to prevent hammering broken endpoints.
-
-    Opens after consecutive failures, closes after reset timeout.
-    """
-
-    def __init__(
-        self, failure_threshold: int = 5, reset_timeout: float = 60.0
-    ) -> None:
-        """Initialize circuit breaker.
-
-        Args:
-            failure_threshold: Consecutive failures before opening
-            reset_timeout: Seconds before attempting to close
-        """
-        self.failure_threshold = failure_threshold
-        self.reset_timeout = reset_timeout
-        self._failure_count = 0
-        self._opened_at: Optional[float] = None
-        self._lock = asyncio.Lock()
-
-    @property
-    def is_open(self) -> bool:
-        """Check if circuit breaker is open."""
-        if self._opened_at is None:
-            return False
-
-        # Check if enough time has passed to attempt reset
-        if time.time() - self._opened_at >= self.reset_timeout:
-            logger.info("Circuit breaker reset timeout reached, attempting to close")
-            self._opened_at = None
-            self._failure_count = 0
-            return False
-
-        return True
-
-    async def call(self, func: Any, *args: Any, **kwargs: Any) -> Any:
-        """Execute function with circuit breaker protection (async).
-
-        Args:
-            func: Async function to call
-            *args: Positional arguments
-            **kwargs: Keyword arguments
-
-        Returns:
-            Function result
-
-        Raises:
-            CircuitBreakerError: If circuit is open
-        """
-        async with self._lock:
-            if self.is_open:
-                raise CircuitBreakerError(
-                    "Circuit breaker is open due to consecutive failures",
-                    failure_count=self._failure_count,
-                    reset_timeout=self.reset_timeout,
-                )
+@dataclass
+class _Attempt:
+    """An HTTP attempt still to be logged and recorded (see BaseClient._finish_attempt)."""
 
-        try:
-            result = await func(*args, **kwargs)
-            # Success: reset failure count
-            async with self._lock:
-                self._failure_count = 0
-            return result
-
-        except Exception as e:
-            # Failure: increment count and potentially open breaker
-            async with self._lock:
-                self._failure_count += 1
-                if self._failure_count >= self.failure_threshold:
-                    self._opened_at = time.time()
-                    logger.warning(
-                        f"Circuit breaker opened after {self._failure_count} failures"
-                    )
-            raise e
+    method: str
+    endpoint: str
+    url: str
+    events: Optional[dict[str, float]] = None
+    request_event: Optional[RequestEvent] = None
+    start: float = field(default_factory=time.monotonic)
 
 
 class BaseClient:
@@ -184,9 +116,33 @@ class BaseClient:
         base_url: str = "https://stats.nba.com/stats/",
         timeout: float = 30.0,
         max_retries: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
         rate_limit_interval: float = 0.6,
+        rate_limit_burst: int = 1,
+        rate_limiter: Optional[RateLimiter] = None,
         enable_circuit_breaker: bool = True,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
         headers: Optional[dict[str, str]] = None,
+        cache: Optional[ResponseCache] = None,
+        cache_ttl: CacheTTL = None,
+        coalesce_requests: bool = True,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        hedging: Optional[HedgePolicy] = None,
+        stale: Optional[StalePolicy] = None,
+        negative_cache: Optional[NegativeCache] = None,
+        cassette: Optional[Cassette] = None,
+        transport: Optional[Union[httpx.BaseTransport, httpx.AsyncBaseTransport]] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+        metrics: Optional[ClientMetrics] = None,
+        hooks: Optional[ClientHooks] = None,
+        json_decoder: Optional[JSONDecoder] = None,
     ) -> None:
         """Initialize NBA API client.
 
@@ -194,9 +150,50 @@ class BaseClient:
             base_url: Base URL for NBA Stats API
             timeout: Request timeout in seconds (default: 30s)
             max_retries: Maximum retry attempts for transient failures
-            rate_limit_interval: Minimum seconds between requests
-            enable_circuit_breaker: Enable circuit breaker pattern
+            retry_policy: Custom retry policy (e.g. to share a retry budget
+                between clients); overrides max_retries
+            rate_limit_interval: Average seconds between requests
+            rate_limit_burst: Requests allowed back-to-back before spacing applies
+            rate_limiter: Pre-built limiter (e.g. with per-endpoint budgets or
+                shared with other clients); overrides the two settings above
+            enable_circuit_breaker: Enable per-endpoint circuit breakers
+            circuit_breakers: Custom breaker registry (e.g. keyed by endpoint
+                and season); used when enable_circuit_breaker is True
             headers: Custom headers (merged with defaults)
+            cache: Response cache backend (disabled if None)
+            cache_ttl: Seconds to keep cached responses, None to keep them
+                forever, or a callable ``(endpoint, params) -> ttl``. A TTL of
+                zero or less skips caching for that request.
+            coalesce_requests: Share one network call among concurrent
+                identical GET requests (same endpoint and canonical params)
+            max_connections: Maximum open connections per HTTP client (None: unlimited)
+            max_keepalive_connections: Idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection is kept alive
+            http2: Negotiate HTTP/2 (multiplexes requests over one connection;
+                requires the ``http2`` extra)
+            connect_timeout: Seconds to establish a connection (default: timeout)
+            read_timeout: Seconds to wait for response data (default: timeout)
+            write_timeout: Seconds to send request data (default: timeout)
+            pool_timeout: Seconds to wait for a free pooled connection (default: timeout)
+            hedging: Send a second copy of slow async GETs once they exceed a
+                per-endpoint latency percentile (disabled if None)
+            stale: Keep last-good payloads and serve them while refreshing
+                in the background and/or when requests fail (disabled if None)
+            negative_cache: Remember 404s and responses with no rows for a
+                short TTL so repeated probes skip the network (disabled if None)
+            cassette: Record every response to a cassette file, or replay
+                responses from one without network access (disabled if None)
+            transport: Custom httpx transport for the sync client; also used
+                by the async client if it implements the async interface (e.g.
+                goldsberry.testing.FakeNBAServer().transport()). An async-only
+                transport serves async requests only
+            async_transport: Custom httpx transport for the async client
+            metrics: Collect per-endpoint request, retry, rate limiter, byte
+                and timing metrics (disabled if None)
+            hooks: Pre-built hook registry (e.g. shared between clients);
+                hooks can also be added with on_request(), on_response(), etc.
+            json_decoder: Callable parsing raw JSON bytes (default: orjson if
+                installed, else the stdlib json module)
 
         Raises:
             ConfigurationError: If configuration is invalid
@@ -207,10 +204,31 @@ class BaseClient:
             raise ConfigurationError("Max retries cannot be negative")
         if rate_limit_interval < 0:
             raise ConfigurationError("Rate limit interval cannot be negative")
+        if rate_limit_burst < 1:
+            raise ConfigurationError("Rate limit burst must be at least 1")
+        if max_connections is not None and max_connections < 1:
+            raise ConfigurationError("Max connections must be at least 1")
+        for name, value in (
+            ("Connect timeout", connect_timeout),
+            ("Read timeout", read_timeout),
+            ("Write timeout", write_timeout),
+            ("Pool timeout", pool_timeout),
+        ):
+            if value is not None and value <= 0:
+                raise ConfigurationError(f"{name} must be positive")
+        if cassette is not None and (transport is not None or async_transport is not None):
+            raise ConfigurationError("Pass either a cassette or a transport, not both")
+        if async_transport is None and isinstance(transport, httpx.AsyncBaseTransport):
+            async_transport = transport
+        if http2 and importlib.util.find_spec("h2") is None:
+            raise ConfigurationError(
+                "HTTP/2 support requires the 'h2' package: pip install py-goldsberry[http2]"
+            )
 
         self.base_url = base_url
         self.timeout = timeout
-        self.max_retries = max_retries
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
+        self.max_retries = self.retry_policy.max_retries
 
         # Merge custom headers with defaults
         self.headers = DEFAULT_HEADERS.copy()
@@ -218,43 +236,246 @@ class BaseClient:
             self.headers.update(headers)
 
         # Rate limiting and circuit breaker
-        self.rate_limiter = RateLimiter(min_interval=rate_limit_interval)
-        self.circuit_breaker = (
-            CircuitBreaker() if enable_circuit_breaker else None
+        self.rate_limiter = rate_limiter or RateLimiter(
+            min_interval=rate_limit_interval, burst=rate_limit_burst
+        )
+        self.circuit_breakers: Optional[CircuitBreakerRegistry] = None
+        if enable_circuit_breaker:
+            self.circuit_breakers = circuit_breakers or CircuitBreakerRegistry()
+
+        # Response cache
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self.negative_cache = negative_cache
+
+        # Single-flight coalescing of identical in-flight requests
+        self.coalesce_requests = coalesce_requests
+        self._sync_flight = SingleFlight()
+        self._async_flight = AsyncSingleFlight()
+
+        # Connection pooling and timeouts
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
         )
+        self.http2 = http2
+        self.timeouts = httpx.Timeout(
+            timeout,
+            connect=connect_timeout or timeout,
+            read=read_timeout or timeout,
+            write=write_timeout or timeout,
+            pool=pool_timeout or timeout,
+        )
+
+        # Hedged requests (async GET only)
+        self.hedging = hedging
+
+        # Last-good payloads and background revalidation
+        self.stale = stale
+        self._revalidating: set[str] = set()
+        self._revalidating_lock = threading.Lock()
+        self._revalidation_tasks: set[asyncio.Future[None]] = set()
+        self._revalidation_executor: Optional[ThreadPoolExecutor] = None
+
+        # Record/replay or custom transport
+        self.cassette = cassette
+        self.transport = transport
+        self.async_transport = async_transport
+
+        # Request lifecycle metrics
+        self.metrics = metrics
+        if metrics is not None and self.circuit_breakers is not None:
+            metrics.track_breakers(self.circuit_breakers)
+
+        # JSON decoding (from raw body bytes)
+        self.json_decoder = json_decoder or default_decoder()
+
+        # Event hooks
+        self.hooks = hooks if hooks is not None else ClientHooks()
+        if self.circuit_breakers is not None:
+            self.circuit_breakers.add_listener(self._breaker_changed)
 
         # HTTP clients (created lazily)
         self._sync_client: Optional[httpx.Client] = None
         self._async_client: Optional[httpx.AsyncClient] = None
 
+    def on_request(self, hook: Hook) -> Hook:
+        """Register a hook called with a RequestEvent before each HTTP attempt."""
+        return self.hooks.add("request", hook)
+
+    def on_response(self, hook: Hook) -> Hook:
+        """Register a hook called with a ResponseEvent after each HTTP attempt."""
+        return self.hooks.add("response", hook)
+
+    def on_retry(self, hook: Hook) -> Hook:
+        """Register a hook called with a RetryEvent before each retry."""
+        return self.hooks.add("retry", hook)
+
+    def on_rate_limit_wait(self, hook: Hook) -> Hook:
+        """Register a hook called with a RateLimitWaitEvent when the limiter delays a request."""
+        return self.hooks.add("rate_limit_wait", hook)
+
+    def on_breaker_change(self, hook: Hook) -> Hook:
+        """Register a hook called with a BreakerChangeEvent on breaker transitions."""
+        return self.hooks.add("breaker_change", hook)
+
+    def on_cache_hit(self, hook: Hook) -> Hook:
+        """Register a hook called with a CacheHitEvent when a cache answers a request."""
+        return self.hooks.add("cache_hit", hook)
+
+    def _breaker_changed(self, name: str, old: BreakerState, new: BreakerState) -> None:
+        """Forward circuit breaker transitions to breaker_change hooks."""
+        if "breaker_change" in self.hooks:
+            self.hooks.emit("breaker_change", BreakerChangeEvent(name, old, new))
+
+    def _record_cache_hit(
+        self, endpoint: str, params: Optional[dict[str, Any]], kind: str
+    ) -> None:
+        """Report a request answered from a cache to metrics and hooks."""
+        if self.metrics is not None:
+            self.metrics.record_cache_hit(endpoint, kind)
+        stats = current_stats()
+        if stats is not None:
+            stats.source = kind
+        if "cache_hit" in self.hooks:
+            self.hooks.emit("cache_hit", CacheHitEvent(endpoint, params, kind))
+
     def _get_sync_client(self) -> httpx.Client:
         """Get or create sync HTTP client."""
         if self._sync_client is None:
+            transport = self.transport
+            if self.cassette is not None:
+                transport = self.cassette.transport(self.limits, self.http2)
+            elif transport is not None and not isinstance(transport, httpx.BaseTransport):
+                raise ConfigurationError("transport does not support sync requests")
             self._sync_client = httpx.Client(
-                timeout=httpx.Timeout(self.timeout),
+                timeout=self.timeouts,
+                limits=self.limits,
+                http2=self.http2,
                 follow_redirects=True,
                 headers=self.headers,
+                transport=transport,
             )
         return self._sync_client
 
     def _get_async_client(self) -> httpx.AsyncClient:
         """Get or create async HTTP client."""
         if self._async_client is None:
+            transport = self.async_transport
+            if self.cassette is not None:
+                transport = self.cassette.async_transport(self.limits, self.http2)
             self._async_client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self.timeout),
+                timeout=self.timeouts,
+                limits=self.limits,
+                http2=self.http2,
                 follow_redirects=True,
                 headers=self.headers,
+                transport=transport,
             )
         return self._async_client
 
+    def _warm_up_url(self) -> str:
+        """URL hit by warm-up requests (the API host root)."""
+        return urljoin(self.base_url, "/")
+
+    def _warm_up_count(self, connections: int) -> int:
+        """Warm-up requests the global rate limit allows in one burst."""
+        bucket = self.rate_limiter.bucket
+        if math.isinf(bucket.rate) or connections <= bucket.capacity:
+            return connections
+        logger.debug(
+            "Warm-up capped at %d connections (rate limit burst)", int(bucket.capacity)
+        )
+        return int(bucket.capacity)
+
+    def warm_up(self, connections: int = 1) -> int:
+        """Open pooled connections (TCP + TLS) before a batch starts.
+
+        Sends concurrent HEAD requests to the API host root so that
+        ``connections`` keep-alive connections are ready for reuse. Each
+        request takes a token from the global rate limit, and
+        ``connections`` is capped at its burst so the warm-up never sends
+        more back-to-back requests than the limiter allows. Failures are
+        logged and ignored.
+
+        Args:
+            connections: Number of connections to open
+
+        Returns:
+            Number of warm-up requests that got a response
+        """
+        client = self._get_sync_client()
+        url = self._warm_up_url()
+        connections = self._warm_up_count(connections)
+
+        def head() -> bool:
+            self.rate_limiter.acquire_sync()
+            try:
+                client.head(url)
+            except httpx.HTTPError as e:
+                logger.debug("Warm-up request failed: %s", e)
+                return False
+            return True
+
+        with ThreadPoolExecutor(max_workers=max(1, connections)) as executor:
+            results = list(executor.map(lambda _: head(), range(connections)))
+        return sum(results)
+
+    async def warm_up_async(self, connections: int = 1) -> int:
+        """Open pooled connections for the async client before a batch starts.
+
+        Async counterpart of warm_up; the same rate limiting applies.
+
+        Args:
+            connections: Number of connections to open
+
+        Returns:
+            Number of warm-up requests that got a response
+
+        Example:
+            >>> async with BaseClient(rate_limit_burst=8, max_keepalive_connections=8) as client:
+            ...     await client.warm_up_async(8)
+            ...     async for result in client.get_many_async(requests, concurrency=8):
+            ...         ...
+        """
+        client = self._get_async_client()
+        url = self._warm_up_url()
+        connections = self._warm_up_count(connections)
+
+        async def head() -> bool:
+            await self.rate_limiter.acquire()
+            try:
+                await client.head(url)
+            except httpx.HTTPError as e:
+                logger.debug("Warm-up request failed: %s", e)
+                return False
+            return True
+
+        results = await asyncio.gather(*(head() for _ in range(connections)))
+        return sum(results)
+
     def close(self) -> None:
-        """Close sync client (cleanup)."""
+        """Close sync client (cleanup).
+
+        Waits for background revalidations started by get() to finish.
+        """
+        if self._revalidation_executor is not None:
+            self._revalidation_executor.shutdown(wait=True)
+            self._revalidation_executor = None
         if self._sync_client is not None:
             self._sync_client.close()
             self._sync_client = None
 
     async def aclose(self) -> None:
-        """Close async client (cleanup)."""
+        """Close async client (cleanup).
+
+        Cancels background revalidations started by get_async().
+        """
+        for task in list(self._revalidation_tasks):
+            task.cancel()
+        if self._revalidation_tasks:
+            await asyncio.gather(*self._revalidation_tasks, return_exceptions=True)
         if self._async_client is not None:
             await self._async_client.aclose()
             self._async_client = None
@@ -293,7 +514,8 @@ class BaseClient:
             response: HTTP response object
 
         Raises:
-            HTTPError: For any non-2xx status code
+            RateLimitError: For 429 responses (with Retry-After, if sent)
+            HTTPError: For any other non-2xx status code
         """
         if response.status_code == 404:
             raise NotFoundError(
@@ -301,6 +523,16 @@ class BaseClient:
                 response_text=response.text,
             )
 
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+        if response.status_code == 429:
+            raise RateLimitError(
+                "Rate limited by NBA API (429)",
+                retry_after=retry_after,
+                status_code=429,
+                url=str(response.url),
+            )
+
         if 400 <= response.status_code < 500:
             raise HTTPError(
                 f"Client error {response.status_code}: {response.text[:200]}",
@@ -309,188 +541,724 @@ class BaseClient:
             )
 
         if response.status_code >= 500:
+            context = {"retry_after": retry_after} if retry_after is not None else {}
             raise ServerError(
                 f"Server error {response.status_code}: {response.text[:200]}",
                 status_code=response.status_code,
                 response_text=response.text,
+                **context,
             )
 
-    def _should_retry(self, exception: Exception) -> bool:
-        """Determine if exception is retryable.
+    def _decode_response(self, response: httpx.Response) -> dict[str, Any]:
+        """Decode a successful response body as JSON.
+
+        Parses the raw body bytes with the client's json_decoder.
 
         Args:
-            exception: Exception that occurred
+            response: HTTP response object
 
         Returns:
-            True if should retry
+            JSON response as dict
+
+        Raises:
+            ParseError: If the body is not valid JSON
         """
-        # Retry on network errors, timeouts, and server errors
-        if isinstance(exception, (NetworkError, NBATimeoutError, ServerError)):
-            return True
+        try:
+            return self.json_decoder(response.content)
+
+        except ValueError as e:
+            raise ParseError(
+                f"Failed to parse JSON response: {e}",
+                raw_response=response.text[:500],
+            ) from e
+
+    def _decode_timed(self, endpoint: str, response: httpx.Response) -> dict[str, Any]:
+        """Decode a response, reporting the decode time to logs, metrics and stats."""
+        start = time.monotonic()
+        data = self._decode_response(response)
+        elapsed = time.monotonic() - start
+
+        log_debug(
+            logger,
+            "Decoded %s response (%d bytes) in %.4fs",
+            endpoint,
+            len(response.content),
+            elapsed,
+            event="decode",
+            endpoint=endpoint,
+            elapsed=elapsed,
+        )
+        if self.metrics is not None:
+            self.metrics.record_decode(endpoint, elapsed)
+        stats = current_stats()
+        if stats is not None:
+            stats.source = "network"
+            stats.decode += elapsed
+        return data
+
+    def _resolve_cache_ttl(
+        self, endpoint: str, params: Optional[dict[str, Any]]
+    ) -> Optional[float]:
+        """Get the cache TTL for a request (None means never expire)."""
+        if callable(self.cache_ttl):
+            return self.cache_ttl(endpoint, params)
+        return self.cache_ttl
+
+    def _cache_lookup(self, key: str) -> Optional[dict[str, Any]]:
+        """Return the decoded cached response for key, if any."""
+        if self.cache is None:
+            return None
+
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+
+        try:
+            data = self.json_decoder(entry.body)
+        except ValueError:
+            logger.warning("Discarding corrupt cache entry: %s", key)
+            self.cache.delete(key)
+            return None
+
+        log_debug(logger, "Cache hit: %s (age %.0fs)", key, entry.age, event="cache_hit", key=key)
+        return data
+
+    def _cache_store(
+        self,
+        key: str,
+        endpoint: str,
+        params: Optional[dict[str, Any]],
+        response: httpx.Response,
+    ) -> None:
+        """Store a successful response body in the cache."""
+        if self.cache is None:
+            return
+
+        ttl = self._resolve_cache_ttl(endpoint, params)
+        if ttl is not None and ttl <= 0:
+            return
+        self.cache.set(key, response.content, ttl=ttl)
+
+    def _negative_lookup(self, key: str) -> Optional[dict[str, Any]]:
+        """Return a remembered empty response for key, if any.
+
+        Raises:
+            NotFoundError: If the request is remembered as a 404
+        """
+        if self.negative_cache is None:
+            return None
 
-        # Retry on specific httpx exceptions
-        if isinstance(exception, (httpx.TimeoutException, httpx.NetworkError)):
+        body = self.negative_cache.lookup(key)
+        if body is None:
+            return None
+        log_debug(logger, "Negative cache hit: %s", key, event="negative_cache_hit", key=key)
+        return self.json_decoder(body)
+
+    def _cached_response(
+        self, key: str, endpoint: str, params: Optional[dict[str, Any]]
+    ) -> Optional[dict[str, Any]]:
+        """Look up a GET response in the response and negative caches.
+
+        Raises:
+            NotFoundError: If a recent 404 for the request is cached
+        """
+        kind = "fresh"
+        try:
+            cached = self._cache_lookup(key)
+            if cached is None:
+                kind = "negative"
+                cached = self._negative_lookup(key)
+        except NotFoundError:
+            self._record_cache_hit(endpoint, params, kind)
+            raise
+
+        if cached is not None:
+            self._record_cache_hit(endpoint, params, kind)
+        return cached
+
+    def _store_response(
+        self,
+        key: str,
+        endpoint: str,
+        params: Optional[dict[str, Any]],
+        response: httpx.Response,
+        data: dict[str, Any],
+    ) -> None:
+        """Store a decoded successful response in the configured caches.
+
+        Responses without rows go to the negative cache (when enabled)
+        instead of the response cache, so they expire after its short TTL.
+        A ``cache_ttl`` with an ``observe`` method (like TTLPolicy) sees the
+        payload first, so its TTL can depend on what the response says.
+        """
+        observe = getattr(self.cache_ttl, "observe", None)
+        if observe is not None:
+            observe(endpoint, params, data)
+        if self.negative_cache is not None and is_empty_result(data):
+            self.negative_cache.record_empty(key, response.content)
+        else:
+            self._cache_store(key, endpoint, params, response)
+        self._stale_store(key, response)
+
+    def _stale_lookup(
+        self, key: str, max_age: float, error: Optional[Exception] = None
+    ) -> Optional[StaleResponse]:
+        """Return the last-good payload for key if it is at most max_age old."""
+        if self.stale is None or max_age <= 0:
+            return None
+
+        entry = self.stale.store.get(key)
+        if entry is None or entry.age > max_age:
+            return None
+
+        try:
+            data = self.json_decoder(entry.body)
+        except ValueError:
+            logger.warning("Discarding corrupt last-good entry: %s", key)
+            self.stale.store.delete(key)
+            return None
+        return StaleResponse(data, age=entry.age, error=error)
+
+    def _stale_store(self, key: str, response: httpx.Response) -> None:
+        """Keep a successful response body as the last-good payload for key."""
+        if self.stale is not None:
+            self.stale.store.set(key, response.content, ttl=None)
+
+    def _revalidate_after(
+        self, stale: StalePolicy, endpoint: str, params: Optional[dict[str, Any]]
+    ) -> float:
+        """Age at which a stale-while-revalidate hit triggers a refresh.
+
+        The request's cache TTL when a cache is configured, otherwise the
+        StalePolicy's ``revalidate_after``, so serving stale payloads never
+        refreshes more often than fresh caching would.
+
+        Args:
+            stale: The client's stale-while-revalidate policy
+            endpoint: API endpoint
+            params: Query parameters
+        """
+        if self.cache is not None:
+            ttl = self._resolve_cache_ttl(endpoint, params)
+            if ttl is not None:
+                return ttl
+        return stale.revalidate_after
+
+    def _start_revalidation(self, key: str) -> bool:
+        """Mark key as being refreshed; False if a refresh is already running."""
+        with self._revalidating_lock:
+            if key in self._revalidating:
+                return False
+            self._revalidating.add(key)
             return True
 
-        return False
+    def _finish_revalidation(self, key: str) -> None:
+        """Clear the in-progress refresh mark for key."""
+        with self._revalidating_lock:
+            self._revalidating.discard(key)
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError, ServerError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-        reraise=True,
-    )
-    async def _request_async(
+    def _map_transport_error(self, error: httpx.HTTPError, endpoint: str) -> NBAAPIError:
+        """Convert an httpx transport exception into an NBA API exception."""
+        if isinstance(error, httpx.TimeoutException):
+            return NBATimeoutError(
+                f"Request timed out after {self.timeout}s",
+                timeout=self.timeout,
+                endpoint=endpoint,
+            )
+        return NetworkError(
+            f"Network error: {error}",
+            endpoint=endpoint,
+        )
+
+    def _record_attempt(
+        self,
+        endpoint: str,
+        elapsed: float,
+        events: Optional[dict[str, float]],
+        response: Optional[httpx.Response] = None,
+        error: Optional[NBAAPIError] = None,
+        size: int = 0,
+    ) -> None:
+        """Record one HTTP attempt (a response or a transport error) in metrics."""
+        if self.metrics is None:
+            return
+        status = str(response.status_code) if response is not None else type(error).__name__
+        self.metrics.record_attempt(endpoint, status, elapsed, size)
+        if events:
+            self.metrics.record_trace(endpoint, events)
+
+    def _finish_attempt(
+        self,
+        attempt: "_Attempt",
+        response: Optional[httpx.Response] = None,
+        size: int = 0,
+        error: Optional[NBAAPIError] = None,
+    ) -> Optional[ResponseEvent]:
+        """Log a finished attempt and record it in metrics and FetchStats.
+
+        Args:
+            attempt: The attempt
+            response: Its response (None if it failed in transport)
+            size: Response body bytes received
+            error: Transport error, if any
+
+        Returns:
+            The ResponseEvent to emit if response hooks are registered
+        """
+        elapsed = time.monotonic() - attempt.start
+        log_response(
+            logger, attempt.method, attempt.url, elapsed, response=response, error=error, size=size
+        )
+        self._record_attempt(attempt.endpoint, elapsed, attempt.events, response, error, size)
+        stats = current_stats()
+        if stats is not None:
+            stats.attempts += 1
+            stats.network += elapsed
+            stats.bytes += size
+        if attempt.request_event is None:
+            return None
+        if response is None:
+            return ResponseEvent(attempt.request_event, elapsed, error=error)
+        return ResponseEvent(attempt.request_event, elapsed, response.status_code, size)
+
+    async def _send_async(
         self,
         method: str,
         endpoint: str,
         params: Optional[dict[str, Any]] = None,
-    ) -> dict[str, Any]:
-        """Make async HTTP request with retry logic.
+        acquire: bool = True,
+    ) -> httpx.Response:
+        """Make a single async HTTP attempt (rate limited, no retries).
 
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint
             params: Query parameters
+            acquire: Take a rate limiter slot first (False if already taken)
 
         Returns:
-            JSON response as dict
+            Successful (2xx) HTTP response
 
         Raises:
             Various NBA API exceptions
         """
+        response, _ = await self._attempt_async(method, endpoint, params, acquire)
+        return response
+
+    async def _attempt_async(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        acquire: bool = True,
+        stream: bool = False,
+    ) -> tuple[httpx.Response, Optional["_Attempt"]]:
+        """Make a single async HTTP attempt, optionally leaving a 2xx body unread.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint
+            params: Query parameters
+            acquire: Take a rate limiter slot first (False if already taken)
+            stream: Return a successful response as soon as its headers
+                arrive, with the body unread
+
+        Returns:
+            The response, and for streamed 2xx responses the attempt to pass
+            to _finish_stream_async once the body has been read (else None)
+
+        Raises:
+            Various NBA API exceptions
+        """
+        stats = current_stats()
+
         # Rate limiting
-        await self.rate_limiter.acquire()
+        if acquire:
+            waited = await self.rate_limiter.acquire(endpoint)
+            if self.metrics is not None:
+                self.metrics.record_rate_limit_wait(endpoint, waited)
+            if stats is not None:
+                stats.limiter_wait += waited
+            if waited > 0 and "rate_limit_wait" in self.hooks:
+                await self.hooks.emit_async("rate_limit_wait", RateLimitWaitEvent(endpoint, waited))
 
         # Build request
         url = self._build_url(endpoint)
         client = self._get_async_client()
 
-        logger.debug(f"Request: {method} {url} params={params}")
+        log_request(logger, method, url, params)
+
+        events: Optional[dict[str, float]] = None
+        extensions: Optional[dict[str, Any]] = None
+        if self.metrics is not None:
+            events, trace = async_trace_events()
+            extensions = {"trace": trace}
+
+        request_event: Optional[RequestEvent] = None
+        if "request" in self.hooks or "response" in self.hooks:
+            request_event = RequestEvent(method, endpoint, url, params)
+            await self.hooks.emit_async("request", request_event)
 
+        attempt = _Attempt(method, endpoint, url, events, request_event)
         try:
             # Make request
-            response = await client.request(method, url, params=params)
+            request = client.build_request(method, url, params=params, extensions=extensions)
+            response = await client.send(request, stream=stream)
+            if stream:
+                if response.is_success:
+                    # Recorded by _finish_stream_async once the body is read
+                    self.rate_limiter.record(time.monotonic() - attempt.start)
+                    return response, attempt
+                try:
+                    await response.aread()
+                except BaseException:
+                    await response.aclose()
+                    raise
+
+            event = self._finish_attempt(attempt, response, len(response.content))
+            if event is not None:
+                await self.hooks.emit_async("response", event)
 
             # Check for HTTP errors
             if not response.is_success:
                 self._handle_http_error(response)
 
-            # Parse JSON
-            try:
-                data = response.json()
-                logger.debug(f"Response: {len(str(data))} bytes")
-                return data
-
-            except ValueError as e:
-                raise ParseError(
-                    f"Failed to parse JSON response: {e}",
-                    raw_response=response.text[:500],
-                ) from e
-
-        except httpx.TimeoutException as e:
-            raise NBATimeoutError(
-                f"Request timed out after {self.timeout}s",
-                timeout=self.timeout,
-                endpoint=endpoint,
-            ) from e
+        except NBAAPIError as e:
+            self.rate_limiter.record(time.monotonic() - attempt.start, e)
+            raise
+
+        except (httpx.TimeoutException, httpx.NetworkError) as e:
+            error = self._map_transport_error(e, endpoint)
+            self.rate_limiter.record(time.monotonic() - attempt.start, error)
+            event = self._finish_attempt(attempt, error=error)
+            if event is not None:
+                await self.hooks.emit_async("response", event)
+            raise error from e
+
+        latency = time.monotonic() - attempt.start
+        self.rate_limiter.record(latency)
+        if self.hedging is not None:
+            self.hedging.record(endpoint, latency)
+        return response, None
+
+    async def _send_hedged_async(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """Make an async attempt, hedging it with a second copy if it runs slow.
+
+        The hedge is sent once the primary request has been outstanding for
+        the endpoint's hedge delay, and only if the rate limiter can grant a
+        slot immediately. The first successful response wins and the other
+        request is cancelled.
+
+        Args:
+            method: HTTP method (only GET is hedged)
+            endpoint: API endpoint
+            params: Query parameters
 
-        except httpx.NetworkError as e:
-            raise NetworkError(
-                f"Network error: {e}",
+        Returns:
+            Successful (2xx) HTTP response
+
+        Raises:
+            Various NBA API exceptions (from the primary request if both fail)
+        """
+        delay = self.hedging.delay_for(endpoint) if self.hedging is not None else None
+        if delay is None or method != "GET":
+            return await self._send_async(method, endpoint, params)
+
+        waited = await self.rate_limiter.acquire(endpoint)
+        if self.metrics is not None:
+            self.metrics.record_rate_limit_wait(endpoint, waited)
+        stats = current_stats()
+        if stats is not None:
+            stats.limiter_wait += waited
+        if waited > 0 and "rate_limit_wait" in self.hooks:
+            await self.hooks.emit_async("rate_limit_wait", RateLimitWaitEvent(endpoint, waited))
+        primary = asyncio.ensure_future(self._send_async(method, endpoint, params, acquire=False))
+        pending: set[asyncio.Future[httpx.Response]] = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done or not self.rate_limiter.try_acquire(endpoint):
+                return await primary
+
+            log_debug(
+                logger,
+                "Hedging %s request after %.2fs",
+                endpoint,
+                delay,
+                event="hedge",
                 endpoint=endpoint,
-            ) from e
+            )
+            hedge = asyncio.ensure_future(self._send_async(method, endpoint, params, acquire=False))
+            pending.add(hedge)
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+            return await primary
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _send_sync(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """Make a single sync HTTP attempt (rate limited, no retries).
 
-    def _request_sync(
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint
+            params: Query parameters
+
+        Returns:
+            Successful (2xx) HTTP response
+
+        Raises:
+            Various NBA API exceptions
+        """
+        response, _ = self._attempt_sync(method, endpoint, params)
+        return response
+
+    def _attempt_sync(
         self,
         method: str,
         endpoint: str,
         params: Optional[dict[str, Any]] = None,
-    ) -> dict[str, Any]:
-        """Make sync HTTP request with retry logic.
+        stream: bool = False,
+    ) -> tuple[httpx.Response, Optional["_Attempt"]]:
+        """Make a single sync HTTP attempt, optionally leaving a 2xx body unread.
 
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint
             params: Query parameters
+            stream: Return a successful response as soon as its headers
+                arrive, with the body unread
 
         Returns:
-            JSON response as dict
+            The response, and for streamed 2xx responses the attempt to pass
+            to _finish_stream_sync once the body has been read (else None)
 
         Raises:
             Various NBA API exceptions
         """
         # Rate limiting
-        self.rate_limiter.acquire_sync()
+        waited = self.rate_limiter.acquire_sync(endpoint)
+        if self.metrics is not None:
+            self.metrics.record_rate_limit_wait(endpoint, waited)
+        stats = current_stats()
+        if stats is not None:
+            stats.limiter_wait += waited
+        if waited > 0 and "rate_limit_wait" in self.hooks:
+            self.hooks.emit("rate_limit_wait", RateLimitWaitEvent(endpoint, waited))
 
         # Build request
         url = self._build_url(endpoint)
         client = self._get_sync_client()
 
-        logger.debug(f"Request: {method} {url} params={params}")
+        log_request(logger, method, url, params)
 
-        # Retry logic (manual for sync)
-        last_exception = None
-        for attempt in range(self.max_retries):
-            try:
-                # Make request
-                response = client.request(method, url, params=params)
+        events: Optional[dict[str, float]] = None
+        extensions: Optional[dict[str, Any]] = None
+        if self.metrics is not None:
+            events, trace = trace_events()
+            extensions = {"trace": trace}
 
-                # Check for HTTP errors
-                if not response.is_success:
-                    self._handle_http_error(response)
+        request_event: Optional[RequestEvent] = None
+        if "request" in self.hooks or "response" in self.hooks:
+            request_event = RequestEvent(method, endpoint, url, params)
+            self.hooks.emit("request", request_event)
 
-                # Parse JSON
+        attempt = _Attempt(method, endpoint, url, events, request_event)
+        try:
+            # Make request
+            request = client.build_request(method, url, params=params, extensions=extensions)
+            response = client.send(request, stream=stream)
+            if stream:
+                if response.is_success:
+                    # Recorded by _finish_stream_sync once the body is read
+                    self.rate_limiter.record(time.monotonic() - attempt.start)
+                    return response, attempt
                 try:
-                    data = response.json()
-                    logger.debug(f"Response: {len(str(data))} bytes")
-                    return data
-
-                except ValueError as e:
-                    raise ParseError(
-                        f"Failed to parse JSON response: {e}",
-                        raw_response=response.text[:500],
-                    ) from e
-
-            except httpx.TimeoutException as e:
-                last_exception = NBATimeoutError(
-                    f"Request timed out after {self.timeout}s",
-                    timeout=self.timeout,
-                    endpoint=endpoint,
+                    response.read()
+                except BaseException:
+                    response.close()
+                    raise
+
+            event = self._finish_attempt(attempt, response, len(response.content))
+            if event is not None:
+                self.hooks.emit("response", event)
+
+            # Check for HTTP errors
+            if not response.is_success:
+                self._handle_http_error(response)
+
+        except NBAAPIError as e:
+            self.rate_limiter.record(time.monotonic() - attempt.start, e)
+            raise
+
+        except (httpx.TimeoutException, httpx.NetworkError) as e:
+            error = self._map_transport_error(e, endpoint)
+            self.rate_limiter.record(time.monotonic() - attempt.start, error)
+            event = self._finish_attempt(attempt, error=error)
+            if event is not None:
+                self.hooks.emit("response", event)
+            raise error from e
+
+        self.rate_limiter.record(time.monotonic() - attempt.start)
+        return response, None
+
+    async def _request_async(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """Make async HTTP request, retrying according to the retry policy.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint
+            params: Query parameters
+
+        Returns:
+            Successful (2xx) HTTP response
+
+        Raises:
+            Various NBA API exceptions
+        """
+        return await self.retry_policy.call(
+            lambda: self._send_hedged_async(method, endpoint, params),
+            self._retry_callback_async(method, endpoint, params),
+        )
+
+    def _request_sync(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """Make sync HTTP request, retrying according to the retry policy.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint
+            params: Query parameters
+
+        Returns:
+            Successful (2xx) HTTP response
+
+        Raises:
+            Various NBA API exceptions
+        """
+        return self.retry_policy.call_sync(
+            lambda: self._send_sync(method, endpoint, params),
+            self._retry_callback(method, endpoint, params),
+        )
+
+    def _note_retry(
+        self, endpoint: str, attempt: int, delay: float, error: NBAAPIError
+    ) -> None:
+        """Log and count a retry."""
+        if self.metrics is not None:
+            self.metrics.record_retry(endpoint, error)
+        logger.warning(
+            "%s on %s, retrying in %.1fs (attempt %d)",
+            type(error).__name__,
+            endpoint,
+            delay,
+            attempt,
+        )
+
+    def _retry_callback(
+        self, method: str, endpoint: str, params: Optional[dict[str, Any]]
+    ) -> RetryCallback:
+        """Build the on_retry callback for RetryPolicy.call_sync."""
+
+        def on_retry(attempt: int, delay: float, error: NBAAPIError) -> None:
+            self._note_retry(endpoint, attempt, delay, error)
+            if "retry" in self.hooks:
+                self.hooks.emit(
+                    "retry", RetryEvent(method, endpoint, params, attempt, delay, error)
                 )
-                if attempt < self.max_retries - 1:
-                    wait_time = min(2 ** attempt, 10)
-                    logger.warning(f"Timeout, retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                    continue
-                raise last_exception from e
-
-            except httpx.NetworkError as e:
-                last_exception = NetworkError(
-                    f"Network error: {e}",
-                    endpoint=endpoint,
+
+        return on_retry
+
+    def _retry_callback_async(
+        self, method: str, endpoint: str, params: Optional[dict[str, Any]]
+    ) -> AsyncRetryCallback:
+        """Build the on_retry callback for RetryPolicy.call."""
+
+        async def on_retry(attempt: int, delay: float, error: NBAAPIError) -> None:
+            self._note_retry(endpoint, attempt, delay, error)
+            if "retry" in self.hooks:
+                await self.hooks.emit_async(
+                    "retry", RetryEvent(method, endpoint, params, attempt, delay, error)
                 )
-                if attempt < self.max_retries - 1:
-                    wait_time = min(2 ** attempt, 10)
-                    logger.warning(f"Network error, retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                    continue
-                raise last_exception from e
-
-            except ServerError as e:
-                last_exception = e
-                if attempt < self.max_retries - 1:
-                    wait_time = min(2 ** attempt, 10)
-                    logger.warning(f"Server error, retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                    continue
-                raise
 
-        # Should never reach here, but just in case
-        if last_exception:
-            raise last_exception
-        raise NetworkError("Unknown error during request")
+        return on_retry
+
+    async def _fetch_async(
+        self, key: str, endpoint: str, params: Optional[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Fetch, decode and cache a GET response (async).
+
+        When requests are coalesced, the returned dict is shared by every
+        waiter and must be treated as read-only.
+        """
+        try:
+            if self.circuit_breakers is not None:
+                breaker = self.circuit_breakers.get(endpoint, params)
+                response = await breaker.call(self._request_async, "GET", endpoint, params)
+            else:
+                response = await self._request_async("GET", endpoint, params)
+        except NotFoundError:
+            if self.negative_cache is not None:
+                self.negative_cache.record_not_found(key)
+            raise
+        except CircuitBreakerError:
+            if self.metrics is not None:
+                self.metrics.record_breaker_rejection(endpoint)
+            raise
+
+        data = self._decode_timed(endpoint, response)
+        self._store_response(key, endpoint, params, response, data)
+        return data
+
+    def _fetch_sync(
+        self, key: str, endpoint: str, params: Optional[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Fetch, decode and cache a GET response (sync).
+
+        When requests are coalesced, the returned dict is shared by every
+        waiter and must be treated as read-only.
+        """
+        try:
+            if self.circuit_breakers is not None:
+                breaker = self.circuit_breakers.get(endpoint, params)
+                response = breaker.call_sync(self._request_sync, "GET", endpoint, params)
+            else:
+                response = self._request_sync("GET", endpoint, params)
+        except NotFoundError:
+            if self.negative_cache is not None:
+                self.negative_cache.record_not_found(key)
+            raise
+        except CircuitBreakerError:
+            if self.metrics is not None:
+                self.metrics.record_breaker_rejection(endpoint)
+            raise
+
+        data = self._decode_timed(endpoint, response)
+        self._store_response(key, endpoint, params, response, data)
+        return data
 
     async def get_async(
         self, endpoint: str, params: Optional[dict[str, Any]] = None
@@ -502,16 +1270,69 @@ class BaseClient:
             params: Query parameters
 
         Returns:
-            JSON response
+            JSON response (a StaleResponse when a last-good payload is
+            served under the client's StalePolicy)
 
         Raises:
             Various NBA API exceptions
         """
-        if self.circuit_breaker:
-            return await self.circuit_breaker.call(
-                self._request_async, "GET", endpoint, params
+        stats = current_stats()
+        if stats is not None:
+            stats.endpoint = endpoint
+
+        key = make_cache_key(endpoint, params)
+        cached = self._cached_response(key, endpoint, params)
+        if cached is not None:
+            return cached
+
+        if self.stale is None:
+            return await self._fetch_coalesced_async(key, endpoint, params)
+
+        stale = self._stale_lookup(key, self.stale.while_revalidate)
+        if stale is not None:
+            self._record_cache_hit(endpoint, params, "stale")
+            if stale.age >= self._revalidate_after(self.stale, endpoint, params):
+                self._revalidate_async(key, endpoint, params)
+                stale.revalidating = True
+            return stale
+
+        try:
+            return await self._fetch_coalesced_async(key, endpoint, params)
+        except self.stale.errors as e:
+            stale = self._stale_lookup(key, self.stale.if_error, error=e)
+            if stale is None:
+                raise
+            self._record_cache_hit(endpoint, params, "stale")
+            logger.warning(
+                "%s on %s, serving payload from %.0fs ago", type(e).__name__, endpoint, stale.age
             )
-        return await self._request_async("GET", endpoint, params)
+            return stale
+
+    async def _fetch_coalesced_async(
+        self, key: str, endpoint: str, params: Optional[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Fetch a GET response, sharing it with identical in-flight requests."""
+        if self.coalesce_requests:
+            return await self._async_flight.do(key, self._fetch_async, key, endpoint, params)
+        return await self._fetch_async(key, endpoint, params)
+
+    def _revalidate_async(self, key: str, endpoint: str, params: Optional[dict[str, Any]]) -> None:
+        """Refresh a stale payload in a background task."""
+        if not self._start_revalidation(key):
+            return
+
+        async def refresh() -> None:
+            detach_stats()
+            try:
+                await self._fetch_coalesced_async(key, endpoint, params)
+            except Exception as e:
+                logger.warning("Background refresh of %s failed: %s", endpoint, e)
+            finally:
+                self._finish_revalidation(key)
+
+        task = asyncio.ensure_future(refresh())
+        self._revalidation_tasks.add(task)
+        task.add_done_callback(self._revalidation_tasks.discard)
 
     def get(
         self, endpoint: str, params: Optional[dict[str, Any]] = None
@@ -523,12 +1344,305 @@ class BaseClient:
             params: Query parameters
 
         Returns:
-            JSON response
+            JSON response (a StaleResponse when a last-good payload is
+            served under the client's StalePolicy)
 
         Raises:
             Various NBA API exceptions
         """
-        return self._request_sync("GET", endpoint, params)
+        stats = current_stats()
+        if stats is not None:
+            stats.endpoint = endpoint
+
+        key = make_cache_key(endpoint, params)
+        cached = self._cached_response(key, endpoint, params)
+        if cached is not None:
+            return cached
+
+        if self.stale is None:
+            return self._fetch_coalesced_sync(key, endpoint, params)
+
+        stale = self._stale_lookup(key, self.stale.while_revalidate)
+        if stale is not None:
+            self._record_cache_hit(endpoint, params, "stale")
+            if stale.age >= self._revalidate_after(self.stale, endpoint, params):
+                self._revalidate_sync(key, endpoint, params)
+                stale.revalidating = True
+            return stale
+
+        try:
+            return self._fetch_coalesced_sync(key, endpoint, params)
+        except self.stale.errors as e:
+            stale = self._stale_lookup(key, self.stale.if_error, error=e)
+            if stale is None:
+                raise
+            self._record_cache_hit(endpoint, params, "stale")
+            logger.warning(
+                "%s on %s, serving payload from %.0fs ago", type(e).__name__, endpoint, stale.age
+            )
+            return stale
+
+    def _fetch_coalesced_sync(
+        self, key: str, endpoint: str, params: Optional[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Fetch a GET response, sharing it with identical in-flight requests."""
+        if self.coalesce_requests:
+            return self._sync_flight.do(key, self._fetch_sync, key, endpoint, params)
+        return self._fetch_sync(key, endpoint, params)
+
+    def _revalidate_sync(self, key: str, endpoint: str, params: Optional[dict[str, Any]]) -> None:
+        """Refresh a stale payload on a background thread."""
+        if not self._start_revalidation(key):
+            return
+
+        def refresh() -> None:
+            try:
+                self._fetch_coalesced_sync(key, endpoint, params)
+            except Exception as e:
+                logger.warning("Background refresh of %s failed: %s", endpoint, e)
+            finally:
+                self._finish_revalidation(key)
+
+        if self._revalidation_executor is None:
+            self._revalidation_executor = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="goldsberry-revalidate"
+            )
+        self._revalidation_executor.submit(refresh)
+
+    def _open_stream_with_retries(
+        self, endpoint: str, params: Optional[dict[str, Any]]
+    ) -> tuple[httpx.Response, Optional["_Attempt"]]:
+        """Open a streaming response, retrying failures before the body starts."""
+        return self.retry_policy.call_sync(
+            lambda: self._attempt_sync("GET", endpoint, params, stream=True),
+            self._retry_callback("GET", endpoint, params),
+        )
+
+    async def _open_stream_with_retries_async(
+        self, endpoint: str, params: Optional[dict[str, Any]]
+    ) -> tuple[httpx.Response, Optional["_Attempt"]]:
+        """Open a streaming response, retrying failures before the body starts."""
+        return await self.retry_policy.call(
+            lambda: self._attempt_async("GET", endpoint, params, stream=True),
+            self._retry_callback_async("GET", endpoint, params),
+        )
+
+    def _finish_stream_sync(
+        self,
+        attempt: Optional["_Attempt"],
+        response: httpx.Response,
+        size: int,
+        error: Optional[NBAAPIError],
+    ) -> None:
+        """Record a streamed attempt once its body has been read (or failed)."""
+        if attempt is None:
+            return
+        event = self._finish_attempt(attempt, None if error else response, size, error)
+        if event is not None:
+            self.hooks.emit("response", event)
+
+    async def _finish_stream_async(
+        self,
+        attempt: Optional["_Attempt"],
+        response: httpx.Response,
+        size: int,
+        error: Optional[NBAAPIError],
+    ) -> None:
+        """Record a streamed attempt once its body has been read (or failed)."""
+        if attempt is None:
+            return
+        event = self._finish_attempt(attempt, None if error else response, size, error)
+        if event is not None:
+            await self.hooks.emit_async("response", event)
+
+    def stream(
+        self, endpoint: str, params: Optional[dict[str, Any]] = None
+    ) -> Iterator[StreamItem]:
+        """Stream a GET response's result sets without buffering the body.
+
+        Yields a ResultSetHeader for each result set, then its rows one at a
+        time, while the body is still downloading. The request is rate
+        limited, guarded by the endpoint's circuit breaker and retried until
+        the body starts; it bypasses caching, coalescing and stale payloads.
+        Hooks, metrics and FetchStats see the attempt once the body is read.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+
+        Yields:
+            ResultSetHeader items, each followed by its rows (lists)
+
+        Raises:
+            ParseError: If the body is not a valid resultSets payload
+            Various NBA API exceptions
+        """
+        if self.circuit_breakers is not None:
+            breaker = self.circuit_breakers.get(endpoint, params)
+            response, attempt = breaker.call_sync(self._open_stream_with_retries, endpoint, params)
+        else:
+            response, attempt = self._open_stream_with_retries(endpoint, params)
+
+        received = 0
+
+        def chunks() -> Iterator[bytes]:
+            nonlocal received
+            for chunk in response.iter_bytes():
+                received += len(chunk)
+                yield chunk
+
+        error: Optional[NBAAPIError] = None
+        try:
+            yield from iter_result_sets(chunks())
+        except (httpx.TimeoutException, httpx.NetworkError) as e:
+            error = self._map_transport_error(e, endpoint)
+            raise error from e
+        finally:
+            response.close()
+            self._finish_stream_sync(attempt, response, received, error)
+
+    async def stream_async(
+        self, endpoint: str, params: Optional[dict[str, Any]] = None
+    ) -> AsyncIterator[StreamItem]:
+        """Stream a GET response's result sets without buffering the body (async).
+
+        See stream() for details.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+
+        Yields:
+            ResultSetHeader items, each followed by its rows (lists)
+
+        Raises:
+            ParseError: If the body is not a valid resultSets payload
+            Various NBA API exceptions
+        """
+        if self.circuit_breakers is not None:
+            breaker = self.circuit_breakers.get(endpoint, params)
+            response, attempt = await breaker.call(
+                self._open_stream_with_retries_async, endpoint, params
+            )
+        else:
+            response, attempt = await self._open_stream_with_retries_async(endpoint, params)
+
+        received = 0
+
+        async def chunks() -> AsyncIterator[bytes]:
+            nonlocal received
+            async for chunk in response.aiter_bytes():
+                received += len(chunk)
+                yield chunk
+
+        error: Optional[NBAAPIError] = None
+        try:
+            async for item in aiter_result_sets(chunks()):
+                yield item
+        except (httpx.TimeoutException, httpx.NetworkError) as e:
+            error = self._map_transport_error(e, endpoint)
+            raise error from e
+        finally:
+            await response.aclose()
+            await self._finish_stream_async(attempt, response, received, error)
+
+    async def get_many_async(
+        self, requests: Iterable[BatchRequest], concurrency: int = 8
+    ) -> AsyncIterator[BatchResult]:
+        """Fetch many GET requests concurrently, yielding results as they complete.
+
+        Every request goes through get_async, so caching, coalescing, rate
+        limiting and the circuit breaker all apply. A failing request is
+        reported as a BatchResult with ``error`` set instead of aborting the
+        batch. All requests share the client's pooled httpx.AsyncClient.
+
+        Args:
+            requests: Endpoint names or (endpoint, params) pairs
+            concurrency: Maximum number of requests in flight at once
+
+        Yields:
+            BatchResult for each request, in completion order
+
+        Raises:
+            ConfigurationError: If concurrency is not positive
+
+        Example:
+            >>> games = [("boxscoretraditionalv2", {"GameID": gid}) for gid in game_ids]
+            >>> async with BaseClient() as client:
+            ...     async for result in client.get_many_async(games, concurrency=4):
+            ...         if result.ok:
+            ...             store(result.params["GameID"], result.data)
+        """
+        if concurrency <= 0:
+            raise ConfigurationError("Concurrency must be positive")
+
+        # Open the pooled client once for the whole batch
+        self._get_async_client()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(
+            index: int, endpoint: str, params: Optional[dict[str, Any]]
+        ) -> BatchResult:
+            async with semaphore:
+                try:
+                    data = await self.get_async(endpoint, params)
+                except Exception as e:
+                    return BatchResult(index, endpoint, params, error=e)
+                return BatchResult(index, endpoint, params, data=data)
+
+        tasks = [
+            asyncio.ensure_future(run(index, *normalize_request(request)))
+            for index, request in enumerate(requests)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def get_many(
+        self, requests: Iterable[BatchRequest], concurrency: int = 4
+    ) -> Iterator[BatchResult]:
+        """Fetch many GET requests from a thread pool, yielding results as they complete.
+
+        Sync counterpart of get_many_async: each request goes through get,
+        failures are reported per item, and all threads share the client's
+        pooled httpx.Client.
+
+        Args:
+            requests: Endpoint names or (endpoint, params) pairs
+            concurrency: Number of worker threads
+
+        Yields:
+            BatchResult for each request, in completion order
+
+        Raises:
+            ConfigurationError: If concurrency is not positive
+        """
+        if concurrency <= 0:
+            raise ConfigurationError("Concurrency must be positive")
+
+        self._get_sync_client()
+
+        def run(index: int, endpoint: str, params: Optional[dict[str, Any]]) -> BatchResult:
+            try:
+                data = self.get(endpoint, params)
+            except Exception as e:
+                return BatchResult(index, endpoint, params, error=e)
+            return BatchResult(index, endpoint, params, data=data)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                executor.submit(run, index, *normalize_request(request))
+                for index, request in enumerate(requests)
+            ]
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
 
 
 __all__ = ["BaseClient", "RateLimiter", "CircuitBreaker"]
@@ -0,0 +1,44 @@
+"""Result types for batched requests (BaseClient.get_many / get_many_async)."""
+
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+
+# A batch request: endpoint name, or (endpoint, params)
+BatchRequest = Union[str, tuple[str, Optional[dict[str, Any]]]]
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Outcome of one request in a batch.
+
+    Exactly one of ``data`` and ``error`` is set.
+
+    Attributes:
+        index: Position of the request in the submitted batch
+        endpoint: API endpoint that was requested
+        params: Query parameters that were sent
+        data: Decoded JSON response (on success)
+        error: Exception raised for this request (on failure)
+    """
+
+    index: int
+    endpoint: str
+    params: Optional[dict[str, Any]]
+    data: Optional[dict[str, Any]] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the request succeeded."""
+        return self.error is None
+
+
+def normalize_request(request: BatchRequest) -> tuple[str, Optional[dict[str, Any]]]:
+    """Convert a batch request into an (endpoint, params) pair."""
+    if isinstance(request, str):
+        return request, None
+    endpoint, params = request
+    return endpoint, params
+
+
+__all__ = ["BatchRequest", "BatchResult", "normalize_request"]
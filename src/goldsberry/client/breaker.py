@@ -0,0 +1,351 @@
+"""Circuit breakers that stop requests to failing endpoints.
+
+Each breaker moves between three states:
+
+- CLOSED: requests flow; consecutive failures are counted
+- OPEN: requests fail fast with CircuitBreakerError until reset_timeout passes
+- HALF_OPEN: a single probe request is let through; success closes the
+  breaker, failure re-opens it for another reset_timeout
+
+BaseClient keeps one breaker per endpoint (optionally per endpoint and
+season) in a CircuitBreakerRegistry, so one flaky endpoint does not block
+healthy ones.
+
+Example:
+    >>> registry = CircuitBreakerRegistry(key=CircuitBreakerRegistry.by_endpoint_and_season)
+    >>> client = BaseClient(circuit_breakers=registry)
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Iterator
+from contextlib import contextmanager
+from enum import Enum
+from typing import Any, Callable, Optional, TypeVar
+
+from .exceptions import CassetteError, CircuitBreakerError, HTTPError, ValidationError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Maps (endpoint, params) to the name of the breaker guarding the request
+BreakerKey = Callable[[str, Optional[dict[str, Any]]], str]
+
+
+class BreakerState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+# Called with (breaker name, old state, new state) after each transition
+BreakerListener = Callable[[str, BreakerState, BreakerState], None]
+
+
+def counts_as_failure(error: BaseException) -> bool:
+    """Whether an error indicates the endpoint is unhealthy.
+
+    Client errors (4xx other than 429, e.g. a 404 for an unknown game),
+    request validation errors and cassette replay misses say nothing about
+    endpoint health.
+    """
+    if isinstance(error, (ValidationError, CassetteError)):
+        return False
+    if isinstance(error, HTTPError):
+        return not (400 <= error.status_code < 500) or error.status_code == 429
+    return isinstance(error, Exception)
+
+
+class CircuitBreaker:
+    """Circuit breaker to prevent hammering broken endpoints.
+
+    Opens after consecutive failures and lets a single probe through once
+    reset_timeout has passed. Thread-safe; usable from sync and async code.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 60.0,
+        name: str = "default",
+        clock: Callable[[], float] = time.monotonic,
+        on_change: Optional[BreakerListener] = None,
+    ) -> None:
+        """Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures before opening
+            reset_timeout: Seconds before letting a probe request through
+            name: Breaker name (endpoint it guards), used in logs and errors
+            clock: Monotonic time source
+            on_change: Called after each state transition (outside the lock)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.name = name
+        self._clock = clock
+        self._state = BreakerState.CLOSED
+        self._failure_count = 0
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        self.on_change = on_change
+        self._transitions: list[tuple[BreakerState, BreakerState]] = []
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the lock, then report transitions made while holding it."""
+        transitions: list[tuple[BreakerState, BreakerState]] = []
+        try:
+            with self._lock:
+                try:
+                    yield
+                finally:
+                    if self._transitions:
+                        transitions, self._transitions = self._transitions, []
+        finally:
+            for old, new in transitions:
+                self._notify(old, new)
+
+    def _notify(self, old: BreakerState, new: BreakerState) -> None:
+        """Call the change listener, logging (not raising) its errors."""
+        if self.on_change is None:
+            return
+        try:
+            self.on_change(self.name, old, new)
+        except Exception as e:
+            logger.warning("Circuit breaker '%s' listener failed: %s", self.name, e)
+
+    def _set_state(self, state: BreakerState) -> None:
+        """Change state, queueing a notification if anyone listens (lock held)."""
+        if state is not self._state and self.on_change is not None:
+            self._transitions.append((self._state, state))
+        self._state = state
+
+    @property
+    def state(self) -> BreakerState:
+        """Current state (OPEN turns into HALF_OPEN once reset_timeout passes)."""
+        with self._locked():
+            return self._current_state()
+
+    @property
+    def failure_count(self) -> int:
+        """Consecutive failures counted so far."""
+        return self._failure_count
+
+    @property
+    def is_open(self) -> bool:
+        """Whether a request made now would be rejected."""
+        with self._locked():
+            state = self._current_state()
+            return state is BreakerState.OPEN or (
+                state is BreakerState.HALF_OPEN and self._probe_in_flight
+            )
+
+    def _current_state(self) -> BreakerState:
+        """Resolve the current state (lock held)."""
+        if (
+            self._state is BreakerState.OPEN
+            and self._opened_at is not None
+            and self._clock() - self._opened_at >= self.reset_timeout
+        ):
+            logger.info("Circuit breaker '%s' reset timeout reached, probing", self.name)
+            self._set_state(BreakerState.HALF_OPEN)
+            self._probe_in_flight = False
+        return self._state
+
+    def _reject(self) -> CircuitBreakerError:
+        """Build the error raised for a rejected request."""
+        return CircuitBreakerError(
+            "Circuit breaker is open due to consecutive failures",
+            failure_count=self._failure_count,
+            reset_timeout=self.reset_timeout,
+            breaker=self.name,
+        )
+
+    def before_call(self) -> None:
+        """Admit a request or raise if the breaker is open.
+
+        Raises:
+            CircuitBreakerError: If the breaker is open, or half-open with
+                a probe already in flight
+        """
+        with self._locked():
+            state = self._current_state()
+            if state is BreakerState.OPEN:
+                raise self._reject()
+            if state is BreakerState.HALF_OPEN:
+                if self._probe_in_flight:
+                    raise self._reject()
+                self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        """Record a successful request (closes a half-open breaker)."""
+        with self._locked():
+            if self._state is not BreakerState.CLOSED:
+                logger.info("Circuit breaker '%s' closed", self.name)
+            self._set_state(BreakerState.CLOSED)
+            self._failure_count = 0
+            self._opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed request (may open the breaker)."""
+        with self._locked():
+            self._failure_count += 1
+            state = self._current_state()
+            if state is BreakerState.HALF_OPEN or self._failure_count >= self.failure_threshold:
+                if state is not BreakerState.OPEN:
+                    logger.warning(
+                        "Circuit breaker '%s' opened after %d failures",
+                        self.name,
+                        self._failure_count,
+                    )
+                self._set_state(BreakerState.OPEN)
+                self._opened_at = self._clock()
+                self._probe_in_flight = False
+
+    def _record_outcome(self, error: Optional[BaseException]) -> None:
+        """Record a call outcome, ignoring errors that say nothing about health."""
+        if error is None:
+            self.record_success()
+        elif counts_as_failure(error):
+            self.record_failure()
+        else:
+            with self._lock:
+                # Endpoint answered; release the probe slot without judging it
+                if self._state is BreakerState.HALF_OPEN:
+                    self._probe_in_flight = False
+
+    async def call(self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Execute function with circuit breaker protection (async).
+
+        Args:
+            func: Async function to call
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            Function result
+
+        Raises:
+            CircuitBreakerError: If circuit is open
+        """
+        self.before_call()
+        try:
+            result = await func(*args, **kwargs)
+        except BaseException as e:
+            self._record_outcome(e)
+            raise
+        self._record_outcome(None)
+        return result
+
+    def call_sync(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Execute function with circuit breaker protection (sync).
+
+        Args:
+            func: Function to call
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            Function result
+
+        Raises:
+            CircuitBreakerError: If circuit is open
+        """
+        self.before_call()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            self._record_outcome(e)
+            raise
+        self._record_outcome(None)
+        return result
+
+
+class CircuitBreakerRegistry:
+    """Lazily created circuit breakers, one per key (endpoint by default)."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 60.0,
+        key: Optional[BreakerKey] = None,
+    ) -> None:
+        """Initialize registry.
+
+        Args:
+            failure_threshold: Consecutive failures before a breaker opens
+            reset_timeout: Seconds before an open breaker lets a probe through
+            key: Function mapping (endpoint, params) to a breaker name
+                (default: the endpoint)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.key = key or self.by_endpoint
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._listeners: list[BreakerListener] = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: BreakerListener) -> None:
+        """Call listener(name, old, new) whenever any breaker changes state."""
+        with self._lock:
+            self._listeners = [*self._listeners, listener]
+            for breaker in self._breakers.values():
+                breaker.on_change = self._notify
+
+    def _notify(self, name: str, old: BreakerState, new: BreakerState) -> None:
+        """Fan a breaker transition out to the registry's listeners."""
+        for listener in self._listeners:
+            listener(name, old, new)
+
+    @staticmethod
+    def by_endpoint(
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,  # noqa: ARG004 - shared key signature
+    ) -> str:
+        """Breaker key: one breaker per endpoint (params are ignored)."""
+        return endpoint
+
+    @staticmethod
+    def by_endpoint_and_season(endpoint: str, params: Optional[dict[str, Any]] = None) -> str:
+        """Breaker key: one breaker per endpoint and Season parameter."""
+        season = (params or {}).get("Season")
+        if season is None:
+            return endpoint
+        return f"{endpoint}:{getattr(season, 'value', season)}"
+
+    def get(self, endpoint: str, params: Optional[dict[str, Any]] = None) -> CircuitBreaker:
+        """Get (or create) the breaker guarding a request."""
+        name = self.key(endpoint, params)
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(name)
+                if breaker is None:
+                    breaker = CircuitBreaker(
+                        failure_threshold=self.failure_threshold,
+                        reset_timeout=self.reset_timeout,
+                        name=name,
+                        on_change=self._notify if self._listeners else None,
+                    )
+                    self._breakers[name] = breaker
+        return breaker
+
+    def states(self) -> dict[str, BreakerState]:
+        """Current state of every breaker, by name."""
+        return {name: breaker.state for name, breaker in list(self._breakers.items())}
+
+
+__all__ = [
+    "BreakerListener",
+    "BreakerState",
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "counts_as_failure",
+]
@@ -0,0 +1,372 @@
+"""Response caching for the NBA Stats API client.
+
+Caches store the raw response body (bytes) keyed by endpoint plus
+canonicalized query parameters, so a cached hit is byte-for-byte what
+stats.nba.com returned and is decoded exactly like a live response.
+
+Example:
+    >>> from goldsberry.client.base import BaseClient
+    >>> from goldsberry.client.cache import MemoryCache, SQLiteCache, TieredCache
+    >>>
+    >>> # Cache forever (completed seasons, finished games)
+    >>> client = BaseClient(cache=SQLiteCache("~/.cache/goldsberry.sqlite"))
+    >>>
+    >>> # Hot in-process LRU in front of the persistent store
+    >>> cache = TieredCache(MemoryCache(max_entries=512), SQLiteCache("nba.sqlite"))
+    >>> client = BaseClient(cache=cache, cache_ttl=300)
+"""
+
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Optional, Union
+from urllib.parse import urlencode
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A single cached response body.
+
+    Attributes:
+        body: Raw response bytes as returned by the API
+        stored_at: Wall-clock time (epoch seconds) the entry was written
+        expires_at: Wall-clock expiry time, or None to never expire
+    """
+
+    body: bytes
+    stored_at: float
+    expires_at: Optional[float] = None
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Check whether the entry has passed its expiry time."""
+        if self.expires_at is None:
+            return False
+        return (time.time() if now is None else now) >= self.expires_at
+
+    @property
+    def age(self) -> float:
+        """Seconds since the entry was stored."""
+        return max(0.0, time.time() - self.stored_at)
+
+
+def _canonical_value(value: Any) -> str:
+    """Render a parameter value the same way regardless of its Python type."""
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return ""
+    return str(value)
+
+
+def make_cache_key(endpoint: str, params: Optional[dict[str, Any]] = None) -> str:
+    """Build a canonical cache key for a request.
+
+    Parameters are sorted by name and enum members are replaced by their
+    values, so logically identical requests always map to the same key.
+
+    Args:
+        endpoint: API endpoint name (e.g., "leaguedashplayerstats")
+        params: Query parameters
+
+    Returns:
+        Cache key such as "playercareerstats?PerMode=Totals&PlayerID=2544"
+    """
+    endpoint = endpoint.strip("/")
+    if not params:
+        return endpoint
+    items = sorted((str(k), _canonical_value(v)) for k, v in params.items())
+    return f"{endpoint}?{urlencode(items)}"
+
+
+class ResponseCache(ABC):
+    """Interface for response cache backends.
+
+    Backends must be safe to call from multiple threads.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the cached entry for key, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, body: bytes, ttl: Optional[float] = None) -> None:
+        """Store a response body.
+
+        Args:
+            key: Cache key (see make_cache_key)
+            body: Raw response bytes
+            ttl: Seconds until expiry, or None to never expire
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove a single entry (no-op if missing)."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+
+class MemoryCache(ResponseCache):
+    """Bounded in-process LRU response cache.
+
+    Evicts least-recently-used entries once either the entry count or the
+    total stored bytes exceeds its limit. Shared by every endpoint that uses
+    the same BaseClient.
+
+    Example:
+        >>> client = BaseClient(cache=MemoryCache(max_entries=256), cache_ttl=60)
+        >>> LeagueTeamStatsEndpoint(client).fetch()  # network
+        >>> LeagueTeamStatsEndpoint(client).fetch()  # served from memory
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 256 * 1024 * 1024) -> None:
+        """Initialize memory cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached bodies in bytes
+
+        Raises:
+            ValueError: If a limit is not positive
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of cached bodies in bytes."""
+        return self._total_bytes
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the cached entry for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.is_expired():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, body: bytes, ttl: Optional[float] = None) -> None:
+        """Store a response body, evicting LRU entries to stay within limits.
+
+        Bodies larger than max_bytes are not cached.
+        """
+        if len(body) > self.max_bytes:
+            return
+
+        now = time.time()
+        entry = CacheEntry(
+            body=body,
+            stored_at=now,
+            expires_at=None if ttl is None else now + ttl,
+        )
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._total_bytes += len(body)
+
+            while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and update size accounting (caller holds the lock)."""
+        entry = self._entries.pop(key)
+        self._total_bytes -= len(entry.body)
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        return len(self._entries)
+
+
+class SQLiteCache(ResponseCache):
+    """Persistent response cache backed by a SQLite database file.
+
+    Entries survive process restarts, which makes re-running a backfill
+    nearly free: only requests that were never fetched (or have expired)
+    reach the network.
+
+    Example:
+        >>> cache = SQLiteCache("nba_cache.sqlite")
+        >>> client = BaseClient(cache=cache)
+        >>> client.get("playercareerstats", {"PlayerID": 2544, "PerMode": "Totals"})
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path: Database file path, or ":memory:" for a throwaway cache
+        """
+        path = str(path)
+        if path != ":memory:":
+            resolved = Path(path).expanduser()
+            resolved.parent.mkdir(parents=True, exist_ok=True)
+            path = str(resolved)
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " body BLOB NOT NULL,"
+                " stored_at REAL NOT NULL,"
+                " expires_at REAL"
+                ")"
+            )
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the cached entry for key, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, stored_at, expires_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        entry = CacheEntry(body=bytes(row[0]), stored_at=row[1], expires_at=row[2])
+        if entry.is_expired():
+            return None
+        return entry
+
+    def set(self, key: str, body: bytes, ttl: Optional[float] = None) -> None:
+        """Store a response body (ttl=None keeps it forever)."""
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, stored_at, expires_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, sqlite3.Binary(body), now, expires_at),
+            )
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def purge_expired(self) -> int:
+        """Delete expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            )
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        """Number of stored entries (including expired ones not yet purged)."""
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0])
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class TieredCache(ResponseCache):
+    """Layer a fast cache in front of a slower one.
+
+    Reads check each tier in order and copy hits into the faster tiers
+    (keeping the original expiry). Writes go to every tier.
+
+    Example:
+        >>> cache = TieredCache(MemoryCache(), SQLiteCache("nba.sqlite"))
+    """
+
+    def __init__(self, *tiers: ResponseCache) -> None:
+        """Initialize tiered cache.
+
+        Args:
+            *tiers: Caches ordered fastest first
+
+        Raises:
+            ValueError: If no tiers are given
+        """
+        if not tiers:
+            raise ValueError("TieredCache needs at least one tier")
+        self.tiers = tiers
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry from the fastest tier that has it."""
+        for index, tier in enumerate(self.tiers):
+            entry = tier.get(key)
+            if entry is None:
+                continue
+
+            ttl = None if entry.expires_at is None else entry.expires_at - time.time()
+            for faster in self.tiers[:index]:
+                faster.set(key, entry.body, ttl=ttl)
+            return entry
+        return None
+
+    def set(self, key: str, body: bytes, ttl: Optional[float] = None) -> None:
+        """Store a response body in every tier."""
+        for tier in self.tiers:
+            tier.set(key, body, ttl=ttl)
+
+    def delete(self, key: str) -> None:
+        """Remove an entry from every tier."""
+        for tier in self.tiers:
+            tier.delete(key)
+
+    def clear(self) -> None:
+        """Remove all entries from every tier."""
+        for tier in self.tiers:
+            tier.clear()
+
+
+__all__ = [
+    "CacheEntry",
+    "MemoryCache",
+    "ResponseCache",
+    "SQLiteCache",
+    "TieredCache",
+    "make_cache_key",
+]
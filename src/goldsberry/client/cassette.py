@@ -0,0 +1,370 @@
+"""Record/replay httpx transports for offline runs and reproducible benchmarks.
+
+In record mode every request BaseClient sends is forwarded to the API,
+and the response is captured to a cassette file. It stores the status,
+headers, body exactly as sent on the wire (still gzip/brotli compressed)
+and the time it took. In replay mode the cassette answers requests from
+disk without any network access. It can also reproduce the recorded
+latencies (scaled by ``latency_scale``).
+
+Requests match on method and URL with the query parameters sorted. When
+the same request was recorded several times (e.g. a 500 followed by a
+successful retry), replay serves the responses in recorded order and
+then keeps repeating the last one.
+
+Example:
+    >>> # Capture a crawl once...
+    >>> with BaseClient(cassette=Cassette("crawl.json", mode="record")) as client:
+    ...     LeagueTeamStatsEndpoint(client).fetch()
+    >>>
+    >>> # ...then replay it offline with the original timing
+    >>> client = BaseClient(
+    ...     cassette=Cassette("crawl.json", latency_scale=1.0), rate_limit_interval=0
+    ... )
+"""
+
+import asyncio
+import base64
+import json
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Union, cast
+
+import httpx
+
+from .exceptions import CassetteError
+
+CASSETTE_VERSION = 1
+
+
+class CassetteMode(str, Enum):
+    """Whether a cassette captures live traffic or serves it from disk."""
+
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+def request_key(method: str, url: Union[str, httpx.URL]) -> str:
+    """Key used to match a request against recorded interactions."""
+    url = httpx.URL(url)
+    url = url.copy_with(params=sorted(url.params.multi_items()))
+    return f"{method.upper()} {url}"
+
+
+@dataclass
+class Interaction:
+    """One recorded request/response pair.
+
+    Attributes:
+        method: HTTP method
+        url: Full request URL
+        status_code: Response status
+        headers: Response headers, in order
+        body: Response body as sent on the wire (possibly compressed)
+        elapsed: Seconds from sending the request to reading the body
+    """
+
+    method: str
+    url: str
+    status_code: int
+    headers: list[tuple[str, str]] = field(default_factory=list)
+    body: bytes = b""
+    elapsed: float = 0.0
+
+    @property
+    def key(self) -> str:
+        """Request matching key."""
+        return request_key(self.method, self.url)
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        """Build an httpx response for the recorded interaction."""
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            stream=httpx.ByteStream(self.body),
+            request=request,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the cassette file."""
+        return {
+            "method": self.method,
+            "url": self.url,
+            "status_code": self.status_code,
+            "headers": [list(header) for header in self.headers],
+            "body": base64.b64encode(self.body).decode("ascii"),
+            "elapsed": self.elapsed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Interaction":
+        """Deserialize from the cassette file."""
+        return cls(
+            method=data["method"],
+            url=data["url"],
+            status_code=data["status_code"],
+            headers=[(name, value) for name, value in data.get("headers", [])],
+            body=base64.b64decode(data.get("body", "")),
+            elapsed=data.get("elapsed", 0.0),
+        )
+
+
+class Cassette:
+    """A file of recorded interactions, used by BaseClient(cassette=...)."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        mode: Union[CassetteMode, str] = CassetteMode.REPLAY,
+        latency_scale: float = 0.0,
+    ) -> None:
+        """Initialize cassette.
+
+        Args:
+            path: Cassette file (JSON); loaded if it exists
+            mode: RECORD to capture live responses, REPLAY to serve them
+            latency_scale: Fraction of each recorded latency to sleep for
+                in replay mode (0: respond at once, 1: original timing)
+
+        Raises:
+            ValueError: If latency_scale is negative or the mode is unknown
+            CassetteError: If the file exists but is not a valid cassette
+        """
+        if latency_scale < 0:
+            raise ValueError("latency_scale cannot be negative")
+
+        self.path = Path(path).expanduser()
+        self.mode = CassetteMode(mode)
+        self.latency_scale = latency_scale
+        self.interactions: list[Interaction] = []
+        self._replay: dict[str, list[Interaction]] = {}
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            self.load()
+
+    def __len__(self) -> int:
+        """Number of recorded interactions."""
+        return len(self.interactions)
+
+    def load(self) -> None:
+        """(Re)load interactions from the cassette file.
+
+        Raises:
+            CassetteError: If the file is not a valid cassette
+        """
+        try:
+            data = json.loads(self.path.read_text())
+            interactions = [Interaction.from_dict(item) for item in data["interactions"]]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            raise CassetteError(f"Invalid cassette file: {e}", path=str(self.path)) from e
+
+        with self._lock:
+            self.interactions = []
+            self._replay = {}
+        self.extend(interactions)
+
+    def save(self) -> None:
+        """Write all interactions to the cassette file."""
+        with self._lock:
+            data = {
+                "version": CASSETTE_VERSION,
+                "interactions": [interaction.to_dict() for interaction in self.interactions],
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(data, indent=1))
+
+    def extend(self, interactions: Iterable[Interaction]) -> None:
+        """Add interactions (in order) to the cassette."""
+        with self._lock:
+            for interaction in interactions:
+                self.interactions.append(interaction)
+                self._replay.setdefault(interaction.key, []).append(interaction)
+
+    def add_json(
+        self,
+        url: str,
+        payload: Any,
+        status_code: int = 200,
+        elapsed: float = 0.0,
+        method: str = "GET",
+    ) -> Interaction:
+        """Add a JSON response, e.g. to turn a test fixture into a cassette entry.
+
+        Args:
+            url: Full request URL, including query parameters
+            payload: JSON-serializable response body
+            status_code: Response status
+            elapsed: Latency to report in replay mode
+            method: HTTP method
+
+        Returns:
+            The added interaction
+        """
+        interaction = Interaction(
+            method=method,
+            url=url,
+            status_code=status_code,
+            headers=[("content-type", "application/json")],
+            body=json.dumps(payload).encode(),
+            elapsed=elapsed,
+        )
+        self.extend([interaction])
+        return interaction
+
+    def next_interaction(self, request: httpx.Request) -> Interaction:
+        """Get the recorded interaction that answers a request.
+
+        Raises:
+            CassetteError: If the request was never recorded
+        """
+        key = request_key(request.method, request.url)
+        with self._lock:
+            queue = self._replay.get(key)
+            if not queue:
+                raise CassetteError(f"Request not found in cassette: {key}", path=str(self.path))
+            return queue.pop(0) if len(queue) > 1 else queue[0]
+
+    def transport(self, limits: httpx.Limits, http2: bool = False) -> httpx.BaseTransport:
+        """Build the transport BaseClient's sync httpx client should use."""
+        if self.mode is CassetteMode.RECORD:
+            return RecordingTransport(self, httpx.HTTPTransport(limits=limits, http2=http2))
+        return ReplayTransport(self)
+
+    def async_transport(
+        self, limits: httpx.Limits, http2: bool = False
+    ) -> httpx.AsyncBaseTransport:
+        """Build the transport BaseClient's async httpx client should use."""
+        if self.mode is CassetteMode.RECORD:
+            return AsyncRecordingTransport(
+                self, httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+            )
+        return ReplayTransport(self)
+
+
+def _record(
+    cassette: Cassette, request: httpx.Request, response: httpx.Response, body: bytes, start: float
+) -> httpx.Response:
+    """Store a live response in the cassette and return a re-readable copy."""
+    interaction = Interaction(
+        method=request.method,
+        url=str(request.url),
+        status_code=response.status_code,
+        headers=list(response.headers.multi_items()),
+        body=body,
+        elapsed=time.perf_counter() - start,
+    )
+    cassette.extend([interaction])
+    return httpx.Response(
+        response.status_code,
+        headers=response.headers,
+        stream=httpx.ByteStream(body),
+        request=request,
+        extensions=response.extensions,
+    )
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """Forward requests to a real transport and record the responses."""
+
+    def __init__(self, cassette: Cassette, transport: httpx.BaseTransport) -> None:
+        """Initialize recording transport.
+
+        Args:
+            cassette: Cassette receiving the interactions
+            transport: Transport that performs the real requests
+        """
+        self.cassette = cassette
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request and capture the raw response."""
+        start = time.perf_counter()
+        response = self.transport.handle_request(request)
+        try:
+            body = b"".join(cast("httpx.SyncByteStream", response.stream))
+        finally:
+            response.close()
+        return _record(self.cassette, request, response, body, start)
+
+    def close(self) -> None:
+        """Close the real transport and write the cassette."""
+        self.transport.close()
+        self.cassette.save()
+
+
+class AsyncRecordingTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of RecordingTransport."""
+
+    def __init__(self, cassette: Cassette, transport: httpx.AsyncBaseTransport) -> None:
+        """Initialize recording transport.
+
+        Args:
+            cassette: Cassette receiving the interactions
+            transport: Transport that performs the real requests
+        """
+        self.cassette = cassette
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request and capture the raw response."""
+        start = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        try:
+            stream = cast("httpx.AsyncByteStream", response.stream)
+            body = b"".join([chunk async for chunk in stream])
+        finally:
+            await response.aclose()
+        return _record(self.cassette, request, response, body, start)
+
+    async def aclose(self) -> None:
+        """Close the real transport and write the cassette."""
+        await self.transport.aclose()
+        self.cassette.save()
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Serve responses from a cassette without network access (sync and async)."""
+
+    def __init__(self, cassette: Cassette) -> None:
+        """Initialize replay transport.
+
+        Args:
+            cassette: Cassette holding the recorded interactions
+        """
+        self.cassette = cassette
+
+    def _delay(self, interaction: Interaction) -> float:
+        """Seconds to wait before answering."""
+        return interaction.elapsed * self.cassette.latency_scale
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request from the cassette."""
+        interaction = self.cassette.next_interaction(request)
+        delay = self._delay(interaction)
+        if delay > 0:
+            time.sleep(delay)
+        return interaction.to_response(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request from the cassette."""
+        interaction = self.cassette.next_interaction(request)
+        delay = self._delay(interaction)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return interaction.to_response(request)
+
+
+__all__ = [
+    "AsyncRecordingTransport",
+    "Cassette",
+    "CassetteMode",
+    "Interaction",
+    "RecordingTransport",
+    "ReplayTransport",
+    "request_key",
+]
@@ -0,0 +1,68 @@
+"""JSON decoders that parse response bodies straight from bytes.
+
+BaseClient decodes every response (and every cached body) with a
+``JSONDecoder``: a callable taking raw bytes and returning the parsed
+payload (a JSON object for every NBA Stats response). The default uses
+orjson when it is installed (``pip install py-goldsberry[fast]``) and
+the stdlib ``json`` module otherwise; both parse bytes directly, skipping
+the intermediate ``str`` that ``httpx.Response.json()`` builds.
+
+Example:
+    >>> client = BaseClient(json_decoder=stdlib_decoder)  # force the stdlib
+    >>> client = BaseClient(json_decoder=my_simdjson_loads)  # or bring your own
+"""
+
+import importlib.util
+import json
+from typing import Any, Callable, cast
+
+# Parses raw JSON bytes; must raise ValueError on invalid input
+JSONDecoder = Callable[[bytes], dict[str, Any]]
+
+
+def stdlib_decoder(content: bytes) -> dict[str, Any]:
+    """Decode JSON bytes with the stdlib (detects UTF-8/16/32)."""
+    return cast("dict[str, Any]", json.loads(content))
+
+
+def has_orjson() -> bool:
+    """Whether orjson is installed."""
+    return importlib.util.find_spec("orjson") is not None
+
+
+def orjson_decoder() -> JSONDecoder:
+    """Build a decoder using orjson, falling back to the stdlib on its errors.
+
+    orjson is stricter than the stdlib (no NaN/Infinity literals, integers
+    limited to 64 bits, UTF-8 only), so payloads it rejects are retried with
+    ``json.loads`` to keep results identical.
+
+    Raises:
+        ImportError: If orjson is not installed
+    """
+    import orjson
+
+    loads = orjson.loads
+    error = orjson.JSONDecodeError
+
+    def decode(content: bytes) -> dict[str, Any]:
+        try:
+            return cast("dict[str, Any]", loads(content))
+        except error:
+            return stdlib_decoder(content)
+
+    return decode
+
+
+def default_decoder() -> JSONDecoder:
+    """The fastest available decoder (orjson if installed, else the stdlib)."""
+    return orjson_decoder() if has_orjson() else stdlib_decoder
+
+
+__all__ = [
+    "JSONDecoder",
+    "default_decoder",
+    "has_orjson",
+    "orjson_decoder",
+    "stdlib_decoder",
+]
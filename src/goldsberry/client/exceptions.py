@@ -220,6 +220,14 @@ class ConfigurationError(NBAAPIError):
     """
 
 
+class CassetteError(NBAAPIError):
+    """Record/replay cassette errors.
+
+    Raised when a cassette file is invalid, or when a request being
+    replayed was never recorded.
+    """
+
+
 __all__ = [
     "NBAAPIError",
     "NetworkError",
@@ -232,4 +240,5 @@ __all__ = [
     "ParseError",
     "CircuitBreakerError",
     "ConfigurationError",
+    "CassetteError",
 ]
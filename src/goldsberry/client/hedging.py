@@ -0,0 +1,112 @@
+"""Hedged requests for cutting tail latency on async GETs.
+
+stats.nba.com answers most requests quickly but occasionally hangs until
+the timeout. With hedging enabled, BaseClient.get_async sends a second
+copy of a request that has been outstanding longer than a latency
+percentile observed for that endpoint, and uses whichever response
+arrives first. The copy is only sent when the rate limiter has a token
+available right away, so hedging never exceeds the request budget.
+
+Example:
+    >>> client = BaseClient(hedging=HedgePolicy(percentile=0.95))
+    >>> data = await client.get_async("boxscoretraditionalv2", {"GameID": "0022400001"})
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Optional
+
+
+class LatencyTracker:
+    """Sliding window of recent response latencies per endpoint."""
+
+    def __init__(self, window: int = 200) -> None:
+        """Initialize tracker.
+
+        Args:
+            window: Number of recent samples kept per endpoint
+        """
+        self.window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """Add a latency sample (seconds) for an endpoint."""
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(latency)
+
+    def count(self, endpoint: str) -> int:
+        """Number of samples held for an endpoint."""
+        return len(self._samples.get(endpoint, ()))
+
+    def percentile(self, endpoint: str, q: float) -> Optional[float]:
+        """Latency at quantile q (0-1) for an endpoint, or None without samples."""
+        with self._lock:
+            samples = sorted(self._samples.get(endpoint, ()))
+        if not samples:
+            return None
+        index = min(len(samples) - 1, max(0, math.ceil(q * len(samples)) - 1))
+        return samples[index]
+
+
+class HedgePolicy:
+    """When to send a hedged copy of a slow request.
+
+    The hedge delay for an endpoint is its ``percentile`` latency over the
+    last ``window`` successful responses, clamped to
+    ``[min_delay, max_delay]``. Until ``min_samples`` responses have been
+    seen, requests to that endpoint are not hedged.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        min_delay: float = 0.05,
+        max_delay: Optional[float] = None,
+        window: int = 200,
+    ) -> None:
+        """Initialize hedge policy.
+
+        Args:
+            percentile: Latency quantile (0-1) after which a hedge is sent
+            min_samples: Samples needed before hedging an endpoint
+            min_delay: Shortest hedge delay in seconds
+            max_delay: Longest hedge delay in seconds (None for no cap)
+            window: Recent samples kept per endpoint
+
+        Raises:
+            ValueError: If percentile is outside (0, 1]
+        """
+        if not 0 < percentile <= 1:
+            raise ValueError("percentile must be in (0, 1]")
+
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.latencies = LatencyTracker(window=window)
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """Record the latency of a successful response."""
+        self.latencies.record(endpoint, latency)
+
+    def delay_for(self, endpoint: str) -> Optional[float]:
+        """Seconds to wait before hedging a request, or None to not hedge."""
+        if self.latencies.count(endpoint) < self.min_samples:
+            return None
+
+        delay = self.latencies.percentile(endpoint, self.percentile)
+        if delay is None:
+            return None
+        delay = max(self.min_delay, delay)
+        if self.max_delay is not None:
+            delay = min(self.max_delay, delay)
+        return delay
+
+
+__all__ = ["HedgePolicy", "LatencyTracker"]
@@ -0,0 +1,257 @@
+"""Event hooks for observing BaseClient requests.
+
+Hooks are callables registered per event; each receives one event object:
+
+- ``request``: RequestEvent, before every HTTP attempt
+- ``response``: ResponseEvent, after every attempt (response or transport error)
+- ``retry``: RetryEvent, before sleeping ahead of a retry
+- ``rate_limit_wait``: RateLimitWaitEvent, after the rate limiter made a request wait
+- ``breaker_change``: BreakerChangeEvent, after a circuit breaker changes state
+- ``cache_hit``: CacheHitEvent, when a request is answered from a cache
+
+Hooks may be plain functions or coroutine functions. Async requests await
+coroutine hooks in order; sync requests (and breaker and cache events)
+schedule them on the running event loop, or skip them if there is none.
+Exceptions raised by hooks are logged and never fail the request. With no
+hooks registered, the client skips building events altogether.
+
+Example:
+    >>> client = BaseClient()
+    >>> @client.on_response
+    ... def log_slow(event):
+    ...     if event.elapsed > 2:
+    ...         print(f"slow {event.request.endpoint}: {event.elapsed:.1f}s")
+"""
+
+import asyncio
+import inspect
+import logging
+from collections.abc import Awaitable
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, TypeVar, Union
+
+from .breaker import BreakerState
+from .exceptions import NBAAPIError
+
+logger = logging.getLogger(__name__)
+
+HOOK_EVENTS = (
+    "request",
+    "response",
+    "retry",
+    "rate_limit_wait",
+    "breaker_change",
+    "cache_hit",
+)
+
+Hook = Callable[[Any], Union[None, Awaitable[None]]]
+H = TypeVar("H", bound=Hook)
+
+
+@dataclass
+class RequestEvent:
+    """An HTTP attempt about to be sent.
+
+    Attributes:
+        method: HTTP method
+        endpoint: API endpoint
+        url: Full request URL (without query string)
+        params: Query parameters
+        context: Scratch space for hooks (e.g. a tracing span), shared with
+            the matching ResponseEvent
+    """
+
+    method: str
+    endpoint: str
+    url: str
+    params: Optional[dict[str, Any]]
+    context: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class ResponseEvent:
+    """The outcome of an HTTP attempt.
+
+    Attributes:
+        request: The attempt's RequestEvent
+        elapsed: Seconds from sending the request to reading the body
+        status_code: HTTP status (None if the request failed in transport)
+        size: Response body bytes
+        error: Transport error (timeout, connection failure), if any
+    """
+
+    request: RequestEvent
+    elapsed: float
+    status_code: Optional[int] = None
+    size: int = 0
+    error: Optional[NBAAPIError] = None
+
+
+@dataclass
+class RetryEvent:
+    """A failed attempt that is about to be retried.
+
+    Attributes:
+        method: HTTP method
+        endpoint: API endpoint
+        params: Query parameters
+        attempt: Number of the attempt that failed (1 for the first)
+        delay: Seconds the client will wait before retrying
+        error: Error that triggered the retry
+    """
+
+    method: str
+    endpoint: str
+    params: Optional[dict[str, Any]]
+    attempt: int
+    delay: float
+    error: NBAAPIError
+
+
+@dataclass
+class RateLimitWaitEvent:
+    """Time a request spent waiting for the rate limiter.
+
+    Attributes:
+        endpoint: API endpoint
+        seconds: Seconds waited
+    """
+
+    endpoint: str
+    seconds: float
+
+
+@dataclass
+class BreakerChangeEvent:
+    """A circuit breaker state transition.
+
+    Attributes:
+        breaker: Breaker name (usually the endpoint)
+        old_state: State before the transition
+        new_state: State after the transition
+    """
+
+    breaker: str
+    old_state: BreakerState
+    new_state: BreakerState
+
+
+@dataclass
+class CacheHitEvent:
+    """A request answered without the network.
+
+    Attributes:
+        endpoint: API endpoint
+        params: Query parameters
+        kind: Cache that answered ("fresh", "negative" or "stale")
+    """
+
+    endpoint: str
+    params: Optional[dict[str, Any]]
+    kind: str
+
+
+class ClientHooks:
+    """Registered hooks, by event name."""
+
+    def __init__(self) -> None:
+        """Initialize with no hooks."""
+        self._hooks: dict[str, list[Hook]] = {}
+        self._tasks: set[asyncio.Future[Any]] = set()
+
+    def add(self, event: str, hook: H) -> H:
+        """Register a hook (returns it, so this works as a decorator).
+
+        Args:
+            event: Event name (one of HOOK_EVENTS)
+            hook: Function or coroutine function taking the event object
+
+        Returns:
+            The hook
+
+        Raises:
+            ValueError: If the event name is unknown
+        """
+        if event not in HOOK_EVENTS:
+            raise ValueError(f"Unknown hook event '{event}' (expected one of {HOOK_EVENTS})")
+        # Copy on write so emitting never sees a list being modified
+        self._hooks[event] = [*self._hooks.get(event, ()), hook]
+        return hook
+
+    def remove(self, event: str, hook: Hook) -> None:
+        """Unregister a hook (no-op if it is not registered)."""
+        hooks = [h for h in self._hooks.get(event, ()) if h is not hook]
+        if hooks:
+            self._hooks[event] = hooks
+        else:
+            self._hooks.pop(event, None)
+
+    def clear(self) -> None:
+        """Unregister every hook."""
+        self._hooks = {}
+
+    def __contains__(self, event: str) -> bool:
+        """Whether any hook is registered for an event."""
+        return event in self._hooks
+
+    def __bool__(self) -> bool:
+        """Whether any hook is registered at all."""
+        return bool(self._hooks)
+
+    def emit(self, event: str, payload: Any) -> None:
+        """Call an event's hooks from sync code.
+
+        Coroutine hooks are scheduled on the running event loop, or skipped
+        when there is none.
+        """
+        for hook in self._hooks.get(event, ()):
+            try:
+                result = hook(payload)
+            except Exception as e:
+                logger.warning("%s hook %r failed: %s", event, hook, e)
+                continue
+            if inspect.isawaitable(result):
+                self._schedule(event, hook, result)
+
+    async def emit_async(self, event: str, payload: Any) -> None:
+        """Call an event's hooks, awaiting coroutine hooks in order."""
+        for hook in self._hooks.get(event, ()):
+            try:
+                result = hook(payload)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.warning("%s hook %r failed: %s", event, hook, e)
+
+    def _schedule(self, event: str, hook: Hook, result: Awaitable[Any]) -> None:
+        """Run a coroutine hook's result in the background."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            if inspect.iscoroutine(result):
+                result.close()
+            logger.debug("Skipping async %s hook %r: no running event loop", event, hook)
+            return
+
+        async def run() -> None:
+            try:
+                await result
+            except Exception as e:
+                logger.warning("%s hook %r failed: %s", event, hook, e)
+
+        task = asyncio.ensure_future(run())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+__all__ = [
+    "HOOK_EVENTS",
+    "BreakerChangeEvent",
+    "CacheHitEvent",
+    "ClientHooks",
+    "Hook",
+    "RateLimitWaitEvent",
+    "RequestEvent",
+    "ResponseEvent",
+    "RetryEvent",
+]
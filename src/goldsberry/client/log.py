@@ -0,0 +1,89 @@
+"""Lazily evaluated, structured logging for the request hot path.
+
+Each helper checks ``logger.isEnabledFor`` before building anything, so a
+disabled level costs one call and a level check: no string formatting, no
+payload inspection. Messages use %-style arguments, and the values are also
+attached to the record as a ``goldsberry`` dict (``record.goldsberry``) for
+JSON log formatters.
+
+Example:
+    >>> logging.getLogger("goldsberry.client").setLevel(logging.DEBUG)
+    DEBUG Response: GET https://stats.nba.com/stats/playergamelog -> 200 (48213 bytes, 0.412s)
+"""
+
+import logging
+from typing import Any, Optional
+
+import httpx
+
+from .exceptions import NBAAPIError
+
+
+def log_debug(logger: logging.Logger, msg: str, *args: Any, **fields: Any) -> None:
+    """Log at DEBUG with lazy %-style args and structured fields, if enabled."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(msg, *args, extra={"goldsberry": fields})
+
+
+def log_request(
+    logger: logging.Logger, method: str, url: str, params: Optional[dict[str, Any]]
+) -> None:
+    """Log an outgoing request at DEBUG, if enabled."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Request: %s %s params=%s",
+            method,
+            url,
+            params,
+            extra={"goldsberry": {"event": "request", "method": method, "url": url}},
+        )
+
+
+def log_response(
+    logger: logging.Logger,
+    method: str,
+    url: str,
+    elapsed: float,
+    response: Optional[httpx.Response] = None,
+    error: Optional[NBAAPIError] = None,
+    size: Optional[int] = None,
+) -> None:
+    """Log the outcome of an attempt at DEBUG, if enabled.
+
+    Sizes are the body's byte count, never the length of the decoded payload.
+    Pass ``size`` for streamed responses, whose content is never loaded.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
+    fields: dict[str, Any] = {
+        "event": "response",
+        "method": method,
+        "url": url,
+        "elapsed": elapsed,
+    }
+    if response is not None:
+        fields["status_code"] = response.status_code
+        fields["bytes"] = len(response.content) if size is None else size
+        logger.debug(
+            "Response: %s %s -> %d (%d bytes, %.3fs)",
+            method,
+            url,
+            response.status_code,
+            fields["bytes"],
+            elapsed,
+            extra={"goldsberry": fields},
+        )
+    else:
+        fields["error"] = type(error).__name__
+        logger.debug(
+            "Response: %s %s -> %s after %.3fs",
+            method,
+            url,
+            fields["error"],
+            elapsed,
+            extra={"goldsberry": fields},
+        )
+
+
+__all__ = ["log_debug", "log_request", "log_response"]
@@ -0,0 +1,316 @@
+"""Request lifecycle metrics for BaseClient.
+
+ClientMetrics collects counters and histograms per endpoint: attempts by
+status, retries, response bytes, cache hits, circuit breaker rejections,
+and time spent waiting for the rate limiter, connecting, waiting for the
+server, transferring and decoding. Breaker states are reported as
+gauges. Metrics can be read as a plain dict snapshot or rendered in the
+Prometheus text exposition format, with no server or extra dependency.
+
+Example:
+    >>> metrics = ClientMetrics()
+    >>> client = BaseClient(metrics=metrics)
+    >>> LeaguePlayerStatsEndpoint(client).fetch()
+    >>> metrics.snapshot()["histograms"]["request_duration_seconds"]
+    >>> print(metrics.to_prometheus())  # serve from your own /metrics handler
+"""
+
+import bisect
+import math
+import threading
+import time
+from collections.abc import Awaitable, Iterable
+from typing import Any, Callable, Optional
+
+from .breaker import BreakerState, CircuitBreakerRegistry
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+DEFAULT_SIZE_BUCKETS = (1e3, 1e4, 1e5, 1e6, 1e7)
+
+# name -> (type, help)
+METRICS: dict[str, tuple[str, str]] = {
+    "requests_total": ("counter", "HTTP attempts by endpoint and status code or error"),
+    "retries_total": ("counter", "Retries by endpoint and triggering error"),
+    "response_bytes_total": ("counter", "Response body bytes received"),
+    "cache_hits_total": ("counter", "Requests answered without the network, by cache kind"),
+    "breaker_rejections_total": ("counter", "Requests rejected by an open circuit breaker"),
+    "request_duration_seconds": ("histogram", "Time from sending a request to reading its body"),
+    "connect_duration_seconds": ("histogram", "Time to open a connection (TCP and TLS)"),
+    "server_duration_seconds": ("histogram", "Time from sending a request to its response headers"),
+    "rate_limit_wait_seconds": ("histogram", "Time spent waiting for the rate limiter"),
+    "decode_duration_seconds": ("histogram", "Time spent decoding JSON response bodies"),
+    "response_size_bytes": ("histogram", "Response body size"),
+    "circuit_breaker_state": ("gauge", "Circuit breaker state (0 closed, 1 half-open, 2 open)"),
+}
+
+BREAKER_STATE_VALUES = {BreakerState.CLOSED: 0, BreakerState.HALF_OPEN: 1, BreakerState.OPEN: 2}
+
+Labels = tuple[tuple[str, str], ...]
+Trace = Callable[[str, dict[str, Any]], None]
+AsyncTrace = Callable[[str, dict[str, Any]], Awaitable[None]]
+
+
+class Histogram:
+    """Cumulative histogram with fixed upper bounds (Prometheus style)."""
+
+    def __init__(self, buckets: Iterable[float]) -> None:
+        """Initialize histogram.
+
+        Args:
+            buckets: Upper bounds, in increasing order (+Inf is implicit)
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Add a sample."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """(upper bound, samples <= bound) pairs, ending with +Inf."""
+        total = 0
+        result = []
+        for bound, count in zip((*self.buckets, math.inf), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+def _format_bound(bound: float) -> str:
+    """Render a bucket bound the way Prometheus does."""
+    return "+Inf" if math.isinf(bound) else f"{bound:g}"
+
+
+def _format_labels(labels: Labels, extra: Optional[tuple[str, str]] = None) -> str:
+    """Render labels as {name="value",...}."""
+    pairs = [*labels, extra] if extra else list(labels)
+    if not pairs:
+        return ""
+    rendered = ",".join(
+        f'{name}="{value.replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for name, value in pairs
+    )
+    return "{" + rendered + "}"
+
+
+class ClientMetrics:
+    """Thread-safe counters and histograms describing client requests."""
+
+    def __init__(
+        self,
+        latency_buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+        size_buckets: Iterable[float] = DEFAULT_SIZE_BUCKETS,
+        namespace: str = "goldsberry",
+    ) -> None:
+        """Initialize metrics.
+
+        Args:
+            latency_buckets: Histogram bounds (seconds) for durations
+            size_buckets: Histogram bounds (bytes) for response sizes
+            namespace: Prefix for Prometheus metric names
+        """
+        self.latency_buckets = tuple(latency_buckets)
+        self.size_buckets = tuple(size_buckets)
+        self.namespace = namespace
+        self._counters: dict[str, dict[Labels, float]] = {}
+        self._histograms: dict[str, dict[Labels, Histogram]] = {}
+        self._breakers: list[CircuitBreakerRegistry] = []
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        """Increase a counter."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Add a sample to a histogram."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                buckets = self.size_buckets if name.endswith("_bytes") else self.latency_buckets
+                histogram = series[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def track_breakers(self, registry: CircuitBreakerRegistry) -> None:
+        """Report the states of a breaker registry's breakers as gauges."""
+        if registry not in self._breakers:
+            self._breakers.append(registry)
+
+    def reset(self) -> None:
+        """Drop all recorded samples."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    # Lifecycle events recorded by BaseClient
+
+    def record_attempt(self, endpoint: str, status: str, seconds: float, size: int = 0) -> None:
+        """Record one HTTP attempt (status code, or error class on failure)."""
+        self.inc("requests_total", endpoint=endpoint, status=status)
+        self.observe("request_duration_seconds", seconds, endpoint=endpoint)
+        if size:
+            self.inc("response_bytes_total", size, endpoint=endpoint)
+            self.observe("response_size_bytes", size, endpoint=endpoint)
+
+    def record_retry(self, endpoint: str, error: Exception) -> None:
+        """Record a retry and the error that triggered it."""
+        self.inc("retries_total", endpoint=endpoint, error=type(error).__name__)
+
+    def record_rate_limit_wait(self, endpoint: str, seconds: float) -> None:
+        """Record time spent waiting for the rate limiter."""
+        self.observe("rate_limit_wait_seconds", seconds, endpoint=endpoint)
+
+    def record_decode(self, endpoint: str, seconds: float) -> None:
+        """Record time spent decoding a response body."""
+        self.observe("decode_duration_seconds", seconds, endpoint=endpoint)
+
+    def record_cache_hit(self, endpoint: str, kind: str) -> None:
+        """Record a request answered from a cache (fresh, negative or stale)."""
+        self.inc("cache_hits_total", endpoint=endpoint, kind=kind)
+
+    def record_breaker_rejection(self, endpoint: str) -> None:
+        """Record a request rejected by an open circuit breaker."""
+        self.inc("breaker_rejections_total", endpoint=endpoint)
+
+    def record_trace(self, endpoint: str, events: dict[str, float]) -> None:
+        """Record connect and server time from httpcore trace event times."""
+        connect_start = events.get("connection.connect_tcp.started")
+        connect_end = events.get("connection.start_tls.complete") or events.get(
+            "connection.connect_tcp.complete"
+        )
+        if connect_start is not None and connect_end is not None:
+            self.observe("connect_duration_seconds", connect_end - connect_start, endpoint=endpoint)
+
+        for protocol in ("http11", "http2"):
+            sent = events.get(f"{protocol}.send_request_headers.started")
+            received = events.get(f"{protocol}.receive_response_headers.complete")
+            if sent is not None and received is not None:
+                self.observe("server_duration_seconds", received - sent, endpoint=endpoint)
+
+    # Output
+
+    def _gauges(self) -> dict[str, dict[Labels, float]]:
+        """Current gauge values."""
+        states: dict[Labels, float] = {}
+        for registry in self._breakers:
+            for name, state in registry.states().items():
+                states[(("breaker", name),)] = BREAKER_STATE_VALUES[state]
+        return {"circuit_breaker_state": states} if states else {}
+
+    def snapshot(self) -> dict[str, Any]:
+        """All metrics as plain data.
+
+        Returns:
+            ``{"counters": {name: [{"labels", "value"}]}, "histograms":
+            {name: [{"labels", "count", "sum", "buckets"}]}, "gauges": {...}}``
+            where ``buckets`` maps each upper bound to its cumulative count
+        """
+        with self._lock:
+            counters = {
+                name: [{"labels": dict(labels), "value": value} for labels, value in series.items()]
+                for name, series in self._counters.items()
+            }
+            histograms = {
+                name: [
+                    {
+                        "labels": dict(labels),
+                        "count": histogram.count,
+                        "sum": histogram.sum,
+                        "buckets": {
+                            _format_bound(bound): count for bound, count in histogram.cumulative()
+                        },
+                    }
+                    for labels, histogram in series.items()
+                ]
+                for name, series in self._histograms.items()
+            }
+        gauges = {
+            name: [{"labels": dict(labels), "value": value} for labels, value in series.items()]
+            for name, series in self._gauges().items()
+        }
+        return {"counters": counters, "histograms": histograms, "gauges": gauges}
+
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+
+        def header(name: str) -> str:
+            full = f"{self.namespace}_{name}" if self.namespace else name
+            kind, help_text = METRICS.get(name, ("untyped", name))
+            lines.append(f"# HELP {full} {help_text}")
+            lines.append(f"# TYPE {full} {kind}")
+            return full
+
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                full = header(name)
+                for labels, value in sorted(series.items()):
+                    lines.append(f"{full}{_format_labels(labels)} {value:g}")
+
+            for name, hist_series in sorted(self._histograms.items()):
+                full = header(name)
+                for labels, histogram in sorted(hist_series.items()):
+                    for bound, count in histogram.cumulative():
+                        bucket_labels = _format_labels(labels, ("le", _format_bound(bound)))
+                        lines.append(f"{full}_bucket{bucket_labels} {count}")
+                    lines.append(f"{full}_sum{_format_labels(labels)} {histogram.sum:g}")
+                    lines.append(f"{full}_count{_format_labels(labels)} {histogram.count}")
+
+        for name, gauge_series in sorted(self._gauges().items()):
+            full = header(name)
+            for labels, value in sorted(gauge_series.items()):
+                lines.append(f"{full}{_format_labels(labels)} {value:g}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def trace_events() -> tuple[dict[str, float], Trace]:
+    """Event-time dict and sync httpcore ``trace`` extension filling it."""
+    events: dict[str, float] = {}
+
+    def trace(name: str, _info: dict[str, Any]) -> None:
+        events[name] = time.monotonic()
+
+    return events, trace
+
+
+def async_trace_events() -> tuple[dict[str, float], AsyncTrace]:
+    """Event-time dict and async httpcore ``trace`` extension filling it."""
+    events: dict[str, float] = {}
+
+    async def trace(name: str, _info: dict[str, Any]) -> None:
+        events[name] = time.monotonic()
+
+    return events, trace
+
+
+__all__ = [
+    "DEFAULT_LATENCY_BUCKETS",
+    "DEFAULT_SIZE_BUCKETS",
+    "ClientMetrics",
+    "Histogram",
+    "async_trace_events",
+    "trace_events",
+]
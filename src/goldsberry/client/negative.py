@@ -0,0 +1,98 @@
+"""Negative caching of requests that found nothing.
+
+Sweeps over game or player IDs probe many IDs that return 404
+(NotFoundError) or responses whose result sets have no rows. A
+NegativeCache remembers those outcomes for a short TTL, in a bounded
+in-memory LRU, so repeated probes are answered locally and do not spend
+rate-limit budget.
+
+Example:
+    >>> client = BaseClient(negative_cache=NegativeCache(ttl=600))
+    >>> for game_id in candidate_ids:
+    ...     try:
+    ...         client.get("boxscoretraditionalv2", {"GameID": game_id})
+    ...     except NotFoundError:
+    ...         continue  # second run: raised without a request
+"""
+
+from typing import Any, Optional
+
+from .cache import MemoryCache
+from .exceptions import NotFoundError
+
+# Body stored for 404s (never a valid JSON payload)
+_NOT_FOUND = b""
+
+
+def is_empty_result(data: Any) -> bool:
+    """Whether a decoded response has result sets but no rows in any of them.
+
+    Args:
+        data: Decoded JSON response
+
+    Returns:
+        True if every result set's rowSet is empty
+    """
+    if not isinstance(data, dict):
+        return False
+
+    result_sets = data.get("resultSets", data.get("resultSet"))
+    if isinstance(result_sets, dict):
+        result_sets = [result_sets]
+    if not isinstance(result_sets, list) or not result_sets:
+        return False
+    return all(
+        isinstance(result_set, dict) and not result_set.get("rowSet") for result_set in result_sets
+    )
+
+
+class NegativeCache:
+    """Short-lived, bounded cache of 404s and empty responses."""
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 10_000) -> None:
+        """Initialize negative cache.
+
+        Args:
+            ttl: Seconds to remember a negative result
+            max_entries: Maximum number of remembered requests (LRU eviction)
+
+        Raises:
+            ValueError: If ttl or max_entries is not positive
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.ttl = ttl
+        self._entries = MemoryCache(max_entries=max_entries)
+
+    def __len__(self) -> int:
+        """Number of remembered requests."""
+        return len(self._entries)
+
+    def lookup(self, key: str) -> Optional[bytes]:
+        """Return the remembered empty response body for key, if any.
+
+        Raises:
+            NotFoundError: If key is remembered as a 404
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.body == _NOT_FOUND:
+            raise NotFoundError(f"Not found (cached {entry.age:.0f}s ago): {key}", cached=True)
+        return entry.body
+
+    def record_not_found(self, key: str) -> None:
+        """Remember that a request returned 404."""
+        self._entries.set(key, _NOT_FOUND, ttl=self.ttl)
+
+    def record_empty(self, key: str, body: bytes) -> None:
+        """Remember a response whose result sets have no rows."""
+        self._entries.set(key, body, ttl=self.ttl)
+
+    def clear(self) -> None:
+        """Forget all negative results."""
+        self._entries.clear()
+
+
+__all__ = ["NegativeCache", "is_empty_result"]
@@ -0,0 +1,178 @@
+"""Per-stage timing of endpoint fetches.
+
+A FetchStats record breaks one fetch down into the stages of the pipeline:
+rate limiter wait, network, JSON decoding and validation/model building,
+plus the row count and response bytes. Stats are collected for whatever
+runs inside ``collect_stats()``; BaseClient and the endpoint classes
+record into the active collector and skip the bookkeeping when there is
+none.
+
+Example:
+    >>> endpoint = LeaguePlayerStatsEndpoint(client)
+    >>> stats_table, stats = fetch_with_stats(endpoint.fetch, season="2024-25")
+    >>> stats.network, stats.decode, stats.validate, stats.rows
+    (3.41, 0.12, 0.38, 512)
+
+    >>> with collect_stats() as stats:
+    ...     games = await GameLogsEndpoint(client).fetch_async(player_id=203999)
+"""
+
+import time
+from collections.abc import Awaitable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_current: ContextVar[Optional["FetchStats"]] = ContextVar("goldsberry_fetch_stats", default=None)
+
+
+@dataclass
+class FetchStats:
+    """Where the time of a fetch went.
+
+    Attributes:
+        endpoint: API endpoint (the last one requested)
+        source: Where the payload came from: "network", a cache ("fresh",
+            "negative", "stale"), or "coalesced" (shared with an identical
+            in-flight request)
+        attempts: HTTP attempts made (retries and hedges included)
+        limiter_wait: Seconds spent waiting for the rate limiter
+        network: Seconds spent on HTTP attempts
+        decode: Seconds spent decoding JSON
+        validate: Seconds spent validating rows and building models
+        rows: Rows in the payload's result sets
+        bytes: Response body bytes received
+        total: Wall-clock seconds for the whole fetch
+    """
+
+    endpoint: str = ""
+    source: Optional[str] = None
+    attempts: int = 0
+    limiter_wait: float = 0.0
+    network: float = 0.0
+    decode: float = 0.0
+    validate: float = 0.0
+    rows: int = 0
+    bytes: int = 0
+    total: float = 0.0
+
+    @property
+    def other(self) -> float:
+        """Seconds not attributed to a stage (retry backoff, hooks, overhead)."""
+        return max(0.0, self.total - self.limiter_wait - self.network - self.decode - self.validate)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Stats as a plain dict (e.g. for structured logs)."""
+        return {**asdict(self), "other": self.other}
+
+
+def current_stats() -> Optional[FetchStats]:
+    """The active collector, or None when stats are not being collected."""
+    return _current.get()
+
+
+def detach_stats() -> None:
+    """Stop recording into the active collector from the current context.
+
+    Background work started during a fetch (e.g. a stale-while-revalidate
+    refresh task) copies the caller's context and would otherwise count
+    toward the caller's stats.
+    """
+    _current.set(None)
+
+
+@contextmanager
+def collect_stats() -> Iterator[FetchStats]:
+    """Collect FetchStats for the fetches made inside the block.
+
+    Yields:
+        The FetchStats being filled (``total`` is set when the block exits)
+    """
+    stats = FetchStats()
+    token = _current.set(stats)
+    start = time.monotonic()
+    try:
+        yield stats
+    finally:
+        stats.total = time.monotonic() - start
+        if stats.source is None and stats.endpoint:
+            stats.source = "coalesced"
+        _current.reset(token)
+
+
+def count_rows(data: dict[str, Any]) -> int:
+    """Rows in a payload's ``resultSets`` (or single ``resultSet``)."""
+    result_sets = data.get("resultSets")
+    if result_sets is None:
+        result_sets = data.get("resultSet")
+    if isinstance(result_sets, dict):
+        result_sets = [result_sets]
+    if not isinstance(result_sets, list):
+        return 0
+    return sum(
+        len(result_set.get("rowSet") or ())
+        for result_set in result_sets
+        if isinstance(result_set, dict)
+    )
+
+
+def timed_parse(parse: Callable[..., T], data: dict[str, Any], *args: Any) -> T:
+    """Run an endpoint parser, recording its time and row count if collecting."""
+    stats = _current.get()
+    if stats is None:
+        return parse(data, *args)
+
+    start = time.monotonic()
+    result = parse(data, *args)
+    stats.validate += time.monotonic() - start
+    stats.rows += count_rows(data)
+    return result
+
+
+def fetch_with_stats(fetch: Callable[..., T], *args: Any, **kwargs: Any) -> tuple[T, FetchStats]:
+    """Call an endpoint's fetch and return its result alongside FetchStats.
+
+    Args:
+        fetch: Bound fetch method (e.g. ``endpoint.fetch``)
+        *args: Positional arguments for fetch
+        **kwargs: Keyword arguments for fetch
+
+    Returns:
+        (result, stats)
+    """
+    with collect_stats() as stats:
+        result = fetch(*args, **kwargs)
+    return result, stats
+
+
+async def fetch_with_stats_async(
+    fetch: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+) -> tuple[T, FetchStats]:
+    """Await an endpoint's fetch_async and return its result alongside FetchStats.
+
+    Args:
+        fetch: Bound async fetch method (e.g. ``endpoint.fetch_async``)
+        *args: Positional arguments for fetch
+        **kwargs: Keyword arguments for fetch
+
+    Returns:
+        (result, stats)
+    """
+    with collect_stats() as stats:
+        result = await fetch(*args, **kwargs)
+    return result, stats
+
+
+__all__ = [
+    "FetchStats",
+    "collect_stats",
+    "count_rows",
+    "current_stats",
+    "detach_stats",
+    "fetch_with_stats",
+    "fetch_with_stats_async",
+    "timed_parse",
+]
@@ -0,0 +1,576 @@
+"""Token bucket rate limiting for NBA API requests.
+
+Buckets run on a monotonic clock and hand out reservations under a lock:
+each caller takes a token immediately (possibly going into debt) and is
+told how long to wait before using it. Because reservations are made in
+arrival order, waiters are served first-in first-out, and sync and async
+callers draw from the same budget.
+
+Example:
+    >>> # 0.6s average spacing, but allow bursts of 5 requests
+    >>> limiter = RateLimiter(min_interval=0.6, burst=5)
+    >>>
+    >>> # Give a slow endpoint its own, tighter budget on top of the global one
+    >>> limiter = RateLimiter(
+    ...     min_interval=0.6,
+    ...     burst=5,
+    ...     endpoint_limits={"shotchartdetail": (0.5, 1)},
+    ... )
+    >>> client = BaseClient(rate_limiter=limiter)
+    >>>
+    >>> # One budget for every thread and worker process on this machine
+    >>> limiter = RateLimiter(min_interval=0.6, shared_path="/tmp/goldsberry.rate")
+    >>>
+    >>> # Probe upwards while the API is healthy, back off hard when it struggles
+    >>> limiter = AdaptiveRateLimiter(min_interval=0.6, max_rate=5.0)
+    >>> limiter.current_rate
+    1.6666666666666667
+"""
+
+import asyncio
+import logging
+import math
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+from .exceptions import ConfigurationError, RateLimitError, ServerError
+from .exceptions import TimeoutError as NBATimeoutError
+
+logger = logging.getLogger(__name__)
+
+
+def _book(available: float, tokens: float, delay: float, rate: float, capacity: float) -> float:
+    """Tokens left now after taking ``tokens`` for use ``delay`` seconds from now.
+
+    The bucket is projected forward by ``delay`` (capped at capacity), the
+    tokens are taken there, and the result is moved back to the present so
+    that refilling reaches the booked level again at that time.
+    """
+    if delay <= 0:
+        return min(capacity, available - tokens)
+    return min(capacity, available + delay * rate) - tokens - delay * rate
+
+
+class TokenBucket:
+    """Thread-safe token bucket on a monotonic clock.
+
+    Holds up to ``capacity`` tokens and refills at ``rate`` tokens per
+    second. Reservations that find the bucket empty push it into debt, so
+    later callers queue up behind earlier ones.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second (math.inf for no limit)
+            capacity: Maximum tokens, i.e. the largest burst allowed
+            clock: Monotonic time source
+
+        Raises:
+            ValueError: If rate or capacity is not positive
+        """
+        if rate <= 0:
+            raise ValueError("Bucket rate must be positive")
+        if capacity < 1:
+            raise ValueError("Bucket capacity must be at least 1")
+
+        self._rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second."""
+        return self._rate
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available (negative while callers are queued)."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last update (lock held)."""
+        now = self._clock()
+        elapsed = now - self._updated
+        self._updated = now
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self._rate)
+
+    def reserve(self, tokens: float = 1.0, delay: float = 0.0) -> float:
+        """Take tokens and return how long to wait before using them.
+
+        Args:
+            tokens: Number of tokens to take
+            delay: Seconds from now before which the tokens will not be
+                used; they are booked for that time (refill the bucket
+                could not hold by then is lost), so later callers queue
+                behind it
+
+        Returns:
+            Seconds to wait (at least ``delay``)
+        """
+        if math.isinf(self._rate):
+            return delay
+
+        with self._lock:
+            self._refill()
+            self._tokens = _book(self._tokens, tokens, delay, self._rate, self.capacity)
+            return max(delay, -self._tokens / self._rate)
+
+    def try_reserve(self, tokens: float = 1.0) -> bool:
+        """Take tokens only if they are available right now.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            True if the tokens were taken (the caller may proceed immediately)
+        """
+        if math.isinf(self._rate):
+            return True
+
+        with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+            return True
+
+    def refund(self, tokens: float = 1.0) -> None:
+        """Return unused tokens to the bucket."""
+        if math.isinf(self._rate):
+            return
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate, keeping tokens accrued at the old rate.
+
+        Args:
+            rate: New tokens per second
+
+        Raises:
+            ValueError: If rate is not positive
+        """
+        if rate <= 0:
+            raise ValueError("Bucket rate must be positive")
+        with self._lock:
+            self._refill()
+            self._rate = rate
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket whose state lives in a file shared between processes.
+
+    Every reservation locks the file (``fcntl.flock``), reads the bucket
+    state, updates it and writes it back, so any number of threads and
+    worker processes on one machine draw from a single budget. The state is
+    timed with the system-wide monotonic clock; every process must use the
+    same rate and capacity for a given file.
+
+    Only available on POSIX systems.
+    """
+
+    _STATE = struct.Struct("<dd")  # tokens, last update (monotonic seconds)
+
+    def __init__(self, path: Union[str, Path], rate: float, capacity: float = 1.0) -> None:
+        """Initialize a bucket backed by path (created if missing).
+
+        Args:
+            path: State file shared by all participating processes
+            rate: Tokens added per second
+            capacity: Maximum tokens (largest burst)
+
+        Raises:
+            ConfigurationError: If file locking is not supported on this platform
+        """
+        if fcntl is None:
+            raise ConfigurationError("Shared rate limiting requires fcntl (POSIX only)")
+        super().__init__(rate=rate, capacity=capacity)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch(exist_ok=True)
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available across all processes."""
+        return self._update(0.0)
+
+    def reserve(self, tokens: float = 1.0, delay: float = 0.0) -> float:
+        """Take tokens from the shared budget and return the wait time."""
+        if math.isinf(self._rate):
+            return delay
+
+        remaining = self._update(tokens, delay=delay)
+        return max(delay, -remaining / self._rate)
+
+    def try_reserve(self, tokens: float = 1.0) -> bool:
+        """Take tokens from the shared budget only if available right now."""
+        if math.isinf(self._rate):
+            return True
+        return self._update(tokens, only_if_available=True) >= 0
+
+    def refund(self, tokens: float = 1.0) -> None:
+        """Return unused tokens to the shared budget."""
+        if not math.isinf(self._rate):
+            self._update(-tokens)
+
+    def _update(
+        self, tokens: float, only_if_available: bool = False, delay: float = 0.0
+    ) -> float:
+        """Refill, take tokens and persist the state under the file lock.
+
+        Args:
+            tokens: Tokens to take (negative to return tokens)
+            only_if_available: Leave the state unchanged if fewer than
+                ``tokens`` are available
+            delay: Seconds from now the tokens are booked for (see
+                TokenBucket.reserve)
+
+        Returns:
+            Tokens left after the reservation (negative if it was refused
+            or the caller must wait)
+        """
+        with self._lock, self.path.open("r+b") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                now = self._clock()
+                raw = f.read(self._STATE.size)
+                stored: float
+                updated: float
+                if len(raw) == self._STATE.size:
+                    stored, updated = self._STATE.unpack(raw)
+                    if updated > now:
+                        # Clock reset (e.g. reboot): start from a full bucket
+                        stored, updated = self.capacity, now
+                else:
+                    stored, updated = self.capacity, now
+
+                stored = min(self.capacity, stored + (now - updated) * self._rate)
+                if only_if_available and stored < tokens:
+                    return stored - tokens
+                stored = _book(stored, tokens, delay, self._rate, self.capacity)
+                f.seek(0)
+                f.write(self._STATE.pack(stored, now))
+                f.flush()
+                return stored
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class RateLimiter:
+    """Rate limiter shared by a client's sync and async request paths.
+
+    Every request takes a token from the global bucket and, when the
+    endpoint has its own limit, from that endpoint's bucket as well. A
+    client talks to a single host, so the global bucket is the per-host
+    budget; pass the same RateLimiter to several clients to share it, or
+    set ``shared_path`` to share it with other processes.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 0.6,
+        burst: int = 1,
+        endpoint_limits: Optional[dict[str, tuple[float, int]]] = None,
+        shared_path: Optional[Union[str, Path]] = None,
+    ) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            min_interval: Average seconds between requests (default 0.6s, 0 disables)
+            burst: Requests allowed back-to-back before spacing applies
+            endpoint_limits: Per-endpoint ``(min_interval, burst)`` budgets,
+                applied in addition to the global one
+            shared_path: State file for a budget shared by every process using
+                the same path (endpoint budgets use ``<path>.<endpoint>``)
+        """
+        self.shared_path = Path(shared_path) if shared_path is not None else None
+        self.bucket = self._make_bucket(min_interval, burst)
+        self.endpoint_buckets = {
+            endpoint: self._make_bucket(interval, endpoint_burst, endpoint)
+            for endpoint, (interval, endpoint_burst) in (endpoint_limits or {}).items()
+        }
+
+    def _make_bucket(
+        self, min_interval: float, burst: int, endpoint: Optional[str] = None
+    ) -> TokenBucket:
+        """Build a (possibly file-backed) bucket from interval/burst settings."""
+        rate = 1.0 / min_interval if min_interval > 0 else math.inf
+        if self.shared_path is None or math.isinf(rate):
+            return TokenBucket(rate=rate, capacity=burst)
+
+        path = self.shared_path
+        if endpoint is not None:
+            path = path.with_name(f"{path.name}.{endpoint}")
+        return FileTokenBucket(path, rate=rate, capacity=burst)
+
+    @property
+    def min_interval(self) -> float:
+        """Average seconds between requests under the global budget."""
+        return 1.0 / self.bucket.rate
+
+    def _endpoint_bucket(self, endpoint: Optional[str]) -> Optional[TokenBucket]:
+        """The endpoint's own bucket, if it has one."""
+        return self.endpoint_buckets.get(endpoint) if endpoint else None
+
+    def reserve(self, endpoint: Optional[str] = None) -> float:
+        """Reserve a request slot without waiting.
+
+        The endpoint bucket is reserved first and the global token is booked
+        for the time the endpoint allows, so a request held back by its
+        endpoint never shares a global slot with later requests. acquire()
+        and acquire_sync() instead wait for the endpoint before taking a
+        global token, leaving the global slots in between to other requests.
+
+        Args:
+            endpoint: Endpoint being requested (selects its bucket, if any)
+
+        Returns:
+            Seconds the caller must wait before sending
+        """
+        endpoint_bucket = self._endpoint_bucket(endpoint)
+        delay = endpoint_bucket.reserve() if endpoint_bucket is not None else 0.0
+        return self.bucket.reserve(delay=delay)
+
+    def try_acquire(self, endpoint: Optional[str] = None) -> bool:
+        """Take a request slot only if one is available without waiting.
+
+        Args:
+            endpoint: Endpoint being requested (selects its bucket, if any)
+
+        Returns:
+            True if the caller may send a request immediately
+        """
+        if not self.bucket.try_reserve():
+            return False
+        endpoint_bucket = self._endpoint_bucket(endpoint)
+        if endpoint_bucket is not None and not endpoint_bucket.try_reserve():
+            self.bucket.refund()
+            return False
+        return True
+
+    def _buckets(self, endpoint: Optional[str]) -> list[TokenBucket]:
+        """Buckets a request takes a token from, in the order they are waited for."""
+        endpoint_bucket = self._endpoint_bucket(endpoint)
+        if endpoint_bucket is None:
+            return [self.bucket]
+        return [endpoint_bucket, self.bucket]
+
+    async def acquire(self, endpoint: Optional[str] = None) -> float:
+        """Wait if necessary to respect rate limit (async).
+
+        The endpoint's slot is waited for before the global token is taken,
+        so the global token is booked for when the request is really sent.
+        Tokens are given back if the wait is cancelled.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        taken: list[TokenBucket] = []
+        try:
+            for bucket in self._buckets(endpoint):
+                wait_time = bucket.reserve()
+                taken.append(bucket)
+                if wait_time > 0:
+                    logger.debug("Rate limiting: waiting %.2fs", wait_time)
+                    await asyncio.sleep(wait_time)
+                    waited += wait_time
+        except BaseException:
+            for bucket in taken:
+                bucket.refund()
+            raise
+        return waited
+
+    def acquire_sync(self, endpoint: Optional[str] = None) -> float:
+        """Wait if necessary to respect rate limit (sync).
+
+        Waits like acquire(): endpoint slot first, then the global token.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        taken: list[TokenBucket] = []
+        try:
+            for bucket in self._buckets(endpoint):
+                wait_time = bucket.reserve()
+                taken.append(bucket)
+                if wait_time > 0:
+                    logger.debug("Rate limiting: waiting %.2fs", wait_time)
+                    time.sleep(wait_time)
+                    waited += wait_time
+        except BaseException:
+            for bucket in taken:
+                bucket.refund()
+            raise
+        return waited
+
+    def record(self, latency: float, error: Optional[Exception] = None) -> None:
+        """Report the outcome of a request (no-op; used by adaptive limiters).
+
+        Args:
+            latency: Seconds from sending the request to the response or failure
+            error: Exception the request failed with, if any
+        """
+
+
+def is_congestion_error(error: Optional[Exception]) -> bool:
+    """Whether an error signals that the API is overloaded or throttling us."""
+    return isinstance(error, (NBATimeoutError, ServerError, RateLimitError))
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """Rate limiter that adapts its global rate with AIMD.
+
+    Additive increase, multiplicative decrease: after every
+    ``increase_after`` consecutive healthy responses the rate grows by
+    ``increase_step`` requests/second (up to ``max_rate``); a timeout, 5xx
+    or 429 multiplies it by ``decrease_factor`` (down to ``min_rate``).
+    Responses slower than ``latency_threshold`` and other errors (404s,
+    connection resets, bad payloads) hold the rate steady; only successful
+    responses count towards an increase. Decreases are spaced at least
+    ``decrease_cooldown`` seconds apart so a burst of failures from
+    requests already in flight counts once.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 0.6,
+        burst: int = 1,
+        endpoint_limits: Optional[dict[str, tuple[float, int]]] = None,
+        shared_path: Optional[Union[str, Path]] = None,
+        min_rate: float = 0.2,
+        max_rate: float = 5.0,
+        increase_step: float = 0.1,
+        increase_after: int = 10,
+        decrease_factor: float = 0.5,
+        latency_threshold: Optional[float] = 5.0,
+        decrease_cooldown: float = 2.0,
+    ) -> None:
+        """Initialize adaptive limiter.
+
+        Args:
+            min_interval: Starting average seconds between requests
+            burst: Requests allowed back-to-back before spacing applies
+            endpoint_limits: Fixed per-endpoint ``(min_interval, burst)`` budgets
+            shared_path: Not supported: the adapted rate is per-process, while a
+                shared file needs the same rate in every process
+            min_rate: Lowest rate (requests/second) the limiter backs off to
+            max_rate: Highest rate (requests/second) the limiter probes up to
+            increase_step: Requests/second added after a healthy streak
+            increase_after: Healthy responses needed before each increase
+            decrease_factor: Multiplier applied to the rate on congestion
+            latency_threshold: Seconds above which a response counts as slow
+                (None to ignore latency)
+            decrease_cooldown: Minimum seconds between two decreases
+
+        Raises:
+            ConfigurationError: If the settings are inconsistent
+        """
+        if min_interval <= 0:
+            raise ConfigurationError("Adaptive rate limiting needs a positive min_interval")
+        if not 0 < min_rate <= max_rate:
+            raise ConfigurationError("Rates must satisfy 0 < min_rate <= max_rate")
+        if not 0 < decrease_factor < 1:
+            raise ConfigurationError("decrease_factor must be between 0 and 1")
+        if increase_step <= 0 or increase_after < 1:
+            raise ConfigurationError("Increase step and streak length must be positive")
+        if shared_path is not None:
+            raise ConfigurationError(
+                "Adaptive rate limiting cannot use shared_path: each process adapts its "
+                "own rate, but a shared budget needs the same rate in every process"
+            )
+
+        super().__init__(
+            min_interval=min_interval,
+            burst=burst,
+            endpoint_limits=endpoint_limits,
+            shared_path=shared_path,
+        )
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.increase_after = increase_after
+        self.decrease_factor = decrease_factor
+        self.latency_threshold = latency_threshold
+        self.decrease_cooldown = decrease_cooldown
+
+        self._healthy_streak = 0
+        self._last_decrease = -math.inf
+        self._feedback_lock = threading.Lock()
+        self.bucket.set_rate(min(max(self.bucket.rate, min_rate), max_rate))
+
+    @property
+    def current_rate(self) -> float:
+        """Current global rate in requests per second."""
+        return self.bucket.rate
+
+    def record(self, latency: float, error: Optional[Exception] = None) -> None:
+        """Adjust the rate based on a request outcome.
+
+        Args:
+            latency: Seconds from sending the request to the response or failure
+            error: Exception the request failed with, if any
+        """
+        with self._feedback_lock:
+            if is_congestion_error(error):
+                self._healthy_streak = 0
+                now = time.monotonic()
+                if now - self._last_decrease < self.decrease_cooldown:
+                    return
+                self._last_decrease = now
+                new_rate = max(self.min_rate, self.bucket.rate * self.decrease_factor)
+                logger.warning(
+                    "Adaptive rate limit: %s, decreasing to %.2f req/s",
+                    type(error).__name__,
+                    new_rate,
+                )
+                self.bucket.set_rate(new_rate)
+                return
+
+            if error is not None:
+                # Failed, but not from congestion (e.g. a 404): not a healthy response
+                self._healthy_streak = 0
+                return
+
+            if self.latency_threshold is not None and latency > self.latency_threshold:
+                self._healthy_streak = 0
+                return
+
+            self._healthy_streak += 1
+            if self._healthy_streak >= self.increase_after:
+                self._healthy_streak = 0
+                new_rate = min(self.max_rate, self.bucket.rate + self.increase_step)
+                if new_rate != self.bucket.rate:
+                    logger.debug("Adaptive rate limit: increasing to %.2f req/s", new_rate)
+                    self.bucket.set_rate(new_rate)
+
+
+__all__ = [
+    "TokenBucket",
+    "FileTokenBucket",
+    "RateLimiter",
+    "AdaptiveRateLimiter",
+    "is_congestion_error",
+]
@@ -0,0 +1,258 @@
+"""Retry policy shared by the sync and async request paths.
+
+Provides jittered exponential backoff, honours ``Retry-After`` from the
+server, and enforces a retry budget so that retries can never add more
+than a fixed fraction of extra load during an outage.
+
+Example:
+    >>> from goldsberry.client.retry import RetryBudget, RetryPolicy
+    >>>
+    >>> # Up to 5 retries, but never more than 10% extra traffic
+    >>> policy = RetryPolicy(max_retries=5, budget=RetryBudget(ratio=0.1))
+    >>> client = BaseClient(retry_policy=policy)
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections.abc import Awaitable
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional, TypeVar
+
+from .exceptions import NBAAPIError, NetworkError, RateLimitError, ServerError
+
+T = TypeVar("T")
+
+# Called before sleeping with (attempt, delay, error)
+RetryCallback = Callable[[int, float, NBAAPIError], None]
+AsyncRetryCallback = Callable[[int, float, NBAAPIError], Awaitable[None]]
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date).
+
+    Args:
+        value: Raw header value
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryBudget:
+    """Limit retries to a fraction of overall request volume.
+
+    Each request deposits ``ratio`` tokens (up to ``max_tokens``); each
+    retry spends one. When the budget is empty, failures are raised
+    immediately instead of retried, so a fleet of workers cannot multiply
+    its load on an API that is already struggling. Share one budget
+    between clients to enforce it globally.
+    """
+
+    def __init__(
+        self, ratio: float = 0.2, initial_tokens: float = 10.0, max_tokens: float = 100.0
+    ) -> None:
+        """Initialize retry budget.
+
+        Args:
+            ratio: Retries allowed per request (0.2 = 20% extra load)
+            initial_tokens: Retries available before any requests are made
+            max_tokens: Maximum retries that can be banked
+
+        Raises:
+            ValueError: If a setting is negative
+        """
+        if ratio < 0 or initial_tokens < 0 or max_tokens < 0:
+            raise ValueError("Retry budget settings cannot be negative")
+
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = min(initial_tokens, max_tokens)
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Retries currently available."""
+        return self._tokens
+
+    def record_request(self) -> None:
+        """Deposit tokens for a new (non-retry) request."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Take a token for one retry.
+
+        Returns:
+            True if the retry is allowed
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class RetryPolicy:
+    """Decide whether and when to retry a failed request.
+
+    Retries network errors (including timeouts), 5xx responses and 429
+    rate limiting. The delay before retry ``n`` is drawn uniformly from
+    ``[0, min(max_delay, base_delay * 2 ** (n - 1))]`` ("full jitter"),
+    which spreads retries from many workers apart instead of letting them
+    arrive together. A ``Retry-After`` sent by the server takes precedence.
+    """
+
+    RETRYABLE: tuple[type[NBAAPIError], ...] = (NetworkError, ServerError, RateLimitError)
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 10.0,
+        jitter: bool = True,
+        max_retry_after: float = 120.0,
+        budget: Optional[RetryBudget] = None,
+    ) -> None:
+        """Initialize retry policy.
+
+        Args:
+            max_retries: Retries after the first attempt (0 disables retrying)
+            base_delay: Backoff before the first retry, doubled for each retry
+            max_delay: Cap on the backoff delay
+            jitter: Randomize delays (full jitter) to avoid synchronized retries
+            max_retry_after: Longest Retry-After the policy will wait; longer
+                values make the error final
+            budget: Retry budget (a fresh RetryBudget if None)
+
+        Raises:
+            ValueError: If a setting is negative
+        """
+        if max_retries < 0:
+            raise ValueError("max_retries cannot be negative")
+        if base_delay < 0 or max_delay < 0:
+            raise ValueError("Retry delays cannot be negative")
+
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.max_retry_after = max_retry_after
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Whether an error is transient and worth retrying."""
+        return isinstance(error, self.RETRYABLE)
+
+    def backoff(self, retry: int) -> float:
+        """Backoff delay before the given retry (1-based)."""
+        delay = min(self.max_delay, self.base_delay * 2.0 ** (retry - 1))
+        if self.jitter:
+            return random.uniform(0, delay)  # noqa: S311 - not cryptographic
+        return delay
+
+    def record_request(self) -> None:
+        """Note a new top-level request (feeds the retry budget)."""
+        self.budget.record_request()
+
+    def next_delay(self, attempt: int, error: Exception) -> Optional[float]:
+        """Get the delay before retrying, or None if the error is final.
+
+        Args:
+            attempt: Number of attempts made so far (1 after the first failure)
+            error: Exception raised by the last attempt
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        if attempt > self.max_retries or not self.is_retryable(error):
+            return None
+
+        retry_after = error.context.get("retry_after") if isinstance(error, NBAAPIError) else None
+        if retry_after is not None and retry_after > self.max_retry_after:
+            return None
+
+        if not self.budget.try_spend():
+            return None
+
+        if retry_after is not None:
+            return float(retry_after)
+        return self.backoff(attempt)
+
+    def call_sync(self, send: Callable[[], T], on_retry: Optional[RetryCallback] = None) -> T:
+        """Call send() until it succeeds or the policy gives up.
+
+        Args:
+            send: Makes one attempt; raises NBAAPIError on failure
+            on_retry: Called with (attempt, delay, error) before each retry
+
+        Returns:
+            Result of the first successful attempt
+
+        Raises:
+            The last attempt's error once it is final
+        """
+        self.record_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return send()
+            except NBAAPIError as e:
+                delay = self.next_delay(attempt, e)
+                if delay is None:
+                    raise
+                if on_retry is not None:
+                    on_retry(attempt, delay, e)
+                time.sleep(delay)
+
+    async def call(
+        self, send: Callable[[], Awaitable[T]], on_retry: Optional[AsyncRetryCallback] = None
+    ) -> T:
+        """Await send() until it succeeds or the policy gives up (async).
+
+        Args:
+            send: Makes one attempt; raises NBAAPIError on failure
+            on_retry: Awaited with (attempt, delay, error) before each retry
+
+        Returns:
+            Result of the first successful attempt
+
+        Raises:
+            The last attempt's error once it is final
+        """
+        self.record_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await send()
+            except NBAAPIError as e:
+                delay = self.next_delay(attempt, e)
+                if delay is None:
+                    raise
+                if on_retry is not None:
+                    await on_retry(attempt, delay, e)
+                await asyncio.sleep(delay)
+
+
+__all__ = [
+    "AsyncRetryCallback",
+    "RetryBudget",
+    "RetryCallback",
+    "RetryPolicy",
+    "parse_retry_after",
+]
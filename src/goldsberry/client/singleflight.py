@@ -0,0 +1,132 @@
+"""Single-flight coalescing of identical in-flight requests.
+
+When several callers ask for the same resource at the same time, only the
+first one (the leader) runs the call; the others wait for it and receive the
+leader's result or exception. Keys are typically cache keys built by
+goldsberry.client.cache.make_cache_key.
+
+Example:
+    >>> flight = SingleFlight()
+    >>> flight.do("boxscoretraditionalv2?GameID=0022400001", fetch_boxscore)
+"""
+
+import asyncio
+import threading
+from collections.abc import Coroutine
+from typing import Any, Callable, Optional, TypeVar, cast
+
+T = TypeVar("T")
+
+
+class _Call:
+    """State of one in-flight sync call."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesce identical concurrent calls made from multiple threads."""
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+
+    def do(self, key: str, func: Callable[..., T], *args: Any) -> T:
+        """Run func(*args) unless a call with the same key is already running.
+
+        Args:
+            key: Identity of the call
+            func: Function to run
+            *args: Positional arguments for func
+
+        Returns:
+            Result of the (possibly shared) call
+
+        Raises:
+            Whatever the shared call raised
+        """
+        with self._lock:
+            shared = self._calls.get(key)
+            if shared is None:
+                call = self._calls[key] = _Call()
+
+        if shared is not None:
+            shared.done.wait()
+            if shared.error is not None:
+                raise shared.error
+            return cast("T", shared.result)
+
+        try:
+            result = func(*args)
+            call.result = result
+            return result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """Coalesce identical concurrent calls made from asyncio tasks.
+
+    The shared call runs as its own task, so a waiter being cancelled does
+    not cancel the request for the other waiters.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._tasks: dict[tuple[asyncio.AbstractEventLoop, str], "asyncio.Task[Any]"] = {}
+
+    async def do(
+        self, key: str, func: Callable[..., Coroutine[Any, Any, T]], *args: Any
+    ) -> T:
+        """Await func(*args) unless a call with the same key is already running.
+
+        Args:
+            key: Identity of the call
+            func: Coroutine function to run
+            *args: Positional arguments for func
+
+        Returns:
+            Result of the (possibly shared) call
+
+        Raises:
+            Whatever the shared call raised
+        """
+        loop = asyncio.get_running_loop()
+        task_key = (loop, key)
+        task = self._tasks.get(task_key)
+
+        if task is None:
+            task = loop.create_task(func(*args))
+            self._tasks[task_key] = task
+            task.add_done_callback(lambda t: self._finish(task_key, t))
+
+        return cast("T", await asyncio.shield(task))
+
+    def _finish(
+        self, task_key: tuple[asyncio.AbstractEventLoop, str], task: "asyncio.Task[Any]"
+    ) -> None:
+        """Forget a finished task and mark its exception as retrieved."""
+        if self._tasks.get(task_key) is task:
+            del self._tasks[task_key]
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._tasks)
+
+
+__all__ = ["SingleFlight", "AsyncSingleFlight"]
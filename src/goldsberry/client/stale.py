@@ -0,0 +1,94 @@
+"""Serving last-good responses when fresh data is slow or unavailable.
+
+BaseClient can keep the last successful payload for every request in a
+separate store, with no expiry, and fall back to it in two ways:
+
+- stale-while-revalidate: return the stored payload immediately and
+  refresh it in the background once it is older than the cache TTL (or
+  ``revalidate_after``), one refresh per request at a time
+- stale-if-error: return the stored payload when the upstream request
+  fails (timeouts, 5xx, 429, open circuit breaker)
+
+Payloads served this way are returned as StaleResponse, a dict that also
+records how old the payload is.
+
+Example:
+    >>> # Keep dashboards up during stats.nba.com brownouts
+    >>> policy = StalePolicy(while_revalidate=300, if_error=86400)
+    >>> client = BaseClient(cache=MemoryCache(), cache_ttl=60, stale=policy)
+    >>> data = client.get("leaguedashteamstats", {"Season": "2024-25"})
+    >>> if isinstance(data, StaleResponse):
+    ...     print(f"showing data from {data.age:.0f}s ago")
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from .cache import MemoryCache, ResponseCache
+from .exceptions import CircuitBreakerError, NetworkError, RateLimitError, ServerError
+
+
+class StaleResponse(dict[str, Any]):
+    """A last-good payload served in place of a fresh response.
+
+    Behaves exactly like the decoded JSON dict.
+
+    Attributes:
+        age: Seconds since the payload was fetched
+        error: Upstream error that caused the fallback (None when the
+            payload was served by stale-while-revalidate)
+        revalidating: Whether a background refresh is running for this payload
+    """
+
+    def __init__(
+        self,
+        data: dict[str, Any],
+        age: float,
+        error: Optional[Exception] = None,
+        revalidating: bool = False,
+    ) -> None:
+        super().__init__(data)
+        self.age = age
+        self.error = error
+        self.revalidating = revalidating
+
+
+@dataclass
+class StalePolicy:
+    """When BaseClient may serve a last-good payload.
+
+    Attributes:
+        while_revalidate: Maximum age (seconds) of a payload returned at once
+            while a background refresh runs; 0 disables stale-while-revalidate
+        if_error: Maximum age (seconds) of a payload returned when the
+            request fails with one of ``errors``; 0 disables stale-if-error
+        revalidate_after: Age (seconds) a payload must reach before a
+            stale-while-revalidate hit refreshes it, when the client has no
+            cache TTL for the request; younger payloads are served as is
+        errors: Exceptions that trigger the stale-if-error fallback
+        store: Where last-good payloads are kept (use SQLiteCache to keep
+            them across restarts)
+    """
+
+    while_revalidate: float = 0.0
+    if_error: float = 3600.0
+    revalidate_after: float = 60.0
+    errors: tuple[type[Exception], ...] = (
+        CircuitBreakerError,
+        NetworkError,
+        RateLimitError,
+        ServerError,
+    )
+    store: ResponseCache = field(default_factory=MemoryCache)
+
+    def __post_init__(self) -> None:
+        """Validate settings.
+
+        Raises:
+            ValueError: If a maximum age is negative
+        """
+        if self.while_revalidate < 0 or self.if_error < 0 or self.revalidate_after < 0:
+            raise ValueError("Stale maximum ages cannot be negative")
+
+
+__all__ = ["StalePolicy", "StaleResponse"]
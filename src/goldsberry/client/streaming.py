@@ -0,0 +1,335 @@
+"""Incremental parsing of ``resultSets`` payloads.
+
+Endpoints such as shotchartdetail and playbyplayv2 return result sets with
+tens of thousands of rows. ResultSetParser consumes a response body chunk
+by chunk and emits, in document order, a ResultSetHeader for each result
+set followed by its rows, one list per row. Only the unparsed tail of the
+body and the row being decoded are held in memory, so peak memory stays
+flat however large the response is.
+
+Each row is decoded with the stdlib's C-accelerated JSON scanner; other
+top-level keys (``resource``, ``parameters``) are skipped.
+
+Example:
+    >>> for item in client.stream("playbyplayv2", {"GameID": "0022400001"}):
+    ...     if isinstance(item, ResultSetHeader):
+    ...         columns = item.headers
+    ...     else:
+    ...         handle(dict(zip(columns, item)))
+"""
+
+import codecs
+import json
+import re
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+
+from .exceptions import ParseError
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Result set keys whose value is streamed row by row
+ROWS_KEY = "rowSet"
+# Top-level keys holding result sets (a list, or a single object)
+RESULT_SET_KEYS = ("resultSets", "resultSet")
+
+
+@dataclass(frozen=True)
+class ResultSetHeader:
+    """Start of a result set; its rows follow.
+
+    Attributes:
+        index: Position of the result set in the payload
+        name: Result set name (None if the payload has none)
+        headers: Column names (None if they only appear after the rows)
+    """
+
+    index: int
+    name: Optional[str]
+    headers: Optional[list[Any]]
+
+
+StreamItem = Union[ResultSetHeader, list[Any]]
+
+
+class _NeedMoreError(Exception):
+    """The buffer ends before the next token is complete."""
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    """Index of the first non-whitespace character at or after pos."""
+    match = _WHITESPACE.match(text, pos)
+    return match.end() if match is not None else pos
+
+
+class ResultSetParser:
+    """Push parser turning body chunks into result set headers and rows.
+
+    Feed bytes as they arrive and collect the items each call returns;
+    call close() at the end of the body to check it was complete.
+    """
+
+    def __init__(self, encoding: str = "utf-8") -> None:
+        """Initialize parser.
+
+        Args:
+            encoding: Body encoding (stats.nba.com sends UTF-8)
+        """
+        self._text = codecs.getincrementaldecoder(encoding)()
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._final = False
+        self._state = "start"
+        self._key: Optional[str] = None
+        self._single = False
+        self._index = -1
+        self._name: Optional[str] = None
+        self._headers: Optional[list[Any]] = None
+        self._announced = False
+        self._items: list[StreamItem] = []
+
+    @property
+    def buffered(self) -> int:
+        """Characters of unparsed body currently held."""
+        return len(self._buf) - self._pos
+
+    @property
+    def done(self) -> bool:
+        """Whether the whole payload has been parsed."""
+        return self._state == "done"
+
+    def feed(self, chunk: bytes) -> list[StreamItem]:
+        """Parse another chunk of the body.
+
+        Returns:
+            Result set headers and rows completed by this chunk
+
+        Raises:
+            ParseError: If the body is not a valid resultSets payload
+        """
+        text = self._text.decode(chunk)
+        if text:
+            self._buf = self._buf[self._pos :] + text
+            self._pos = 0
+        return self._run()
+
+    def close(self) -> list[StreamItem]:
+        """Finish parsing at the end of the body.
+
+        Returns:
+            Items completed by the end of the body
+
+        Raises:
+            ParseError: If the body was truncated or invalid
+        """
+        tail = self._text.decode(b"", final=True)
+        if tail:
+            self._buf = self._buf[self._pos :] + tail
+            self._pos = 0
+        self._final = True
+        items = self._run()
+        if self._state != "done":
+            raise ParseError(
+                "Response body ended before the JSON payload was complete",
+                raw_response=self._buf[self._pos : self._pos + 500],
+            )
+        if _skip_whitespace(self._buf, self._pos) != len(self._buf):
+            raise self._error("Unexpected data after the JSON payload")
+        return items
+
+    # Tokens
+
+    def _error(self, message: str) -> ParseError:
+        """ParseError pointing at the current position."""
+        return ParseError(
+            f"{message} (at body offset ~{self._pos})",
+            raw_response=self._buf[self._pos : self._pos + 500],
+        )
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character."""
+        self._pos = _skip_whitespace(self._buf, self._pos)
+        if self._pos >= len(self._buf):
+            raise _NeedMoreError
+        return self._buf[self._pos]
+
+    def _expect(self, *chars: str) -> str:
+        """Consume one of the given structural characters."""
+        char = self._peek()
+        if char not in chars:
+            raise self._error(f"Expected one of {chars!r}, found {char!r}")
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self._peek()
+        try:
+            value, end = self._decoder.raw_decode(self._buf, self._pos)
+        except json.JSONDecodeError as e:
+            if self._final:
+                raise self._error(f"Invalid JSON: {e.msg}") from e
+            raise _NeedMoreError from e
+        # A number at the very end of the buffer may continue in the next chunk
+        if end >= len(self._buf) and not self._final:
+            raise _NeedMoreError
+        self._pos = end
+        return value
+
+    def _string(self) -> str:
+        """Decode the next value, which must be a string (an object key)."""
+        if self._peek() != '"':
+            raise self._error("Expected an object key")
+        key: str = self._value()
+        return key
+
+    # States
+
+    def _run(self) -> list[StreamItem]:
+        """Advance through as many states as the buffer allows."""
+        while self._state != "done":
+            mark = self._pos
+            try:
+                self._step()
+            except _NeedMoreError:
+                self._pos = mark
+                break
+        items, self._items = self._items, []
+        return items
+
+    def _announce(self) -> None:
+        """Emit the current result set's header (once)."""
+        if not self._announced:
+            self._announced = True
+            self._items.append(ResultSetHeader(self._index, self._name, self._headers))
+
+    def _start_set(self) -> None:
+        """Begin a new result set object."""
+        self._index += 1
+        self._name = None
+        self._headers = None
+        self._announced = False
+        self._state = "set_key"
+
+    def _end_set(self) -> None:
+        """Finish a result set object."""
+        self._announce()
+        self._state = "top_after" if self._single else "sets_after"
+
+    def _step(self) -> None:
+        """Consume one token (raises _NeedMoreError if the buffer runs out)."""
+        state = self._state
+
+        if state == "start":
+            self._expect("{")
+            self._state = "top_first_key"
+
+        elif state in ("top_first_key", "top_key"):
+            if state == "top_first_key" and self._peek() == "}":
+                self._pos += 1
+                self._state = "done"
+                return
+            self._key = self._string()
+            self._expect(":")
+            self._state = "top_value"
+
+        elif state == "top_value":
+            if self._key in RESULT_SET_KEYS:
+                opener = self._expect("[", "{")
+                self._single = opener == "{"
+                if self._single:
+                    self._start_set()
+                else:
+                    self._state = "sets_first"
+            else:
+                self._value()  # resource, parameters, ...: not streamed
+                self._state = "top_after"
+
+        elif state == "top_after":
+            self._state = "top_key" if self._expect(",", "}") == "," else "done"
+
+        elif state in ("sets_first", "sets_item"):
+            if state == "sets_first" and self._peek() == "]":
+                self._pos += 1
+                self._state = "top_after"
+                return
+            self._expect("{")
+            self._start_set()
+
+        elif state == "sets_after":
+            self._state = "sets_item" if self._expect(",", "]") == "," else "top_after"
+
+        elif state in ("set_key", "set_next_key"):
+            if state == "set_key" and self._peek() == "}":
+                self._pos += 1
+                self._end_set()
+                return
+            self._key = self._string()
+            self._expect(":")
+            if self._key == ROWS_KEY:
+                self._expect("[")
+                self._announce()
+                self._state = "rows_first"
+            else:
+                value = self._value()
+                if self._key == "name":
+                    self._name = value
+                elif self._key == "headers":
+                    self._headers = value
+                self._state = "set_after"
+
+        elif state == "set_after":
+            if self._expect(",", "}") == ",":
+                self._state = "set_next_key"
+            else:
+                self._end_set()
+
+        elif state in ("rows_first", "rows_item"):
+            if state == "rows_first" and self._peek() == "]":
+                self._pos += 1
+                self._state = "set_after"
+                return
+            self._items.append(self._value())
+            self._state = "rows_after"
+
+        elif state == "rows_after":
+            self._state = "rows_item" if self._expect(",", "]") == "," else "set_after"
+
+
+def iter_result_sets(chunks: Iterable[bytes]) -> Iterator[StreamItem]:
+    """Stream result set headers and rows from body chunks.
+
+    Args:
+        chunks: Body chunks (e.g. ``response.iter_bytes()``)
+
+    Yields:
+        A ResultSetHeader per result set, followed by its rows
+
+    Raises:
+        ParseError: If the body is not a valid resultSets payload
+    """
+    parser = ResultSetParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aiter_result_sets(chunks: AsyncIterable[bytes]) -> AsyncIterator[StreamItem]:
+    """Async version of iter_result_sets (e.g. for ``response.aiter_bytes()``)."""
+    parser = ResultSetParser()
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
+
+
+__all__ = [
+    "ResultSetHeader",
+    "ResultSetParser",
+    "StreamItem",
+    "aiter_result_sets",
+    "iter_result_sets",
+]
@@ -0,0 +1,351 @@
+"""Season-aware cache TTLs derived from the request itself.
+
+NBA data does not all age the same way: a finished season never changes,
+the current season's tables change nightly, and an in-progress game's
+boxscore changes every minute. TTLPolicy is a ``cache_ttl`` callable that
+inspects the Season and GameID parameters to keep immutable history
+forever and expire only what can still change. Game payloads that show a
+game is over (a final GAME_STATUS_ID, a W/L result or a game date at
+least two days old) mark it final automatically.
+
+Example:
+    >>> policy = TTLPolicy(
+    ...     endpoint_ttls={"commonallplayers": 24 * 3600},
+    ...     rules=[TTLRule(ttl=0, endpoints=("scoreboardv2",))],  # never cache
+    ... )
+    >>> client = BaseClient(cache=SQLiteCache("nba.sqlite"), cache_ttl=policy)
+"""
+
+import datetime
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+# Month in which a new NBA season starts (preseason in early October)
+SEASON_START_MONTH = 10
+
+# GAME_STATUS_ID of a finished game (1: scheduled, 2: in progress)
+GAME_STATUS_FINAL = 3
+
+# Columns holding a game's (US/Eastern) date
+GAME_DATE_COLUMNS = ("GAME_DATE_EST", "GAME_DATE")
+
+# Days after its (US/Eastern) date a game is assumed over; games can run
+# past midnight, so yesterday's game may still be in progress
+FINAL_AFTER_DAYS = 2
+
+# Most game IDs a TTLPolicy remembers as final (least recently used dropped)
+MAX_FINAL_GAMES = 10_000
+
+try:
+    EASTERN: datetime.tzinfo = ZoneInfo("America/New_York")
+except ZoneInfoNotFoundError:  # pragma: no cover - no tz database (Windows without tzdata)
+    EASTERN = datetime.timezone(datetime.timedelta(hours=-5), "EST")
+
+Params = Optional[dict[str, Any]]
+
+
+def season_start_year(season: Any) -> Optional[int]:
+    """Starting year of a season parameter such as "2024-25".
+
+    Args:
+        season: Season string or Season enum member
+
+    Returns:
+        Starting year, or None if the value is not a season
+    """
+    if isinstance(season, Enum):
+        season = season.value
+    text = str(season)
+    try:
+        return int(text[:4])
+    except ValueError:
+        return None
+
+
+def game_season_year(game_id: Any) -> Optional[int]:
+    """Starting year of the season a game belongs to.
+
+    Game IDs encode it in the fourth and fifth digits: "0022400001" is
+    game 1 of the 2024-25 regular season.
+
+    Args:
+        game_id: NBA game ID
+
+    Returns:
+        Starting year, or None if the ID is not in the expected format
+    """
+    text = str(game_id)
+    if len(text) != 10 or not text.isdigit():
+        return None
+    year = int(text[3:5])
+    # The league was founded in 1946
+    return 1900 + year if year >= 46 else 2000 + year
+
+
+def eastern_today() -> datetime.date:
+    """Today's date in US/Eastern, the timezone NBA game dates use."""
+    return datetime.datetime.now(EASTERN).date()
+
+
+def parse_game_date(value: Any) -> Optional[datetime.date]:
+    """Date of a GAME_DATE style value.
+
+    Accepts both formats the stats API uses: "2024-10-22T00:00:00" and
+    "OCT 22, 2024".
+
+    Args:
+        value: Column value
+
+    Returns:
+        The date, or None if the value is not a game date
+    """
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.date.fromisoformat(value[:10])
+    except ValueError:
+        pass
+    try:
+        return datetime.datetime.strptime(value.title(), "%b %d, %Y").date()  # noqa: DTZ007
+    except ValueError:
+        return None
+
+
+def payload_is_final(
+    data: dict[str, Any], game_id: str, today: Optional[datetime.date] = None
+) -> Optional[bool]:
+    """Whether a game payload shows the game is over.
+
+    Rows for the game (all rows when there is no GAME_ID column) are
+    checked for, in order of preference: a GAME_STATUS_ID, a W/L result
+    and a game date at least FINAL_AFTER_DAYS before today.
+
+    Args:
+        data: Decoded API response
+        game_id: Game the payload was requested for
+        today: US/Eastern date to compare game dates with (default: today)
+
+    Returns:
+        True if final, False if the status says it is not, None if unknown
+    """
+    result_sets = data.get("resultSets", data.get("resultSet")) if isinstance(data, dict) else None
+    if isinstance(result_sets, dict):
+        result_sets = [result_sets]
+    if not isinstance(result_sets, list):
+        return None
+
+    cutoff = (today or eastern_today()) - datetime.timedelta(days=FINAL_AFTER_DAYS)
+    final: Optional[bool] = None
+    for result_set in result_sets:
+        if not isinstance(result_set, dict):
+            continue
+        headers = result_set.get("headers")
+        if not isinstance(headers, list):
+            continue
+        columns = {name: index for index, name in enumerate(headers) if isinstance(name, str)}
+        id_index = columns.get("GAME_ID")
+
+        for row in result_set.get("rowSet") or ():
+            if not isinstance(row, list) or len(row) != len(headers):
+                continue
+            if id_index is not None and str(row[id_index]) != game_id:
+                continue
+            if "GAME_STATUS_ID" in columns:
+                return bool(row[columns["GAME_STATUS_ID"]] == GAME_STATUS_FINAL)
+            if "WL" in columns and row[columns["WL"]]:
+                final = True
+            for name in GAME_DATE_COLUMNS:
+                date = parse_game_date(row[columns[name]]) if name in columns else None
+                if date is not None and date <= cutoff:
+                    final = True
+    return final
+
+
+def current_season_year(today: Optional[datetime.date] = None) -> int:
+    """Starting year of the current (or most recent) season.
+
+    Seasons roll over in October; during the offseason the season that
+    just ended is still the current one.
+
+    Args:
+        today: Date to evaluate (default: today in US/Eastern)
+
+    Returns:
+        Starting year, e.g. 2024 for the 2024-25 season
+    """
+    today = today or eastern_today()
+    return today.year if today.month >= SEASON_START_MONTH else today.year - 1
+
+
+@dataclass(frozen=True)
+class TTLRule:
+    """Override the TTL for matching requests.
+
+    A rule matches when the endpoint is in ``endpoints`` (or ``endpoints``
+    is None) and ``when`` (if given) returns True for the request.
+
+    Attributes:
+        ttl: Seconds to cache, None to cache forever, 0 to not cache
+        endpoints: Endpoint names the rule applies to (None: all)
+        when: Extra predicate ``(endpoint, params) -> bool``
+    """
+
+    ttl: Optional[float]
+    endpoints: Optional[tuple[str, ...]] = None
+    when: Optional[Callable[[str, Params], bool]] = None
+
+    def matches(self, endpoint: str, params: Params) -> bool:
+        """Whether the rule applies to a request."""
+        if self.endpoints is not None and endpoint not in self.endpoints:
+            return False
+        return self.when is None or self.when(endpoint, params)
+
+
+class TTLPolicy:
+    """Cache TTL derived from the Season and GameID of a request.
+
+    Rules are applied in order, first match wins:
+
+    1. Custom ``rules``
+    2. Past seasons, and games that are final or from past seasons:
+       ``historical_ttl`` (forever by default)
+    3. Current-season games not known to be final: ``live_game_ttl``
+    4. Everything else: ``endpoint_ttls[endpoint]`` or ``current_ttl``
+
+    Games are known to be final when a response for them shows it (see
+    observe) or when passed to mark_final (or the constructor); without
+    that, boxscores of current-season games are treated as possibly in
+    progress. At most MAX_FINAL_GAMES final games are remembered; the
+    least recently used are forgotten first.
+    """
+
+    def __init__(
+        self,
+        current_ttl: Optional[float] = 3600.0,
+        live_game_ttl: Optional[float] = 60.0,
+        historical_ttl: Optional[float] = None,
+        endpoint_ttls: Optional[dict[str, Optional[float]]] = None,
+        rules: Iterable[TTLRule] = (),
+        final_games: Iterable[str] = (),
+        today: Optional[Callable[[], datetime.date]] = None,
+    ) -> None:
+        """Initialize TTL policy.
+
+        Args:
+            current_ttl: TTL for current-season and season-less requests
+            live_game_ttl: TTL for current-season games not known to be final
+            historical_ttl: TTL for past seasons and final games (None: forever)
+            endpoint_ttls: Per-endpoint TTLs replacing current_ttl
+            rules: Custom rules checked before anything else
+            final_games: Game IDs known to be final
+            today: US/Eastern date source used to determine the current
+                season and whether a game date has passed
+
+        Raises:
+            ValueError: If a TTL is negative
+        """
+        ttls = [current_ttl, live_game_ttl, historical_ttl, *(endpoint_ttls or {}).values()]
+        if any(ttl is not None and ttl < 0 for ttl in ttls):
+            raise ValueError("TTLs cannot be negative")
+
+        self.current_ttl = current_ttl
+        self.live_game_ttl = live_game_ttl
+        self.historical_ttl = historical_ttl
+        self.endpoint_ttls = dict(endpoint_ttls or {})
+        self.rules = list(rules)
+        self._final_games: OrderedDict[str, None] = OrderedDict()
+        self._lock = threading.Lock()
+        self._today = today or eastern_today
+        self.mark_final(*final_games)
+
+    def mark_final(self, *game_ids: str) -> None:
+        """Record games as final so their data is cached as history."""
+        with self._lock:
+            for game_id in game_ids:
+                self._final_games[game_id] = None
+                self._final_games.move_to_end(game_id)
+            while len(self._final_games) > MAX_FINAL_GAMES:
+                self._final_games.popitem(last=False)
+
+    def observe(
+        self,
+        endpoint: str,  # noqa: ARG002 - BaseClient hook signature
+        params: Params,
+        data: dict[str, Any],
+    ) -> None:
+        """Mark a game final if a response for it shows the game is over.
+
+        Called by BaseClient with each successful response before it is
+        cached, so the TTL it is cached with already reflects the payload.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            data: Decoded response
+        """
+        game_id = (params or {}).get("GameID")
+        if game_id is None:
+            return
+        game_id = str(getattr(game_id, "value", game_id))
+        if self.is_final(game_id):
+            return
+        if payload_is_final(data, game_id, self._today()):
+            self.mark_final(game_id)
+
+    def is_final(self, game_id: str) -> bool:
+        """Whether a game was marked final."""
+        with self._lock:
+            if game_id not in self._final_games:
+                return False
+            self._final_games.move_to_end(game_id)
+            return True
+
+    def __call__(self, endpoint: str, params: Params = None) -> Optional[float]:
+        """Get the TTL for a request.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+
+        Returns:
+            Seconds to cache, None to cache forever, or 0 to skip caching
+        """
+        for rule in self.rules:
+            if rule.matches(endpoint, params):
+                return rule.ttl
+
+        params = params or {}
+        current_year = current_season_year(self._today())
+
+        game_id = params.get("GameID")
+        if game_id is not None:
+            game_id = str(getattr(game_id, "value", game_id))
+            year = game_season_year(game_id)
+            if self.is_final(game_id) or (year is not None and year < current_year):
+                return self.historical_ttl
+            return self.live_game_ttl
+
+        season = params.get("Season")
+        if season is not None:
+            year = season_start_year(season)
+            if year is not None and year < current_year:
+                return self.historical_ttl
+
+        return self.endpoint_ttls.get(endpoint, self.current_ttl)
+
+
+__all__ = [
+    "TTLPolicy",
+    "TTLRule",
+    "current_season_year",
+    "eastern_today",
+    "game_season_year",
+    "parse_game_date",
+    "payload_is_final",
+    "season_start_year",
+]
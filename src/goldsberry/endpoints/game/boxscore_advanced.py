@@ -3,6 +3,8 @@
 from typing import Optional, Union
 
 from ...client.base import BaseClient
+from ...client.profiling import timed_parse
+from ...models.base import parse_rows
 from ...models.game import BoxscoreAdvanced, PlayerBoxscoreAdvanced, TeamBoxscoreAdvanced
 
 
@@ -99,9 +101,7 @@ class BoxscoreAdvancedEndpoint:
             headers = player_data.get("headers", [])
             rows = player_data.get("rowSet", [])
 
-            for row in rows:
-                player_dict = dict(zip(headers, row))
-                player_stats.append(PlayerBoxscoreAdvanced(**player_dict))
+            player_stats = parse_rows(PlayerBoxscoreAdvanced, headers, rows)
 
         # The second result set contains team stats
         team_stats = []
@@ -110,9 +110,7 @@ class BoxscoreAdvancedEndpoint:
             headers = team_data.get("headers", [])
             rows = team_data.get("rowSet", [])
 
-            for row in rows:
-                team_dict = dict(zip(headers, row))
-                team_stats.append(TeamBoxscoreAdvanced(**team_dict))
+            team_stats = parse_rows(TeamBoxscoreAdvanced, headers, rows)
 
         return BoxscoreAdvanced(player_stats=player_stats, team_stats=team_stats)
 
@@ -156,7 +154,7 @@ class BoxscoreAdvancedEndpoint:
             range_type=range_type,
         )
         data = self.client.get(self.ENDPOINT, params=params)
-        return self._parse_response(data)
+        return timed_parse(self._parse_response, data)
 
     async def fetch_async(
         self,
@@ -197,7 +195,7 @@ class BoxscoreAdvancedEndpoint:
             range_type=range_type,
         )
         data = await self.client.get_async(self.ENDPOINT, params=params)
-        return self._parse_response(data)
+        return timed_parse(self._parse_response, data)
 
 
 def get_boxscore_advanced(
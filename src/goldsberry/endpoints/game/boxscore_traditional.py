@@ -3,6 +3,8 @@
 from typing import Optional, Union
 
 from ...client.base import BaseClient
+from ...client.profiling import timed_parse
+from ...models.base import parse_rows
 from ...models.game import BoxscoreTraditional, PlayerBoxscoreTraditional, TeamBoxscoreTraditional
 
 
@@ -98,9 +100,7 @@ class BoxscoreTraditionalEndpoint:
             headers = player_data.get("headers", [])
             rows = player_data.get("rowSet", [])
 
-            for row in rows:
-                player_dict = dict(zip(headers, row))
-                player_stats.append(PlayerBoxscoreTraditional(**player_dict))
+            player_stats = parse_rows(PlayerBoxscoreTraditional, headers, rows)
 
         # The second result set contains team stats
         team_stats = []
@@ -109,9 +109,7 @@ class BoxscoreTraditionalEndpoint:
             headers = team_data.get("headers", [])
             rows = team_data.get("rowSet", [])
 
-            for row in rows:
-                team_dict = dict(zip(headers, row))
-                team_stats.append(TeamBoxscoreTraditional(**team_dict))
+            team_stats = parse_rows(TeamBoxscoreTraditional, headers, rows)
 
         return BoxscoreTraditional(player_stats=player_stats, team_stats=team_stats)
 
@@ -155,7 +153,7 @@ class BoxscoreTraditionalEndpoint:
             range_type=range_type,
         )
         data = self.client.get(self.ENDPOINT, params=params)
-        return self._parse_response(data)
+        return timed_parse(self._parse_response, data)
 
     async def fetch_async(
         self,
@@ -196,7 +194,7 @@ class BoxscoreTraditionalEndpoint:
             range_type=range_type,
         )
         data = await self.client.get_async(self.ENDPOINT, params=params)
-        return self._parse_response(data)
+        return timed_parse(self._parse_response, data)
 
 
 def get_boxscore_traditional(
@@ -3,6 +3,7 @@
 from typing import Optional, Union
 
 from ...client.base import BaseClient
+from ...client.profiling import timed_parse
 from ...enums.common import (
     LeagueID,
     Location,
@@ -20,6 +21,7 @@ from ...enums.common import (
     SeasonType,
     StarterBench,
 )
+from ...models.base import parse_rows
 from ...models.league import LeaguePlayerStats, PlayerStats
 
 
@@ -242,11 +244,8 @@ class LeaguePlayerStatsEndpoint:
         headers = player_data.get("headers", [])
         rows = player_data.get("rowSet", [])
 
-        # Convert rows to list of dicts
-        players = []
-        for row in rows:
-            player_dict = dict(zip(headers, row))
-            players.append(PlayerStats(**player_dict))
+        # Convert rows to models
+        players = parse_rows(PlayerStats, headers, rows)
 
         return LeaguePlayerStats(players=players)
 
@@ -287,7 +286,7 @@ class LeaguePlayerStatsEndpoint:
             **kwargs,
         )
         data = self.client.get(self.ENDPOINT, params=params)
-        return self._parse_response(data)
+        return timed_parse(self._parse_response, data)
 
     async def fetch_async(
         self,
@@ -325,7 +324,7 @@ class LeaguePlayerStatsEndpoint:
             **kwargs,
         )
         data = await self.client.get_async(self.ENDPOINT, params=params)
-        return self._parse_response(data)
+        return timed_parse(self._parse_response, data)
 
 
 def get_league_player_stats(
@@ -3,6 +3,7 @@
 from typing import Optional, Union
 
 from ...client.base import BaseClient
+from ...client.profiling import timed_parse
 from ...enums.common import (
     LeagueID,
     Location,
@@ -18,6 +19,7 @@ from ...enums.common import (
     SeasonSegment,
     SeasonType,
 )
+from ...models.base import parse_rows
 from ...models.league import LeagueTeamStats, TeamStats
 
 
@@ -216,11 +218,8 @@ class LeagueTeamStatsEndpoint:
         headers = team_data.get("headers", [])
         rows = team_data.get("rowSet", [])
 
-        # Convert rows to list of dicts
-        teams = []
-        for row in rows:
-            team_dict = dict(zip(headers, row))
-            teams.append(TeamStats(**team_dict))
+        # Convert rows to models
+        teams = parse_rows(TeamStats, headers, rows)
 
         return LeagueTeamStats(teams=teams)
 
@@ -261,7 +260,7 @@ class LeagueTeamStatsEndpoint:
             **kwargs,
         )
         data = self.client.get(self.ENDPOINT, params=params)
-        return self._parse_response(data)
+        return timed_parse(self._parse_response, data)
 
     async def fetch_async(
         self,
@@ -299,7 +298,7 @@ class LeagueTeamStatsEndpoint:
             **kwargs,
         )
         data = await self.client.get_async(self.ENDPOINT, params=params)
-        return self._parse_response(data)
+        return timed_parse(self._parse_response, data)
 
 
 def get_league_team_stats(
@@ -3,7 +3,9 @@
 from typing import Optional, Union
 
 from ...client.base import BaseClient
+from ...client.profiling import timed_parse
 from ...enums.common import PerMode
+from ...models.base import parse_rows
 from ...models.player import SeasonTotals, CareerTotals, PlayerCareerStats
 
 
@@ -79,10 +81,8 @@ class CareerStatsEndpoint:
         # Parse season totals regular season
         season_regular = []
         if "SeasonTotalsRegularSeason" in result_sets:
-            headers = result_sets["SeasonTotalsRegularSeason"]["headers"]
-            for row in result_sets["SeasonTotalsRegularSeason"]["rowSet"]:
-                row_dict = dict(zip(headers, row))
-                season_regular.append(SeasonTotals(**row_dict))
+            result_set = result_sets["SeasonTotalsRegularSeason"]
+            season_regular = parse_rows(SeasonTotals, result_set["headers"], result_set["rowSet"])
 
         # Parse career totals regular season
         career_regular = None
@@ -90,16 +90,13 @@ class CareerStatsEndpoint:
             headers = result_sets["CareerTotalsRegularSeason"]["headers"]
             rows = result_sets["CareerTotalsRegularSeason"]["rowSet"]
             if rows:
-                row_dict = dict(zip(headers, rows[0]))
-                career_regular = CareerTotals(**row_dict)
+                career_regular = parse_rows(CareerTotals, headers, rows[:1])[0]
 
         # Parse season totals playoffs
         season_post = []
         if "SeasonTotalsPostSeason" in result_sets:
-            headers = result_sets["SeasonTotalsPostSeason"]["headers"]
-            for row in result_sets["SeasonTotalsPostSeason"]["rowSet"]:
-                row_dict = dict(zip(headers, row))
-                season_post.append(SeasonTotals(**row_dict))
+            result_set = result_sets["SeasonTotalsPostSeason"]
+            season_post = parse_rows(SeasonTotals, result_set["headers"], result_set["rowSet"])
 
         # Parse career totals playoffs
         career_post = None
@@ -107,8 +104,7 @@ class CareerStatsEndpoint:
             headers = result_sets["CareerTotalsPostSeason"]["headers"]
             rows = result_sets["CareerTotalsPostSeason"]["rowSet"]
             if rows:
-                row_dict = dict(zip(headers, rows[0]))
-                career_post = CareerTotals(**row_dict)
+                career_post = parse_rows(CareerTotals, headers, rows[:1])[0]
 
         return PlayerCareerStats(
             season_totals_regular=season_regular,
@@ -142,7 +138,7 @@ class CareerStatsEndpoint:
         """
         params = self._build_params(player_id, per_mode)
         data = self.client.get(self.ENDPOINT, params=params)
-        return self._parse_response(data)
+        return timed_parse(self._parse_response, data)
 
     async def fetch_async(
         self,
@@ -169,7 +165,7 @@ class CareerStatsEndpoint:
         """
         params = self._build_params(player_id, per_mode)
         data = await self.client.get_async(self.ENDPOINT, params=params)
-        return self._parse_response(data)
+        return timed_parse(self._parse_response, data)
 
 
 # Convenience functions for quick access
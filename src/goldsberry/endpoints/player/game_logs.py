@@ -3,6 +3,7 @@
 from typing import Optional, Union
 
 from ...client.base import BaseClient
+from ...client.profiling import timed_parse
 from ...enums.common import Season, SeasonType
 from ...models.base import parse_nba_response
 from ...models.player import GameLog
@@ -99,7 +100,7 @@ class GameLogsEndpoint:
         """
         params = self._build_params(player_id, season, season_type)
         data = self.client.get(self.ENDPOINT, params=params)
-        return parse_nba_response(data, GameLog)
+        return timed_parse(parse_nba_response, data, GameLog)
 
     async def fetch_async(
         self,
@@ -128,7 +129,7 @@ class GameLogsEndpoint:
         """
         params = self._build_params(player_id, season, season_type)
         data = await self.client.get_async(self.ENDPOINT, params=params)
-        return parse_nba_response(data, GameLog)
+        return timed_parse(parse_nba_response, data, GameLog)
 
 
 # Convenience functions for quick access
@@ -7,6 +7,7 @@ Returns a list of all players in NBA history or current season.
 from typing import Dict, List, Optional, Union
 
 from ...client.base import BaseClient
+from ...client.profiling import timed_parse
 from ...enums.common import IsOnlyCurrentSeason, LeagueID, Season
 from ...models.base import parse_nba_response
 from ...models.player import PlayerInfo
@@ -116,7 +117,7 @@ class PlayerListEndpoint:
         """
         params = self._build_params(season, league_id, only_current_season)
         data = self.client.get(self.ENDPOINT, params=params)
-        return parse_nba_response(data, PlayerInfo)
+        return timed_parse(parse_nba_response, data, PlayerInfo)
 
     async def fetch_async(
         self,
@@ -147,7 +148,7 @@ class PlayerListEndpoint:
         """
         params = self._build_params(season, league_id, only_current_season)
         data = await self.client.get_async(self.ENDPOINT, params=params)
-        return parse_nba_response(data, PlayerInfo)
+        return timed_parse(parse_nba_response, data, PlayerInfo)
 
 
 # Convenience function for quick access
@@ -3,7 +3,9 @@
 from typing import Optional, Union
 
 from ...client.base import BaseClient
+from ...client.profiling import timed_parse
 from ...enums.common import LeagueID, Season, SeasonType
+from ...models.base import parse_rows
 from ...models.team import TeamGameLog, TeamGameLogs
 
 
@@ -97,11 +99,8 @@ class TeamGameLogsEndpoint:
         headers = game_data.get("headers", [])
         rows = game_data.get("rowSet", [])
 
-        # Convert rows to list of dicts
-        games = []
-        for row in rows:
-            game_dict = dict(zip(headers, row))
-            games.append(TeamGameLog(**game_dict))
+        # Convert rows to models
+        games = parse_rows(TeamGameLog, headers, rows)
 
         return TeamGameLogs(games=games)
 
@@ -139,7 +138,7 @@ class TeamGameLogsEndpoint:
             league_id=league_id,
         )
         data = self.client.get(self.ENDPOINT, params=params)
-        return self._parse_response(data)
+        return timed_parse(self._parse_response, data)
 
     async def fetch_async(
         self,
@@ -174,7 +173,7 @@ class TeamGameLogsEndpoint:
             league_id=league_id,
         )
         data = await self.client.get_async(self.ENDPOINT, params=params)
-        return self._parse_response(data)
+        return timed_parse(self._parse_response, data)
 
 
 def get_team_game_logs(
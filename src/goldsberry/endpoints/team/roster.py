@@ -3,7 +3,9 @@
 from typing import Optional, Union
 
 from ...client.base import BaseClient
+from ...client.profiling import timed_parse
 from ...enums.common import LeagueID, Season
+from ...models.base import parse_rows
 from ...models.team import Coach, RosterPlayer, TeamRoster
 
 
@@ -94,9 +96,7 @@ class TeamRosterEndpoint:
             headers = player_data.get("headers", [])
             rows = player_data.get("rowSet", [])
 
-            for row in rows:
-                player_dict = dict(zip(headers, row))
-                players.append(RosterPlayer(**player_dict))
+            players = parse_rows(RosterPlayer, headers, rows)
 
         # The second result set contains coaches
         coaches = []
@@ -105,9 +105,7 @@ class TeamRosterEndpoint:
             headers = coach_data.get("headers", [])
             rows = coach_data.get("rowSet", [])
 
-            for row in rows:
-                coach_dict = dict(zip(headers, row))
-                coaches.append(Coach(**coach_dict))
+            coaches = parse_rows(Coach, headers, rows)
 
         return TeamRoster(players=players, coaches=coaches)
 
@@ -142,7 +140,7 @@ class TeamRosterEndpoint:
             league_id=league_id,
         )
         data = self.client.get(self.ENDPOINT, params=params)
-        return self._parse_response(data)
+        return timed_parse(self._parse_response, data)
 
     async def fetch_async(
         self,
@@ -174,7 +172,7 @@ class TeamRosterEndpoint:
             league_id=league_id,
         )
         data = await self.client.get_async(self.ENDPOINT, params=params)
-        return self._parse_response(data)
+        return timed_parse(self._parse_response, data)
 
 
 def get_team_roster(
@@ -3,9 +3,15 @@
 Provides common patterns and utilities for parsing NBA API response structures.
 """
 
-from typing import Any, ClassVar, Generic, TypeVar
+import logging
+from collections.abc import Mapping
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, ClassVar, Generic, Optional, TypeVar
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+logger = logging.getLogger(__name__)
 
 
 class NBABaseModel(BaseModel):
@@ -128,6 +134,189 @@ class SingleResultMixin:
         return self.get_dicts(self.result_set_index)
 
 
+M = TypeVar("M", bound=BaseModel)
+
+# Row converters kept per (model class, header layout); also bounds the
+# TypeAdapters kept per model class
+ROW_CONVERTER_CACHE_SIZE = 256
+
+
+def _input_keys(model_class: type[BaseModel]) -> Optional[set[str]]:
+    """Keys a model reads from its input, or None if every column must be kept.
+
+    Models that allow extra input keep them, and models that forbid it
+    must still see (and reject) unknown columns, so both keep every column.
+    """
+    if model_class.model_config.get("extra") in ("allow", "forbid"):
+        return None
+    if model_class.__pydantic_decorators__.model_validators:
+        return None
+    keys = set()
+    for name, field in model_class.model_fields.items():
+        keys.add(name)
+        for alias in (field.alias, field.validation_alias):
+            if isinstance(alias, str):
+                keys.add(alias)
+            elif alias is not None:
+                return None  # AliasPath/AliasChoices: keep every column
+    return keys
+
+
+def _missing_fields(
+    model_class: type[BaseModel], headers: tuple[str, ...]
+) -> tuple[list[str], list[str]]:
+    """Required and optional fields none of whose input keys appear in the headers."""
+    present = set(headers)
+    required: list[str] = []
+    optional: list[str] = []
+    for name, field in model_class.model_fields.items():
+        aliases = {name, field.alias, field.validation_alias}
+        if not present & {alias for alias in aliases if isinstance(alias, str)}:
+            (required if field.is_required() else optional).append(field.alias or name)
+    return required, optional
+
+
+@lru_cache(maxsize=ROW_CONVERTER_CACHE_SIZE)
+def row_converter(
+    model_class: type[BaseModel], headers: tuple[str, ...]
+) -> Optional[Callable[[list[Any]], dict[str, Any]]]:
+    """Build a function turning rows with this header layout into model input.
+
+    The column positions the model reads are resolved once per layout, so
+    each row only needs an ``operator.itemgetter`` call and a zip with the
+    kept headers: no header lookups, and columns the model ignores are
+    dropped. Converters are cached per (model class, headers) fingerprint;
+    a new layout from the API gets its own converter. Fields missing from
+    the layout are logged once per layout.
+
+    Args:
+        model_class: Pydantic model class the input is for
+        headers: Column headers of the result set
+
+    Returns:
+        Converter taking one row (of ``len(headers)`` values), or None if
+        the layout lacks required fields of the model (schema drift)
+    """
+    required, optional = _missing_fields(model_class, headers)
+    if required:
+        logger.warning(
+            "Result set headers for %s lack required fields %s; "
+            "parsing rows without a compiled converter",
+            model_class.__name__,
+            required + optional,
+        )
+        return None
+    if optional:
+        logger.warning(
+            "Result set headers for %s lack fields %s; they keep their defaults",
+            model_class.__name__,
+            optional,
+        )
+
+    keys = _input_keys(model_class)
+    positions = {header: i for i, header in enumerate(headers)}  # last wins, like dict(zip)
+    columns = {
+        header: i for header, i in positions.items() if keys is None or header in keys
+    }
+    pairs = list(columns.items())
+    if len(pairs) <= 1:  # itemgetter needs an index and returns a bare value for one
+        return lambda row: {name: row[i] for name, i in pairs}
+
+    names = tuple(columns)
+    getter = itemgetter(*columns.values())
+    return lambda row: dict(zip(names, getter(row)))
+
+
+@lru_cache(maxsize=ROW_CONVERTER_CACHE_SIZE)
+def list_adapter(model_class: type[M]) -> TypeAdapter[list[M]]:
+    """Cached ``TypeAdapter(list[model_class])`` for batch validation."""
+    return TypeAdapter(list[model_class])  # type: ignore[valid-type]
+
+
+def parse_rows(
+    model_class: type[M], headers: list[str], rows: list[list[Any]]
+) -> list[M]:
+    """Parse result set rows into models.
+
+    Rows are turned into model input by the cached converter for this
+    header layout (see row_converter), or ``dict(zip(headers, row))`` for
+    layouts and row widths it cannot handle, and the whole list is then
+    validated in one call through list_adapter, so the per-row loop runs
+    in pydantic-core rather than Python. Validation errors are reported
+    with the row index in their location.
+
+    Args:
+        model_class: Pydantic model class to parse into
+        headers: Column headers of the result set
+        rows: Rows of the result set
+
+    Returns:
+        List of parsed model instances
+
+    Raises:
+        ValidationError: If any row does not fit the model
+    """
+    convert = None
+    if all(type(header) is str for header in headers):
+        convert = row_converter(model_class, tuple(headers))
+
+    if convert is None:
+        inputs = [dict(zip(headers, row)) for row in rows]
+    else:
+        width = len(headers)
+        inputs = [
+            convert(row) if len(row) == width else dict(zip(headers, row)) for row in rows
+        ]
+    return list_adapter(model_class).validate_python(inputs)
+
+
+def _plain_result_set(result_set: object) -> bool:
+    """Whether a result set has a name, string headers and list rows."""
+    if not isinstance(result_set, Mapping) or type(result_set.get("name")) is not str:
+        return False
+    headers = result_set.get("headers")
+    rows = result_set.get("rowSet")
+    return (
+        isinstance(headers, list)
+        and isinstance(rows, list)
+        and all(type(header) is str for header in headers)
+        and all(isinstance(row, list) for row in rows)
+    )
+
+
+def _primary_rows(data: object) -> Optional[tuple[list[str], list[list[Any]]]]:
+    """Headers and rows of the primary result set, checking only the envelope.
+
+    Applies the same shape rules NBAResponse would (resource string, list of
+    result sets each with a name, string headers and list rows) without
+    copying any row. Mappings and lists are accepted by isinstance, so dict
+    subclasses such as StaleResponse take this path too.
+
+    Args:
+        data: Raw JSON response from NBA API
+
+    Returns:
+        (headers, rows) of the first result set, or None if the payload is
+        not the plain shape, in which case NBAResponse should handle it
+    """
+    if (
+        not isinstance(data, Mapping)
+        or type(data.get("resource")) is not str
+        or not isinstance(data.get("parameters", {}), Mapping)
+    ):
+        return None
+
+    result_sets = data.get("resultSets", [])
+    if not isinstance(result_sets, list) or not isinstance(data.get("resultSet", []), list):
+        return None
+    result_sets = result_sets or data.get("resultSet", [])
+    if not result_sets or not all(_plain_result_set(result_set) for result_set in result_sets):
+        return None
+
+    primary = result_sets[0]
+    return primary["headers"], primary["rowSet"]
+
+
 def parse_nba_response(
     data: dict[str, Any], model_class: type[T]
 ) -> list[T]:
@@ -136,6 +325,10 @@ def parse_nba_response(
     Takes raw API response and converts the primary result set
     into a list of typed Pydantic models.
 
+    Well-formed payloads are parsed in a single pass: only the envelope is
+    checked and each row goes straight to a model. Anything unusual is
+    parsed through NBAResponse, which raises the usual validation errors.
+
     Args:
         data: Raw JSON response from NBA API
         model_class: Pydantic model class to parse into
@@ -147,6 +340,11 @@ def parse_nba_response(
         >>> data = client.get("commonallplayers", params={...})
         >>> players = parse_nba_response(data, PlayerInfo)
     """
+    primary = _primary_rows(data)
+    if primary is not None:
+        headers, rows = primary
+        return parse_rows(model_class, headers, rows)
+
     # Parse response structure
     response = NBAResponse[model_class](**data)
 
@@ -163,4 +361,7 @@ __all__ = [
     "NBAResponse",
     "SingleResultMixin",
     "parse_nba_response",
+    "list_adapter",
+    "parse_rows",
+    "row_converter",
 ]
@@ -0,0 +1,33 @@
+"""Local stand-in NBA Stats API for offline load, chaos and integration tests.
+
+Example:
+    >>> from goldsberry.testing import FakeNBAServer, Faults, lognormal
+    >>>
+    >>> server = FakeNBAServer(faults=Faults(latency=lognormal(0.3), error_rate=0.02))
+    >>> client = BaseClient(transport=server.transport())
+"""
+
+from .payloads import ENDPOINT_SCHEMAS, PayloadFactory
+from .server import (
+    FakeNBAServer,
+    FakeResponse,
+    FakeTransport,
+    Faults,
+    LatencyModel,
+    constant,
+    lognormal,
+    uniform,
+)
+
+__all__ = [
+    "ENDPOINT_SCHEMAS",
+    "FakeNBAServer",
+    "FakeResponse",
+    "FakeTransport",
+    "Faults",
+    "LatencyModel",
+    "PayloadFactory",
+    "constant",
+    "lognormal",
+    "uniform",
+]
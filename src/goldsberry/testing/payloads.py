@@ -0,0 +1,224 @@
+"""Response payloads for the local stand-in NBA Stats server.
+
+PayloadFactory builds ``resultSets`` responses in the shapes parsed by the
+``goldsberry.endpoints`` classes. Recorded payloads (such as the JSON
+files under ``tests/fixtures``) can be registered as templates. Any other
+request to a known endpoint gets a synthetic payload whose headers come
+from the endpoint's Pydantic models. Synthetic payloads are deterministic
+per request and echo IDs from the query (e.g. ``PlayerID``) into the
+matching columns.
+
+Example:
+    >>> factory = PayloadFactory(rows=50)
+    >>> factory.load_fixtures("tests/fixtures")
+    >>> data = factory.payload("leaguedashplayerstats", {"Season": "2024-25"})
+"""
+
+import json
+import random
+import threading
+import typing
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from pydantic import BaseModel
+
+from ..models.game import (
+    PlayerBoxscoreAdvanced,
+    PlayerBoxscoreTraditional,
+    TeamBoxscoreAdvanced,
+    TeamBoxscoreTraditional,
+)
+from ..models.league import PlayerStats as LeaguePlayerRow
+from ..models.league import TeamStats as LeagueTeamRow
+from ..models.player import CareerTotals, GameLog, PlayerInfo, SeasonTotals
+from ..models.team import Coach, RosterPlayer, TeamGameLog
+from ..models.team import TeamStats as TeamSeasonRow
+
+# Result sets returned by each endpoint: (name, models whose columns it holds)
+ENDPOINT_SCHEMAS: dict[str, list[tuple[str, tuple[type[BaseModel], ...]]]] = {
+    "boxscoreadvancedv2": [
+        ("PlayerStats", (PlayerBoxscoreAdvanced,)),
+        ("TeamStats", (TeamBoxscoreAdvanced,)),
+    ],
+    "boxscoretraditionalv2": [
+        ("PlayerStats", (PlayerBoxscoreTraditional,)),
+        ("TeamStats", (TeamBoxscoreTraditional,)),
+    ],
+    "commonallplayers": [("CommonAllPlayers", (PlayerInfo,))],
+    "commonteamroster": [("CommonTeamRoster", (RosterPlayer,)), ("Coaches", (Coach,))],
+    "leaguedashplayerstats": [("LeagueDashPlayerStats", (LeaguePlayerRow,))],
+    "leaguedashteamstats": [("LeagueDashTeamStats", (LeagueTeamRow, TeamSeasonRow))],
+    "playercareerstats": [
+        ("SeasonTotalsRegularSeason", (SeasonTotals,)),
+        ("CareerTotalsRegularSeason", (CareerTotals,)),
+        ("SeasonTotalsPostSeason", (SeasonTotals,)),
+        ("CareerTotalsPostSeason", (CareerTotals,)),
+    ],
+    "playergamelog": [("PlayerGameLog", (GameLog,))],
+    "teamgamelog": [("TeamGameLog", (TeamGameLog,))],
+}
+
+# Result sets that hold a single summary row
+SINGLE_ROW_SETS = {"CareerTotalsRegularSeason", "CareerTotalsPostSeason"}
+
+
+def _normalize(name: str) -> str:
+    """Compare column and parameter names ignoring case and underscores."""
+    return name.replace("_", "").lower()
+
+
+def _columns(models: tuple[type[BaseModel], ...]) -> list[tuple[str, Any]]:
+    """(header, annotation) pairs for the union of the models' fields."""
+    columns: dict[str, Any] = {}
+    for model in models:
+        for name, field in model.model_fields.items():
+            columns.setdefault(field.alias or name, field.annotation)
+    return list(columns.items())
+
+
+def _base_type(annotation: Any) -> Any:
+    """Strip Optional[...] from an annotation."""
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    if typing.get_origin(annotation) is Union and len(args) == 1:
+        return args[0]
+    return annotation
+
+
+def _coerce(value: Any, annotation: Any) -> Any:
+    """Convert a query parameter to a column's type, if possible."""
+    kind = _base_type(annotation)
+    try:
+        if kind is int:
+            return int(value)
+        if kind is float:
+            return float(value)
+    except (TypeError, ValueError):
+        return None
+    return str(getattr(value, "value", value))
+
+
+def _synthetic_value(header: str, annotation: Any, rng: random.Random) -> Any:
+    """Plausible random value for a column."""
+    kind = _base_type(annotation)
+    if header == "WL":
+        return rng.choice(["W", "L"])
+    if kind is int:
+        if header.upper().endswith("ID"):
+            return rng.randint(1_000_000, 1_999_999)
+        return rng.randint(0, 82)
+    if kind is float:
+        if header.endswith("_PCT") or header.endswith("PCT"):
+            return round(rng.random(), 3)
+        return round(rng.uniform(0, 40), 1)
+    if kind is bool:
+        return rng.random() < 0.5
+    if header.upper().endswith("ID"):
+        return f"00{rng.randint(0, 99_999_999):08d}"
+    return f"{header.title()} {rng.randint(1, 999)}"
+
+
+class PayloadFactory:
+    """Build stats.nba.com-shaped payloads from templates or synthetically."""
+
+    def __init__(self, rows: int = 15, seed: int = 0) -> None:
+        """Initialize payload factory.
+
+        Args:
+            rows: Rows per synthetic result set
+            seed: Seed mixed into every synthetic payload
+
+        Raises:
+            ValueError: If rows is negative
+        """
+        if rows < 0:
+            raise ValueError("rows cannot be negative")
+
+        self.rows = rows
+        self.seed = seed
+        self._templates: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def endpoints(self) -> set[str]:
+        """Endpoints the factory can answer."""
+        return set(ENDPOINT_SCHEMAS) | set(self._templates)
+
+    def add_template(self, payload: dict[str, Any], endpoint: Optional[str] = None) -> None:
+        """Serve a recorded payload for an endpoint.
+
+        Args:
+            payload: Decoded response (with ``resource`` naming the endpoint)
+            endpoint: Endpoint name (default: payload["resource"])
+
+        Raises:
+            ValueError: If the endpoint cannot be determined
+        """
+        endpoint = endpoint or payload.get("resource")
+        if not endpoint:
+            raise ValueError("Template payload has no 'resource'; pass endpoint")
+        with self._lock:
+            self._templates[endpoint] = payload
+
+    def load_fixtures(self, directory: Union[str, Path]) -> int:
+        """Register every ``*.json`` payload under a directory as a template.
+
+        Args:
+            directory: Directory searched recursively (e.g. tests/fixtures)
+
+        Returns:
+            Number of templates loaded
+        """
+        count = 0
+        for path in sorted(Path(directory).rglob("*.json")):
+            payload = json.loads(path.read_text())
+            if isinstance(payload, dict) and payload.get("resource"):
+                self.add_template(payload)
+                count += 1
+        return count
+
+    def payload(self, endpoint: str, params: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        """Build the response for a request.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+
+        Returns:
+            Response payload with ``resource``, ``parameters`` and ``resultSets``
+
+        Raises:
+            KeyError: If the endpoint is unknown
+        """
+        params = dict(params or {})
+        template = self._templates.get(endpoint)
+        if template is not None:
+            return {**template, "parameters": params}
+
+        schema = ENDPOINT_SCHEMAS[endpoint]
+        rng = random.Random(f"{self.seed}:{endpoint}:{sorted(params.items())}")
+        echoed = {_normalize(name): value for name, value in params.items()}
+
+        result_sets = []
+        for name, models in schema:
+            columns = _columns(models)
+            count = min(1, self.rows) if name in SINGLE_ROW_SETS else self.rows
+            rows = []
+            for _ in range(count):
+                row = []
+                for header, annotation in columns:
+                    value = None
+                    if _normalize(header) in echoed:
+                        value = _coerce(echoed[_normalize(header)], annotation)
+                    if value is None:
+                        value = _synthetic_value(header, annotation, rng)
+                    row.append(value)
+                rows.append(row)
+            result_sets.append(
+                {"name": name, "headers": [header for header, _ in columns], "rowSet": rows}
+            )
+
+        return {"resource": endpoint, "parameters": params, "resultSets": result_sets}
+
+
+__all__ = ["ENDPOINT_SCHEMAS", "PayloadFactory"]
@@ -0,0 +1,330 @@
+"""A local stand-in for stats.nba.com for load and chaos testing.
+
+FakeNBAServer answers NBA Stats API requests with payloads from a
+PayloadFactory and injects the failure modes seen from the real API:
+
+- configurable latency distributions
+- random 5xx responses, 429s (with Retry-After) and hung requests
+- rate-based blocking once a client exceeds a request rate
+
+It can be used in-process as an httpx transport, which works for sync
+and async clients:
+
+    >>> server = FakeNBAServer(faults=Faults(latency=lognormal(0.2), error_rate=0.05))
+    >>> client = BaseClient(transport=server.transport(), rate_limit_interval=0.1)
+    >>> LeagueTeamStatsEndpoint(client).fetch()
+    >>> server.status_counts
+    Counter({200: 1})
+
+It is also an ASGI application, so it can be served over real sockets
+(e.g. ``uvicorn goldsberry.testing.server:app``) or mounted with
+``httpx.ASGITransport(app=server)``.
+"""
+
+import asyncio
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qsl
+
+import httpx
+
+from .payloads import PayloadFactory
+
+# Draws a latency (seconds) from a random generator
+LatencyModel = Callable[[random.Random], float]
+
+# Encoded payloads kept per server (least recently used are dropped)
+BODY_CACHE_SIZE = 256
+
+
+def constant(seconds: float) -> LatencyModel:
+    """Latency model: always the same delay."""
+
+    def model(_rng: random.Random) -> float:
+        return seconds
+
+    return model
+
+
+def uniform(low: float, high: float) -> LatencyModel:
+    """Latency model: uniformly distributed delay."""
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal(median: float, sigma: float = 0.5) -> LatencyModel:
+    """Latency model: log-normal delay with a long tail (like stats.nba.com)."""
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+@dataclass
+class Faults:
+    """Latency and failure injection settings.
+
+    Attributes:
+        latency: Latency model for every response
+        error_rate: Fraction of requests answered with a 5xx from error_statuses
+        error_statuses: Status codes used for injected server errors
+        timeout_rate: Fraction of requests that hang for hang_seconds
+        hang_seconds: How long a hung request stalls (past the client's
+            read timeout, the in-process transport raises httpx.ReadTimeout)
+        throttle_rate: Fraction of requests answered with a random 429
+        max_rate: Requests per second above which clients are blocked (None: no limit)
+        rate_window: Seconds over which the request rate is measured
+        block_seconds: How long a client stays blocked after exceeding max_rate
+        block_status: Status returned while blocked
+        retry_after: Retry-After (seconds) sent with 429s
+    """
+
+    latency: LatencyModel = field(default_factory=lambda: constant(0.0))
+    error_rate: float = 0.0
+    error_statuses: tuple[int, ...] = (500, 502, 503)
+    timeout_rate: float = 0.0
+    hang_seconds: float = 60.0
+    throttle_rate: float = 0.0
+    max_rate: Optional[float] = None
+    rate_window: float = 1.0
+    block_seconds: float = 10.0
+    block_status: int = 429
+    retry_after: Optional[float] = 1.0
+
+
+@dataclass(frozen=True)
+class FakeResponse:
+    """What the server decided to do with a request.
+
+    Attributes:
+        status_code: Response status
+        body: Response body
+        headers: Response headers
+        delay: Seconds to wait before responding
+        hang: Whether the request hangs instead of responding normally
+    """
+
+    status_code: int
+    body: bytes = b""
+    headers: dict[str, str] = field(default_factory=dict)
+    delay: float = 0.0
+    hang: bool = False
+
+
+class FakeNBAServer:
+    """Stand-in NBA Stats API with latency and fault injection."""
+
+    def __init__(
+        self,
+        payloads: Optional[PayloadFactory] = None,
+        faults: Optional[Faults] = None,
+        seed: Optional[int] = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize server.
+
+        Args:
+            payloads: Payload source (synthetic PayloadFactory if None)
+            faults: Latency and failure injection (none if None)
+            seed: Seed for latency and fault draws (None: nondeterministic)
+            clock: Monotonic time source used for rate-based blocking
+        """
+        self.payloads = payloads or PayloadFactory()
+        self.faults = faults or Faults()
+        self._rng = random.Random(seed)  # noqa: S311 - not cryptographic
+        self._clock = clock
+        self._recent: deque[float] = deque()
+        self._blocked_until = 0.0
+        self._bodies: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self.status_counts: Counter[int] = Counter()
+
+    @property
+    def requests(self) -> int:
+        """Total requests received."""
+        return sum(self.status_counts.values())
+
+    def reset(self) -> None:
+        """Clear counters and rate-limit state."""
+        with self._lock:
+            self._recent.clear()
+            self._blocked_until = 0.0
+            self.status_counts.clear()
+
+    def _rate_limited(self, now: float) -> bool:
+        """Record a request and check rate-based blocking (lock held)."""
+        faults = self.faults
+        if faults.max_rate is None:
+            return False
+        if now < self._blocked_until:
+            return True
+
+        self._recent.append(now)
+        while self._recent and self._recent[0] <= now - faults.rate_window:
+            self._recent.popleft()
+        if len(self._recent) > faults.max_rate * faults.rate_window:
+            self._blocked_until = now + faults.block_seconds
+            self._recent.clear()
+            return True
+        return False
+
+    def _body(self, endpoint: str, params: dict[str, str]) -> Optional[bytes]:
+        """Encoded payload for a request, or None for unknown endpoints (lock held)."""
+        key = (endpoint, json.dumps(sorted(params.items())))
+        body = self._bodies.get(key)
+        if body is not None:
+            self._bodies.move_to_end(key)
+            return body
+
+        try:
+            payload = self.payloads.payload(endpoint, params)
+        except KeyError:
+            return None
+        body = json.dumps(payload).encode()
+        self._bodies[key] = body
+        if len(self._bodies) > BODY_CACHE_SIZE:
+            self._bodies.popitem(last=False)
+        return body
+
+    def respond(self, method: str, path: str, params: dict[str, str]) -> FakeResponse:
+        """Decide the response to a request.
+
+        Args:
+            method: HTTP method
+            path: URL path (the last segment names the endpoint)
+            params: Query parameters
+
+        Returns:
+            The response to send (after ``delay``), or a hang
+        """
+        faults = self.faults
+        endpoint = path.rstrip("/").rsplit("/", 1)[-1]
+        retry_headers = {}
+        if faults.retry_after is not None:
+            retry_headers["Retry-After"] = f"{faults.retry_after:g}"
+
+        with self._lock:
+            delay = max(0.0, faults.latency(self._rng))
+            roll = self._rng.random()
+            blocked = self._rate_limited(self._clock())
+
+            if blocked:
+                response = FakeResponse(faults.block_status, headers=retry_headers, delay=delay)
+            elif roll < faults.timeout_rate:
+                response = FakeResponse(504, delay=faults.hang_seconds, hang=True)
+            elif roll < faults.timeout_rate + faults.error_rate:
+                status = self._rng.choice(faults.error_statuses)
+                response = FakeResponse(status, body=b"Internal Server Error", delay=delay)
+            elif roll < faults.timeout_rate + faults.error_rate + faults.throttle_rate:
+                response = FakeResponse(429, headers=retry_headers, delay=delay)
+            else:
+                body = self._body(endpoint, params) if method in ("GET", "HEAD") else None
+                if body is None:
+                    response = FakeResponse(404, body=b"Not Found", delay=delay)
+                else:
+                    response = FakeResponse(
+                        200,
+                        body=body,
+                        headers={"Content-Type": "application/json; charset=utf-8"},
+                        delay=delay,
+                    )
+            self.status_counts[response.status_code] += 1
+        return response
+
+    def transport(self) -> "FakeTransport":
+        """In-process httpx transport (sync and async) backed by this server."""
+        return FakeTransport(self)
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        """ASGI entry point."""
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        params = dict(parse_qsl(scope.get("query_string", b"").decode()))
+        response = self.respond(scope["method"], scope["path"], params)
+        if response.delay > 0:
+            await asyncio.sleep(response.delay)
+
+        headers = [
+            (name.lower().encode(), value.encode()) for name, value in response.headers.items()
+        ]
+        await send(
+            {"type": "http.response.start", "status": response.status_code, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": response.body})
+
+
+class FakeTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """httpx transport that sends requests to a FakeNBAServer in-process."""
+
+    def __init__(self, server: FakeNBAServer) -> None:
+        """Initialize transport.
+
+        Args:
+            server: Server answering the requests
+        """
+        self.server = server
+
+    def _decide(self, request: httpx.Request) -> tuple[FakeResponse, float, bool]:
+        """Server response, seconds to wait, and whether to raise a timeout."""
+        response = self.server.respond(
+            request.method, request.url.path, dict(request.url.params.items())
+        )
+        if not response.hang:
+            return response, response.delay, False
+
+        read_timeout = request.extensions.get("timeout", {}).get("read")
+        if read_timeout is not None and read_timeout <= response.delay:
+            return response, read_timeout, True
+        return response, response.delay, False
+
+    @staticmethod
+    def _build(request: httpx.Request, response: FakeResponse, timed_out: bool) -> httpx.Response:
+        """Turn the server's decision into an httpx response (or timeout)."""
+        if timed_out:
+            raise httpx.ReadTimeout("Fake server did not respond", request=request)
+        return httpx.Response(
+            response.status_code, headers=response.headers, content=response.body, request=request
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer a sync request."""
+        response, wait, timed_out = self._decide(request)
+        if wait > 0:
+            time.sleep(wait)
+        return self._build(request, response, timed_out)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer an async request."""
+        response, wait, timed_out = self._decide(request)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return self._build(request, response, timed_out)
+
+
+# Default ASGI app (``uvicorn goldsberry.testing.server:app``)
+app = FakeNBAServer(seed=None)
+
+__all__ = [
+    "BODY_CACHE_SIZE",
+    "FakeNBAServer",
+    "FakeResponse",
+    "FakeTransport",
+    "Faults",
+    "LatencyModel",
+    "app",
+    "constant",
+    "lognormal",
+    "uniform",
+]
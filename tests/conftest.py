@@ -67,3 +67,36 @@ def mock_client_response(monkeypatch):
         monkeypatch.setattr(BaseClient, "get_async", mock_get_async)
 
     return _mock
+
+
+@pytest.fixture
+def mock_transport_client():
+    """Factory fixture to build a BaseClient backed by an httpx.MockTransport.
+
+    Usage:
+        def test_client(mock_transport_client):
+            client = mock_transport_client(lambda request: httpx.Response(200, json={}))
+            client.get("commonallplayers")
+    """
+    import httpx
+
+    from goldsberry.client.base import BaseClient
+
+    def _build(handler, **client_kwargs: Any) -> BaseClient:
+        """Create a client whose HTTP calls are answered by handler.
+
+        Args:
+            handler: Callable taking an httpx.Request and returning an httpx.Response
+            **client_kwargs: Extra BaseClient arguments
+
+        Returns:
+            BaseClient with mocked sync and async transports
+        """
+        client_kwargs.setdefault("rate_limit_interval", 0)
+        client = BaseClient(**client_kwargs)
+        transport = httpx.MockTransport(handler)
+        client._sync_client = httpx.Client(transport=transport, headers=client.headers)
+        client._async_client = httpx.AsyncClient(transport=transport, headers=client.headers)
+        return client
+
+    return _build
@@ -0,0 +1,89 @@
+"""Tests for batched requests."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from goldsberry.client.exceptions import ConfigurationError, NotFoundError
+
+
+def game_handler(request):
+    """Return 404 for game "bad", a small payload otherwise."""
+    game_id = request.url.params.get("GameID")
+    if game_id == "bad":
+        return httpx.Response(404)
+    return httpx.Response(200, json={"game": game_id})
+
+
+def batch(*game_ids):
+    """Build boxscore batch requests."""
+    return [("boxscoretraditionalv2", {"GameID": gid}) for gid in game_ids]
+
+
+class TestGetManyAsync:
+    """Tests for BaseClient.get_many_async."""
+
+    async def test_yields_every_result(self, mock_transport_client):
+        """Test each request yields exactly one result."""
+        client = mock_transport_client(game_handler)
+        results = [r async for r in client.get_many_async(batch("1", "2", "3"))]
+
+        assert sorted(r.index for r in results) == [0, 1, 2]
+        assert all(r.ok for r in results)
+        assert {r.data["game"] for r in results} == {"1", "2", "3"}
+
+    async def test_per_item_errors(self, mock_transport_client):
+        """Test failures are reported per item without failing the batch."""
+        client = mock_transport_client(game_handler)
+        results = {r.index: r async for r in client.get_many_async(batch("1", "bad", "3"))}
+
+        assert results[0].ok and results[2].ok
+        assert not results[1].ok
+        assert isinstance(results[1].error, NotFoundError)
+        assert results[1].data is None
+
+    async def test_respects_concurrency(self, mock_transport_client):
+        """Test no more than `concurrency` requests are in flight."""
+        active = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200, json={})
+
+        client = mock_transport_client(handler)
+        requests = batch(*(str(i) for i in range(10)))
+        results = [r async for r in client.get_many_async(requests, concurrency=3)]
+
+        assert len(results) == 10
+        assert peak == 3
+
+    async def test_accepts_bare_endpoints(self, mock_transport_client):
+        """Test endpoint names without params are accepted."""
+        client = mock_transport_client(lambda request: httpx.Response(200, json={}))
+        results = [r async for r in client.get_many_async(["commonallplayers"])]
+        assert results[0].params is None
+
+    async def test_invalid_concurrency(self, mock_transport_client):
+        """Test concurrency must be positive."""
+        client = mock_transport_client(game_handler)
+        with pytest.raises(ConfigurationError):
+            async for _ in client.get_many_async(batch("1"), concurrency=0):
+                pass
+
+
+class TestGetMany:
+    """Tests for BaseClient.get_many."""
+
+    def test_yields_results_and_errors(self, mock_transport_client):
+        """Test the threaded batch reports successes and failures."""
+        client = mock_transport_client(game_handler)
+        results = {r.index: r for r in client.get_many(batch("1", "bad"), concurrency=2)}
+
+        assert results[0].data == {"game": "1"}
+        assert isinstance(results[1].error, NotFoundError)
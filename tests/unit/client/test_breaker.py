@@ -0,0 +1,196 @@
+"""Tests for per-endpoint circuit breakers."""
+
+import httpx
+import pytest
+
+from goldsberry.client.breaker import BreakerState, CircuitBreaker, CircuitBreakerRegistry
+from goldsberry.client.exceptions import CircuitBreakerError, NotFoundError, ServerError
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def failing():
+    raise ServerError("boom", status_code=500)
+
+
+def trip(breaker):
+    """Record failures until the breaker opens."""
+    for _ in range(breaker.failure_threshold):
+        with pytest.raises(ServerError):
+            breaker.call_sync(failing)
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_threshold(self):
+        """Consecutive failures open the breaker and later calls fail fast."""
+        breaker = CircuitBreaker(failure_threshold=3, clock=FakeClock())
+        trip(breaker)
+
+        assert breaker.state is BreakerState.OPEN
+        with pytest.raises(CircuitBreakerError) as exc_info:
+            breaker.call_sync(lambda: "ok")
+        assert exc_info.value.context["breaker"] == "default"
+
+    def test_success_resets_failure_count(self):
+        """A success between failures keeps the breaker closed."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+        with pytest.raises(ServerError):
+            breaker.call_sync(failing)
+        breaker.call_sync(lambda: "ok")
+        with pytest.raises(ServerError):
+            breaker.call_sync(failing)
+
+        assert breaker.state is BreakerState.CLOSED
+
+    def test_client_errors_do_not_count(self):
+        """404s say nothing about endpoint health."""
+        breaker = CircuitBreaker(failure_threshold=1, clock=FakeClock())
+
+        def not_found():
+            raise NotFoundError("missing", url="https://example.com")
+
+        with pytest.raises(NotFoundError):
+            breaker.call_sync(not_found)
+        assert breaker.state is BreakerState.CLOSED
+
+    def test_half_open_allows_single_probe(self):
+        """After reset_timeout only one probe is admitted."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        trip(breaker)
+        clock.now = 10
+
+        assert breaker.state is BreakerState.HALF_OPEN
+        breaker.before_call()
+        with pytest.raises(CircuitBreakerError):
+            breaker.before_call()
+
+    def test_probe_success_closes(self):
+        """A successful probe closes the breaker."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        trip(breaker)
+        clock.now = 10
+
+        assert breaker.call_sync(lambda: "ok") == "ok"
+        assert breaker.state is BreakerState.CLOSED
+        assert breaker.failure_count == 0
+
+    def test_probe_failure_reopens(self):
+        """A failed probe re-opens the breaker for another reset_timeout."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=clock)
+        trip(breaker)
+        clock.now = 10
+        with pytest.raises(ServerError):
+            breaker.call_sync(failing)
+
+        assert breaker.state is BreakerState.OPEN
+        clock.now = 19
+        assert breaker.is_open
+        clock.now = 20
+        assert breaker.state is BreakerState.HALF_OPEN
+
+    async def test_async_call(self):
+        """Async calls are guarded the same way."""
+        breaker = CircuitBreaker(failure_threshold=1, clock=FakeClock())
+
+        async def afailing():
+            failing()
+
+        with pytest.raises(ServerError):
+            await breaker.call(afailing)
+        with pytest.raises(CircuitBreakerError):
+            await breaker.call(afailing)
+
+
+class TestCircuitBreakerRegistry:
+    """Tests for CircuitBreakerRegistry."""
+
+    def test_one_breaker_per_endpoint(self):
+        """Breakers are created lazily and reused per endpoint."""
+        registry = CircuitBreakerRegistry()
+        assert registry.get("a") is registry.get("a", {"Season": "2024-25"})
+        assert registry.get("a") is not registry.get("b")
+
+    def test_keyed_by_season(self):
+        """by_endpoint_and_season separates breakers by Season."""
+        registry = CircuitBreakerRegistry(key=CircuitBreakerRegistry.by_endpoint_and_season)
+        first = registry.get("a", {"Season": "2023-24"})
+        second = registry.get("a", {"Season": "2024-25"})
+
+        assert first is not second
+        assert first.name == "a:2023-24"
+        assert registry.get("a").name == "a"
+
+    def test_states(self):
+        """states() reports every breaker."""
+        registry = CircuitBreakerRegistry(failure_threshold=1)
+        registry.get("a")
+        trip(registry.get("b"))
+        assert registry.states() == {"a": BreakerState.CLOSED, "b": BreakerState.OPEN}
+
+
+class TestClientBreakers:
+    """Tests for circuit breakers in BaseClient."""
+
+    @staticmethod
+    def handler(request):
+        if "broken" in request.url.path:
+            return httpx.Response(500)
+        return httpx.Response(200, json={"ok": True})
+
+    def test_sync_path_uses_breaker(self, mock_transport_client):
+        """get() fails fast once the endpoint's breaker is open."""
+        client = mock_transport_client(
+            self.handler,
+            max_retries=0,
+            circuit_breakers=CircuitBreakerRegistry(failure_threshold=2),
+        )
+        for _ in range(2):
+            with pytest.raises(ServerError):
+                client.get("broken")
+
+        with pytest.raises(CircuitBreakerError):
+            client.get("broken")
+
+    def test_open_breaker_does_not_block_other_endpoints(self, mock_transport_client):
+        """A broken endpoint does not stall healthy ones."""
+        client = mock_transport_client(
+            self.handler,
+            max_retries=0,
+            circuit_breakers=CircuitBreakerRegistry(failure_threshold=1),
+        )
+        with pytest.raises(ServerError):
+            client.get("broken")
+
+        assert client.get("healthy") == {"ok": True}
+        assert client.circuit_breakers.states()["broken"] is BreakerState.OPEN
+
+    async def test_async_path_shares_breakers(self, mock_transport_client):
+        """Sync failures open the breaker for async calls too."""
+        client = mock_transport_client(
+            self.handler,
+            max_retries=0,
+            circuit_breakers=CircuitBreakerRegistry(failure_threshold=1),
+        )
+        with pytest.raises(ServerError):
+            client.get("broken")
+
+        with pytest.raises(CircuitBreakerError):
+            await client.get_async("broken")
+
+    def test_disabled(self, mock_transport_client):
+        """enable_circuit_breaker=False skips breakers."""
+        client = mock_transport_client(self.handler, enable_circuit_breaker=False)
+        assert client.circuit_breakers is None
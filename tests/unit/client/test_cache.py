@@ -0,0 +1,226 @@
+"""Tests for response caching."""
+
+import httpx
+import pytest
+
+from goldsberry.client.cache import MemoryCache, SQLiteCache, TieredCache, make_cache_key
+from goldsberry.client.exceptions import HTTPError
+from goldsberry.enums.common import PerMode
+
+PAYLOAD = {"resource": "playercareerstats", "resultSets": []}
+
+
+@pytest.fixture
+def counting_handler():
+    """Handler that records how many requests reach the network."""
+    calls = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json=PAYLOAD)
+
+    _handler.calls = calls
+    return _handler
+
+
+class TestMakeCacheKey:
+    """Tests for canonical cache keys."""
+
+    def test_param_order_is_irrelevant(self):
+        """Test keys do not depend on parameter order."""
+        a = make_cache_key("playercareerstats", {"PlayerID": 2544, "PerMode": "Totals"})
+        b = make_cache_key("playercareerstats", {"PerMode": "Totals", "PlayerID": 2544})
+        assert a == b
+
+    def test_enums_and_strings_match(self):
+        """Test enum members canonicalize to their values."""
+        a = make_cache_key("playercareerstats", {"PerMode": PerMode.TOTALS})
+        b = make_cache_key("playercareerstats", {"PerMode": "Totals"})
+        assert a == b
+
+    def test_values_distinguish_keys(self):
+        """Test different parameter values give different keys."""
+        a = make_cache_key("playercareerstats", {"PlayerID": 2544})
+        b = make_cache_key("playercareerstats", {"PlayerID": 201939})
+        assert a != b
+
+    def test_no_params(self):
+        """Test endpoint-only keys."""
+        assert make_cache_key("/commonallplayers") == "commonallplayers"
+
+
+class TestSQLiteCache:
+    """Tests for the persistent SQLite cache."""
+
+    def test_roundtrip(self, tmp_path):
+        """Test stored bytes are returned unchanged."""
+        cache = SQLiteCache(tmp_path / "cache.sqlite")
+        cache.set("k", b'{"a": 1}')
+        entry = cache.get("k")
+        assert entry is not None
+        assert entry.body == b'{"a": 1}'
+        assert entry.expires_at is None
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test entries survive reopening the database."""
+        path = tmp_path / "cache.sqlite"
+        SQLiteCache(path).set("k", b"body")
+        assert SQLiteCache(path).get("k").body == b"body"
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        """Test entries past their TTL are not returned."""
+        cache = SQLiteCache(tmp_path / "cache.sqlite")
+        cache.set("k", b"body", ttl=-1)
+        assert cache.get("k") is None
+        assert cache.purge_expired() == 1
+        assert len(cache) == 0
+
+    def test_delete_and_clear(self):
+        """Test removing entries."""
+        cache = SQLiteCache(":memory:")
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        cache.delete("a")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestMemoryCache:
+    """Tests for the in-process LRU cache."""
+
+    def test_evicts_least_recently_used(self):
+        """Test the entry-count bound evicts the LRU entry."""
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        cache.get("a")
+        cache.set("c", b"3")
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_byte_bound(self):
+        """Test total stored bytes stay within max_bytes."""
+        cache = MemoryCache(max_bytes=10)
+        cache.set("a", b"12345")
+        cache.set("b", b"12345")
+        cache.set("c", b"123")
+        assert cache.get("a") is None
+        assert cache.total_bytes == 8
+        assert len(cache) == 2
+
+    def test_oversized_body_not_cached(self):
+        """Test bodies larger than the whole budget are skipped."""
+        cache = MemoryCache(max_bytes=4)
+        cache.set("a", b"12345")
+        assert len(cache) == 0
+
+    def test_ttl(self):
+        """Test per-entry expiry."""
+        cache = MemoryCache()
+        cache.set("fresh", b"1", ttl=60)
+        cache.set("stale", b"2", ttl=-1)
+        assert cache.get("fresh") is not None
+        assert cache.get("stale") is None
+        assert len(cache) == 1
+
+    def test_replace_updates_size(self):
+        """Test overwriting a key does not double count its bytes."""
+        cache = MemoryCache()
+        cache.set("a", b"1234")
+        cache.set("a", b"12")
+        assert cache.total_bytes == 2
+
+    def test_invalid_limits(self):
+        """Test limits must be positive."""
+        with pytest.raises(ValueError):
+            MemoryCache(max_entries=0)
+
+
+class TestTieredCache:
+    """Tests for layered caches."""
+
+    def test_promotes_hits(self):
+        """Test hits in a slow tier are copied into the fast tier."""
+        fast, slow = MemoryCache(), SQLiteCache(":memory:")
+        cache = TieredCache(fast, slow)
+        slow.set("k", b"body", ttl=60)
+
+        assert cache.get("k").body == b"body"
+        promoted = fast.get("k")
+        assert promoted is not None
+        assert promoted.expires_at is not None
+
+    def test_writes_all_tiers(self):
+        """Test writes reach every tier."""
+        fast, slow = MemoryCache(), SQLiteCache(":memory:")
+        TieredCache(fast, slow).set("k", b"body")
+        assert fast.get("k") is not None
+        assert slow.get("k") is not None
+
+
+class TestClientCaching:
+    """Tests for BaseClient cache integration."""
+
+    def test_sync_hit_skips_network(self, mock_transport_client, counting_handler):
+        """Test a repeated request is served from the cache."""
+        client = mock_transport_client(counting_handler, cache=SQLiteCache(":memory:"))
+        params = {"PlayerID": 2544, "PerMode": "Totals"}
+
+        assert client.get("playercareerstats", params) == PAYLOAD
+        assert client.get("playercareerstats", dict(reversed(params.items()))) == PAYLOAD
+        assert len(counting_handler.calls) == 1
+
+    async def test_async_shares_cache(self, mock_transport_client, counting_handler):
+        """Test async requests read entries written by sync requests."""
+        client = mock_transport_client(counting_handler, cache=SQLiteCache(":memory:"))
+        client.get("playercareerstats", {"PlayerID": 2544})
+        assert await client.get_async("playercareerstats", {"PlayerID": 2544}) == PAYLOAD
+        assert len(counting_handler.calls) == 1
+
+    def test_callable_ttl_can_skip_caching(self, mock_transport_client, counting_handler):
+        """Test a non-positive TTL disables caching for that request."""
+        client = mock_transport_client(
+            counting_handler,
+            cache=SQLiteCache(":memory:"),
+            cache_ttl=lambda endpoint, params: 0 if params["Season"] == "2024-25" else None,
+        )
+        client.get("leaguedashplayerstats", {"Season": "2024-25"})
+        client.get("leaguedashplayerstats", {"Season": "2024-25"})
+        client.get("leaguedashplayerstats", {"Season": "2015-16"})
+        client.get("leaguedashplayerstats", {"Season": "2015-16"})
+        assert len(counting_handler.calls) == 3
+
+    def test_shared_across_endpoints(self, mock_transport_client, load_fixture):
+        """Test endpoint objects sharing a client share its cache."""
+        from goldsberry.endpoints.league import LeagueTeamStatsEndpoint
+
+        calls = []
+        payload = load_fixture("league/team_stats_response.json")
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json=payload)
+
+        client = mock_transport_client(handler, cache=MemoryCache(), cache_ttl=60)
+        first = LeagueTeamStatsEndpoint(client).fetch(season="2023-24")
+        second = LeagueTeamStatsEndpoint(client).fetch(season="2023-24")
+        assert first == second
+        assert len(calls) == 1
+
+    def test_corrupt_entry_is_refetched(self, mock_transport_client, counting_handler):
+        """Test undecodable cache entries fall through to the network."""
+        cache = SQLiteCache(":memory:")
+        cache.set(make_cache_key("playercareerstats"), b"not json")
+        client = mock_transport_client(counting_handler, cache=cache)
+        assert client.get("playercareerstats") == PAYLOAD
+        assert len(counting_handler.calls) == 1
+
+    def test_errors_are_not_cached(self, mock_transport_client):
+        """Test failed responses are never stored."""
+        cache = SQLiteCache(":memory:")
+        client = mock_transport_client(lambda request: httpx.Response(400), cache=cache)
+        with pytest.raises(HTTPError):
+            client.get("playercareerstats")
+        assert len(cache) == 0
@@ -0,0 +1,142 @@
+"""Tests for record/replay cassettes."""
+
+import gzip
+import json
+import time
+
+import httpx
+import pytest
+
+from goldsberry.client.base import BaseClient
+from goldsberry.client.cassette import (
+    AsyncRecordingTransport,
+    Cassette,
+    CassetteMode,
+    RecordingTransport,
+    request_key,
+)
+from goldsberry.client.exceptions import CassetteError, ServerError
+from goldsberry.endpoints.player.career_stats import CareerStatsEndpoint
+
+BASE_URL = "https://stats.nba.com/stats/"
+
+
+def gzip_handler(request):
+    """Live-server stand-in returning a gzip-compressed JSON body."""
+    body = gzip.compress(json.dumps({"path": request.url.path}).encode())
+    return httpx.Response(200, headers={"content-encoding": "gzip", "x-test": "1"}, content=body)
+
+
+def replay_client(cassette, **kwargs):
+    """BaseClient replaying from cassette, without rate limiting."""
+    return BaseClient(cassette=cassette, rate_limit_interval=0, **kwargs)
+
+
+class TestRequestKey:
+    """Tests for request_key."""
+
+    def test_query_order_ignored(self):
+        """Query parameter order does not affect matching."""
+        assert request_key("get", f"{BASE_URL}x?b=2&a=1") == request_key(
+            "GET", f"{BASE_URL}x?a=1&b=2"
+        )
+
+
+class TestRecording:
+    """Tests for record mode."""
+
+    def test_records_compressed_body(self, tmp_path):
+        """Responses are captured as sent on the wire and saved on close."""
+        path = tmp_path / "cassette.json"
+        cassette = Cassette(path, mode=CassetteMode.RECORD)
+        transport = RecordingTransport(cassette, httpx.MockTransport(gzip_handler))
+        with httpx.Client(transport=transport) as client:
+            response = client.get(f"{BASE_URL}commonallplayers", params={"Season": "2024-25"})
+            assert response.json() == {"path": "/stats/commonallplayers"}
+
+        saved = Cassette(path)
+        assert len(saved) == 1
+        interaction = saved.interactions[0]
+        assert gzip.decompress(interaction.body)
+        assert ("x-test", "1") in interaction.headers
+        assert interaction.elapsed >= 0
+
+    async def test_records_async(self, tmp_path):
+        """The async recording transport captures responses too."""
+        path = tmp_path / "cassette.json"
+        cassette = Cassette(path, mode="record")
+        transport = AsyncRecordingTransport(cassette, httpx.MockTransport(gzip_handler))
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get(f"{BASE_URL}commonallplayers")
+
+        assert len(Cassette(path)) == 1
+
+    def test_invalid_file(self, tmp_path):
+        """Corrupt cassette files raise CassetteError."""
+        path = tmp_path / "cassette.json"
+        path.write_text("not json")
+        with pytest.raises(CassetteError):
+            Cassette(path)
+
+
+class TestReplay:
+    """Tests for replay mode."""
+
+    def test_round_trip(self, tmp_path):
+        """A recorded cassette replays through BaseClient without network."""
+        path = tmp_path / "cassette.json"
+        cassette = Cassette(path, mode="record")
+        transport = RecordingTransport(cassette, httpx.MockTransport(gzip_handler))
+        with httpx.Client(transport=transport) as client:
+            client.get(f"{BASE_URL}commonallplayers", params={"Season": "2024-25", "A": 1})
+
+        with replay_client(Cassette(path)) as client:
+            data = client.get("commonallplayers", {"A": 1, "Season": "2024-25"})
+        assert data == {"path": "/stats/commonallplayers"}
+
+    def test_unrecorded_request(self, tmp_path):
+        """Requests missing from the cassette raise CassetteError."""
+        client = replay_client(Cassette(tmp_path / "empty.json"))
+        with pytest.raises(CassetteError):
+            client.get("commonallplayers")
+
+    def test_misses_do_not_trip_breaker(self, tmp_path):
+        """Replay misses are not counted as endpoint failures."""
+        client = replay_client(Cassette(tmp_path / "empty.json"))
+        for _ in range(10):
+            with pytest.raises(CassetteError):
+                client.get("commonallplayers")
+        assert client.circuit_breakers.get("commonallplayers").failure_count == 0
+
+    def test_responses_served_in_order(self, tmp_path):
+        """Repeated requests replay in recorded order, repeating the last."""
+        cassette = Cassette(tmp_path / "cassette.json")
+        url = f"{BASE_URL}leaguedashteamstats"
+        cassette.add_json(url, {}, status_code=500)
+        cassette.add_json(url, {"ok": True})
+
+        client = replay_client(cassette, max_retries=0)
+        with pytest.raises(ServerError):
+            client.get("leaguedashteamstats")
+        assert client.get("leaguedashteamstats") == {"ok": True}
+        assert client.get("leaguedashteamstats") == {"ok": True}
+
+    async def test_replays_latency(self, tmp_path):
+        """latency_scale reproduces recorded timing."""
+        cassette = Cassette(tmp_path / "cassette.json", latency_scale=1.0)
+        cassette.add_json(f"{BASE_URL}leaguedashteamstats", {}, elapsed=0.1)
+
+        start = time.perf_counter()
+        await replay_client(cassette).get_async("leaguedashteamstats")
+        assert time.perf_counter() - start >= 0.1
+
+    def test_fixture_as_cassette(self, tmp_path, load_fixture):
+        """Test fixtures can be loaded into a cassette and parsed by endpoints."""
+        cassette = Cassette(tmp_path / "cassette.json")
+        url = httpx.URL(
+            f"{BASE_URL}playercareerstats", params={"PlayerID": 203999, "PerMode": "Totals"}
+        )
+        cassette.add_json(str(url), load_fixture("player/career_stats_response.json"))
+
+        stats = CareerStatsEndpoint(replay_client(cassette)).fetch(player_id=203999)
+        assert stats.season_totals_regular
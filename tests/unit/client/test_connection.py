@@ -0,0 +1,89 @@
+"""Tests for connection pooling and warm-up configuration."""
+
+import httpx
+import pytest
+
+from goldsberry.client.base import BaseClient
+from goldsberry.client.exceptions import ConfigurationError
+
+
+class TestConnectionConfig:
+    """Tests for pool and timeout settings."""
+
+    def test_defaults(self):
+        """Test defaults match httpx's pool and the overall timeout."""
+        client = BaseClient(timeout=20)
+        assert client.limits.max_connections == 100
+        assert client.limits.max_keepalive_connections == 20
+        assert client.timeouts.connect == 20
+        assert client.timeouts.pool == 20
+        assert client.http2 is False
+
+    def test_pool_and_timeout_split(self):
+        """Test pool sizing and per-phase timeouts are applied."""
+        client = BaseClient(
+            max_connections=8,
+            max_keepalive_connections=8,
+            keepalive_expiry=60,
+            connect_timeout=3,
+            read_timeout=45,
+        )
+        assert client.limits.max_connections == 8
+        assert client.limits.keepalive_expiry == 60
+        assert client.timeouts.connect == 3
+        assert client.timeouts.read == 45
+        assert client.timeouts.write == 30
+
+        http_client = client._get_sync_client()
+        assert http_client.timeout.connect == 3
+
+    def test_invalid_settings(self):
+        """Test invalid pool and timeout settings are rejected."""
+        with pytest.raises(ConfigurationError):
+            BaseClient(max_connections=0)
+        with pytest.raises(ConfigurationError):
+            BaseClient(read_timeout=-1)
+
+    def test_http2_requires_h2(self, monkeypatch):
+        """Test HTTP/2 needs the optional h2 package."""
+        monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+        with pytest.raises(ConfigurationError, match="http2"):
+            BaseClient(http2=True)
+
+
+class TestWarmUp:
+    """Tests for connection warm-up."""
+
+    def test_sync_warm_up(self, mock_transport_client):
+        """Test warm-up sends HEAD requests to the host root."""
+        seen = []
+
+        def handler(request):
+            seen.append((request.method, str(request.url)))
+            return httpx.Response(200)
+
+        client = mock_transport_client(handler)
+        assert client.warm_up(3) == 3
+        assert seen == [("HEAD", "https://stats.nba.com/")] * 3
+
+    def test_warm_up_respects_rate_limit(self, mock_transport_client):
+        """Test warm-up takes limiter tokens and is capped at the burst."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.method)
+            return httpx.Response(200)
+
+        client = mock_transport_client(handler, rate_limit_interval=60, rate_limit_burst=2)
+        assert client.warm_up(5) == 2
+        assert seen == ["HEAD", "HEAD"]
+        assert not client.rate_limiter.try_acquire()
+
+    async def test_async_warm_up_ignores_failures(self, mock_transport_client):
+        """Test failed warm-up requests are counted, not raised."""
+
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        client = mock_transport_client(handler)
+        assert await client.warm_up_async(2) == 0
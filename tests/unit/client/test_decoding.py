@@ -0,0 +1,87 @@
+"""Tests for JSON decoders."""
+
+import json
+
+import httpx
+import pytest
+
+from goldsberry.client.base import BaseClient
+from goldsberry.client.decoding import (
+    default_decoder,
+    has_orjson,
+    orjson_decoder,
+    stdlib_decoder,
+)
+from goldsberry.client.exceptions import ParseError
+from goldsberry.client.metrics import ClientMetrics
+
+requires_orjson = pytest.mark.skipif(not has_orjson(), reason="orjson not installed")
+
+PAYLOAD = {"resultSets": [{"name": "PlayerStats", "headers": ["PLAYER_ID"], "rowSet": [[1]]}]}
+
+
+class TestDecoders:
+    """Tests for the decoder functions."""
+
+    def test_stdlib(self):
+        """The stdlib decoder parses bytes, including UTF-16."""
+        assert stdlib_decoder(json.dumps(PAYLOAD).encode()) == PAYLOAD
+        assert stdlib_decoder('{"name": "Dončić"}'.encode("utf-16")) == {"name": "Dončić"}
+
+    @requires_orjson
+    def test_orjson_matches_stdlib(self, load_fixture):
+        """orjson and the stdlib produce identical payloads."""
+        body = json.dumps(load_fixture("league/player_stats_response.json")).encode()
+        assert orjson_decoder()(body) == stdlib_decoder(body)
+
+    @requires_orjson
+    def test_orjson_falls_back(self):
+        """Input orjson rejects but the stdlib accepts is decoded by the stdlib."""
+        assert (
+            orjson_decoder()(b'{"value": NaN, "big": 123456789012345678901234567890}')["big"]
+            == 123456789012345678901234567890
+        )
+
+    def test_invalid_json_raises_value_error(self):
+        """Every decoder reports invalid JSON as ValueError."""
+        with pytest.raises(ValueError):
+            default_decoder()(b"<html>blocked</html>")
+
+
+class TestClientDecoding:
+    """Tests for decoding in BaseClient."""
+
+    def test_custom_decoder(self, mock_transport_client):
+        """The client hands raw body bytes to its json_decoder."""
+        bodies = []
+
+        def decoder(content):
+            bodies.append(content)
+            return json.loads(content)
+
+        client = mock_transport_client(
+            lambda request: httpx.Response(200, json=PAYLOAD), json_decoder=decoder
+        )
+        assert client.get("playergamelog") == PAYLOAD
+        assert isinstance(bodies[0], bytes)
+
+    def test_default_decoder(self):
+        """Clients use the fastest available decoder by default."""
+        assert (BaseClient().json_decoder is stdlib_decoder) is not has_orjson()
+
+    def test_parse_error(self, mock_transport_client):
+        """Undecodable bodies raise ParseError."""
+        client = mock_transport_client(lambda request: httpx.Response(200, text="<html>"))
+        with pytest.raises(ParseError):
+            client.get("playergamelog")
+
+    def test_decode_time_reported(self, mock_transport_client):
+        """Decode time is recorded per request."""
+        metrics = ClientMetrics()
+        client = mock_transport_client(
+            lambda request: httpx.Response(200, json=PAYLOAD), metrics=metrics
+        )
+        client.get("playergamelog")
+
+        (series,) = metrics.snapshot()["histograms"]["decode_duration_seconds"]
+        assert series["count"] == 1
@@ -0,0 +1,128 @@
+"""Tests for hedged requests."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from goldsberry.client.hedging import HedgePolicy, LatencyTracker
+from goldsberry.client.ratelimit import RateLimiter
+
+
+def warmed_policy(endpoint="boxscoretraditionalv2", latency=0.01, **kwargs):
+    """Hedge policy that already has enough samples for endpoint."""
+    kwargs.setdefault("min_samples", 5)
+    policy = HedgePolicy(**kwargs)
+    for _ in range(kwargs["min_samples"]):
+        policy.record(endpoint, latency)
+    return policy
+
+
+def slow_first_handler(slow=1.0):
+    """Async handler whose first request hangs and later ones are fast."""
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            await asyncio.sleep(slow)
+            return httpx.Response(200, json={"copy": "primary"})
+        return httpx.Response(200, json={"copy": "hedge"})
+
+    handler.calls = calls
+    return handler
+
+
+class TestLatencyTracker:
+    """Tests for LatencyTracker."""
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        tracker = LatencyTracker()
+        for value in range(1, 101):
+            tracker.record("e", value / 100)
+        assert tracker.percentile("e", 0.95) == pytest.approx(0.95)
+        assert tracker.percentile("e", 0.5) == pytest.approx(0.5)
+        assert tracker.percentile("other", 0.5) is None
+
+    def test_window(self):
+        """Test only the most recent samples are kept."""
+        tracker = LatencyTracker(window=3)
+        for value in [10, 1, 1, 1]:
+            tracker.record("e", value)
+        assert tracker.percentile("e", 1.0) == 1
+
+
+class TestHedgePolicy:
+    """Tests for HedgePolicy."""
+
+    def test_no_hedge_without_samples(self):
+        """Test endpoints are not hedged until min_samples are seen."""
+        policy = HedgePolicy(min_samples=3)
+        policy.record("e", 0.2)
+        assert policy.delay_for("e") is None
+
+    def test_delay_clamped(self):
+        """Test the delay is clamped to [min_delay, max_delay]."""
+        assert warmed_policy("e", 0.001, min_delay=0.05).delay_for("e") == 0.05
+        assert warmed_policy("e", 10.0, max_delay=2.0).delay_for("e") == 2.0
+
+    def test_invalid_percentile(self):
+        """Test percentile must be in (0, 1]."""
+        with pytest.raises(ValueError):
+            HedgePolicy(percentile=0)
+
+
+class TestClientHedging:
+    """Tests for hedging in BaseClient.get_async."""
+
+    async def test_slow_request_is_hedged(self, mock_transport_client):
+        """Test a hedge is sent and its faster response wins."""
+        handler = slow_first_handler()
+        client = mock_transport_client(handler, hedging=warmed_policy())
+
+        start = time.monotonic()
+        data = await client.get_async("boxscoretraditionalv2", {"GameID": "1"})
+
+        assert data == {"copy": "hedge"}
+        assert len(handler.calls) == 2
+        assert time.monotonic() - start < 0.5
+
+    async def test_fast_request_not_hedged(self, mock_transport_client):
+        """Test requests finishing before the hedge delay send one copy."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={})
+
+        client = mock_transport_client(handler, hedging=warmed_policy(latency=0.5))
+        await client.get_async("boxscoretraditionalv2")
+        assert len(calls) == 1
+
+    async def test_hedge_respects_rate_budget(self, mock_transport_client):
+        """Test no hedge is sent when the limiter has no spare token."""
+        handler = slow_first_handler(slow=0.2)
+        client = mock_transport_client(
+            handler,
+            hedging=warmed_policy(),
+            rate_limiter=RateLimiter(min_interval=60),
+        )
+        data = await client.get_async("boxscoretraditionalv2")
+        assert data == {"copy": "primary"}
+        assert len(handler.calls) == 1
+
+    async def test_failed_hedge_falls_back_to_primary(self, mock_transport_client):
+        """Test a failing hedge does not fail a primary that succeeds."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                await asyncio.sleep(0.2)
+                return httpx.Response(200, json={"copy": "primary"})
+            return httpx.Response(404)
+
+        client = mock_transport_client(handler, hedging=warmed_policy())
+        assert await client.get_async("boxscoretraditionalv2") == {"copy": "primary"}
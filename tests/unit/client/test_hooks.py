@@ -0,0 +1,206 @@
+"""Tests for client event hooks."""
+
+import httpx
+import pytest
+
+from goldsberry.client.breaker import BreakerState, CircuitBreaker, CircuitBreakerRegistry
+from goldsberry.client.cache import MemoryCache
+from goldsberry.client.exceptions import NetworkError, ServerError
+from goldsberry.client.hooks import ClientHooks
+from goldsberry.client.ratelimit import RateLimiter
+
+PAYLOAD = {"resultSets": [{"name": "PlayerStats", "headers": ["PLAYER_ID"], "rowSet": [[1]]}]}
+
+
+def flaky_handler(failures):
+    """Mock transport handler returning 500 for the first `failures` requests."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) <= failures:
+            return httpx.Response(500, text="boom")
+        return httpx.Response(200, json=PAYLOAD)
+
+    return handler
+
+
+class TestClientHooks:
+    """Tests for ClientHooks."""
+
+    def test_add_and_remove(self):
+        """Hooks register per event and can be removed."""
+        hooks = ClientHooks()
+        assert not hooks
+
+        def hook(event):
+            pass
+
+        assert hooks.add("request", hook) is hook
+        assert "request" in hooks
+        assert "response" not in hooks
+
+        hooks.remove("request", hook)
+        assert "request" not in hooks
+
+    def test_unknown_event(self):
+        """Unknown event names are rejected."""
+        with pytest.raises(ValueError, match="Unknown hook event"):
+            ClientHooks().add("requets", print)
+
+    def test_failing_hook_is_logged(self, caplog):
+        """A hook raising does not stop the other hooks."""
+        hooks = ClientHooks()
+        seen = []
+
+        def broken(event):
+            raise RuntimeError("oops")
+
+        hooks.add("request", broken)
+        hooks.add("request", seen.append)
+        hooks.emit("request", "event")
+
+        assert seen == ["event"]
+        assert "request hook" in caplog.text
+
+    def test_async_hook_without_loop_is_skipped(self):
+        """Coroutine hooks emitted from sync code without a loop are skipped."""
+        hooks = ClientHooks()
+        seen = []
+
+        async def hook(event):
+            seen.append(event)
+
+        hooks.add("request", hook)
+        hooks.emit("request", "event")
+        assert seen == []
+
+    async def test_emit_async_awaits(self):
+        """emit_async awaits coroutine hooks and calls plain ones."""
+        hooks = ClientHooks()
+        seen = []
+
+        async def async_hook(event):
+            seen.append(("async", event))
+
+        hooks.add("retry", async_hook)
+        hooks.add("retry", lambda event: seen.append(("sync", event)))
+        await hooks.emit_async("retry", 1)
+
+        assert seen == [("async", 1), ("sync", 1)]
+
+
+class TestClientIntegration:
+    """Tests for hooks fired by BaseClient."""
+
+    def test_request_response_retry(self, mock_transport_client):
+        """Sync requests fire request, response and retry hooks in order."""
+        client = mock_transport_client(flaky_handler(1))
+        client.retry_policy.base_delay = 0
+        seen = []
+
+        @client.on_request
+        def on_request(event):
+            event.context["span"] = len(seen)
+            seen.append(("request", event.endpoint))
+
+        client.on_response(lambda e: seen.append(("response", e.status_code, e.request.context)))
+        client.on_retry(lambda e: seen.append(("retry", e.attempt, type(e.error))))
+
+        client.get("playergamelog")
+
+        assert seen == [
+            ("request", "playergamelog"),
+            ("response", 500, {"span": 0}),
+            ("retry", 1, ServerError),
+            ("request", "playergamelog"),
+            ("response", 200, {"span": 3}),
+        ]
+
+    async def test_async_hooks(self, mock_transport_client):
+        """Async requests await coroutine hooks, including for transport errors."""
+
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        client = mock_transport_client(handler, max_retries=0)
+        responses = []
+
+        async def on_response(event):
+            responses.append(event)
+
+        client.on_response(on_response)
+        with pytest.raises(NetworkError):
+            await client.get_async("playergamelog")
+
+        (event,) = responses
+        assert event.status_code is None
+        assert isinstance(event.error, NetworkError)
+
+    def test_rate_limit_wait(self, mock_transport_client):
+        """Rate limiter delays are reported."""
+        client = mock_transport_client(
+            flaky_handler(0), rate_limiter=RateLimiter(min_interval=0.02)
+        )
+        waits = []
+        client.on_rate_limit_wait(waits.append)
+
+        client.get("playergamelog", {"PlayerID": 1})
+        client.get("playergamelog", {"PlayerID": 2})
+
+        assert len(waits) == 1
+        assert waits[0].seconds > 0
+
+    def test_cache_hit(self, mock_transport_client):
+        """Cache hits are reported with their kind."""
+        client = mock_transport_client(flaky_handler(0), cache=MemoryCache())
+        hits = []
+        client.on_cache_hit(hits.append)
+
+        client.get("playergamelog")
+        client.get("playergamelog")
+
+        assert [(hit.endpoint, hit.kind) for hit in hits] == [("playergamelog", "fresh")]
+
+    def test_breaker_change(self, mock_transport_client):
+        """Breaker transitions are reported."""
+        client = mock_transport_client(
+            flaky_handler(100),
+            max_retries=0,
+            circuit_breakers=CircuitBreakerRegistry(failure_threshold=1),
+        )
+        changes = []
+        client.on_breaker_change(changes.append)
+
+        with pytest.raises(ServerError):
+            client.get("playergamelog")
+
+        (change,) = changes
+        assert change.breaker == "playergamelog"
+        assert (change.old_state, change.new_state) == (BreakerState.CLOSED, BreakerState.OPEN)
+
+
+class TestBreakerListener:
+    """Tests for circuit breaker change listeners."""
+
+    def test_transitions(self):
+        """Every transition, including OPEN -> HALF_OPEN, is reported once."""
+        now = [0.0]
+        changes = []
+        breaker = CircuitBreaker(
+            failure_threshold=1,
+            reset_timeout=10,
+            clock=lambda: now[0],
+            on_change=lambda name, old, new: changes.append((old, new)),
+        )
+
+        breaker.record_failure()
+        now[0] = 10
+        breaker.before_call()
+        breaker.record_success()
+
+        assert changes == [
+            (BreakerState.CLOSED, BreakerState.OPEN),
+            (BreakerState.OPEN, BreakerState.HALF_OPEN),
+            (BreakerState.HALF_OPEN, BreakerState.CLOSED),
+        ]
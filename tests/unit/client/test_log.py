@@ -0,0 +1,66 @@
+"""Tests for lazy request logging."""
+
+import logging
+from unittest.mock import Mock
+
+import httpx
+
+from goldsberry.client.exceptions import NetworkError
+from goldsberry.client.log import log_debug, log_request, log_response
+
+logger = logging.getLogger("goldsberry.tests.log")
+
+
+class TestLazyLogging:
+    """Tests for the logging helpers."""
+
+    def test_disabled_does_no_work(self, caplog):
+        """With DEBUG disabled, neither arguments nor the response are touched."""
+        caplog.set_level(logging.WARNING, logger=logger.name)
+        params = Mock()
+        response = Mock()
+
+        log_request(logger, "GET", "https://example.test", params)
+        log_response(logger, "GET", "https://example.test", 0.1, response=response)
+        log_debug(logger, "value %s", params)
+
+        assert caplog.records == []
+        assert params.mock_calls == []
+        assert response.mock_calls == []
+
+    def test_response_bytes(self, caplog):
+        """Responses are logged with the body's byte count and structured fields."""
+        caplog.set_level(logging.DEBUG, logger=logger.name)
+        response = httpx.Response(200, content=b'{"resultSets": []}')
+
+        log_response(logger, "GET", "https://example.test/x", 0.25, response=response)
+
+        (record,) = caplog.records
+        assert (
+            record.getMessage() == "Response: GET https://example.test/x -> 200 (18 bytes, 0.250s)"
+        )
+        assert record.goldsberry["bytes"] == 18
+        assert record.goldsberry["status_code"] == 200
+
+    def test_error(self, caplog):
+        """Transport errors are logged by class name."""
+        caplog.set_level(logging.DEBUG, logger=logger.name)
+        log_response(logger, "GET", "https://example.test/x", 1.5, error=NetworkError("down"))
+
+        (record,) = caplog.records
+        assert "NetworkError after 1.500s" in record.getMessage()
+
+
+class TestClientLogging:
+    """Tests for logging from BaseClient requests."""
+
+    def test_request_and_response(self, mock_transport_client, caplog):
+        """Each attempt logs its request and its response size."""
+        caplog.set_level(logging.DEBUG, logger="goldsberry.client.base")
+        client = mock_transport_client(lambda request: httpx.Response(200, content=b"{}"))
+
+        client.get("playergamelog", {"PlayerID": 1})
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert any(message.startswith("Request: GET") for message in messages)
+        assert any("-> 200 (2 bytes" in message for message in messages)
@@ -0,0 +1,170 @@
+"""Tests for request lifecycle metrics."""
+
+import httpx
+import pytest
+
+from goldsberry.client.breaker import CircuitBreakerRegistry
+from goldsberry.client.cache import MemoryCache
+from goldsberry.client.exceptions import CircuitBreakerError, NetworkError, ServerError
+from goldsberry.client.metrics import ClientMetrics, Histogram
+
+PAYLOAD = {"resultSets": [{"name": "PlayerStats", "headers": ["PLAYER_ID"], "rowSet": [[1]]}]}
+
+
+def flaky_handler(failures):
+    """Mock transport handler returning 500 for the first `failures` requests."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) <= failures:
+            return httpx.Response(500, text="boom")
+        return httpx.Response(200, json=PAYLOAD)
+
+    return handler
+
+
+def counter(metrics, name, **labels):
+    """Value of a counter series (0 if never incremented)."""
+    for sample in metrics.snapshot()["counters"].get(name, []):
+        if sample["labels"] == labels:
+            return sample["value"]
+    return 0
+
+
+def histogram(metrics, name, **labels):
+    """Snapshot of a histogram series."""
+    for sample in metrics.snapshot()["histograms"].get(name, []):
+        if sample["labels"] == labels:
+            return sample
+    raise AssertionError(f"No {name} series for {labels}")
+
+
+class TestHistogram:
+    """Tests for Histogram."""
+
+    def test_cumulative_buckets(self):
+        """Bucket counts are cumulative and end with +Inf."""
+        hist = Histogram([0.1, 1.0])
+        for value in (0.05, 0.1, 0.5, 5.0):
+            hist.observe(value)
+
+        assert hist.cumulative()[0] == (0.1, 2)
+        assert hist.cumulative()[1] == (1.0, 3)
+        assert hist.cumulative()[2][1] == 4
+        assert hist.count == 4
+        assert hist.sum == pytest.approx(5.65)
+
+
+class TestClientMetrics:
+    """Tests for ClientMetrics."""
+
+    def test_prometheus_text(self):
+        """Counters, histograms and gauges render in exposition format."""
+        metrics = ClientMetrics(latency_buckets=[0.5])
+        metrics.record_attempt("playergamelog", "200", 0.2, size=1500)
+        registry = CircuitBreakerRegistry()
+        registry.get("playergamelog")
+        metrics.track_breakers(registry)
+
+        text = metrics.to_prometheus()
+        assert "# TYPE goldsberry_requests_total counter" in text
+        assert 'goldsberry_requests_total{endpoint="playergamelog",status="200"} 1' in text
+        assert 'goldsberry_response_bytes_total{endpoint="playergamelog"} 1500' in text
+        assert (
+            'goldsberry_request_duration_seconds_bucket{endpoint="playergamelog",le="0.5"} 1'
+            in text
+        )
+        assert (
+            'goldsberry_request_duration_seconds_bucket{endpoint="playergamelog",le="+Inf"} 1'
+            in text
+        )
+        assert 'goldsberry_request_duration_seconds_count{endpoint="playergamelog"} 1' in text
+        assert 'goldsberry_circuit_breaker_state{breaker="playergamelog"} 0' in text
+
+    def test_label_escaping(self):
+        """Quotes and backslashes in label values are escaped."""
+        metrics = ClientMetrics()
+        metrics.inc("requests_total", endpoint='a"b\\c', status="200")
+        assert 'endpoint="a\\"b\\\\c"' in metrics.to_prometheus()
+
+    def test_reset(self):
+        """reset() drops all samples."""
+        metrics = ClientMetrics()
+        metrics.record_retry("x", ServerError("boom", status_code=500))
+        metrics.reset()
+        assert metrics.snapshot() == {"counters": {}, "histograms": {}, "gauges": {}}
+        assert metrics.to_prometheus() == ""
+
+
+class TestClientIntegration:
+    """Tests for metrics recorded by BaseClient."""
+
+    def test_sync_request_lifecycle(self, mock_transport_client):
+        """Attempts, retries, limiter wait, bytes and decode time are recorded."""
+        metrics = ClientMetrics()
+        client = mock_transport_client(flaky_handler(1), metrics=metrics)
+        client.retry_policy.base_delay = 0
+
+        client.get("playergamelog", {"PlayerID": 1})
+
+        assert counter(metrics, "requests_total", endpoint="playergamelog", status="500") == 1
+        assert counter(metrics, "requests_total", endpoint="playergamelog", status="200") == 1
+        assert counter(metrics, "retries_total", endpoint="playergamelog", error="ServerError") == 1
+        assert counter(metrics, "response_bytes_total", endpoint="playergamelog") > 0
+        assert (
+            histogram(metrics, "request_duration_seconds", endpoint="playergamelog")["count"] == 2
+        )
+        assert histogram(metrics, "rate_limit_wait_seconds", endpoint="playergamelog")["count"] == 2
+        assert histogram(metrics, "decode_duration_seconds", endpoint="playergamelog")["count"] == 1
+
+    async def test_async_transport_errors(self, mock_transport_client):
+        """Transport errors are recorded under the mapped error class."""
+
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        metrics = ClientMetrics()
+        client = mock_transport_client(handler, metrics=metrics, max_retries=0)
+
+        with pytest.raises(NetworkError):
+            await client.get_async("playergamelog")
+        assert (
+            counter(metrics, "requests_total", endpoint="playergamelog", status="NetworkError") == 1
+        )
+
+    def test_cache_hits(self, mock_transport_client):
+        """Responses served from the cache are counted as cache hits."""
+        metrics = ClientMetrics()
+        client = mock_transport_client(flaky_handler(0), metrics=metrics, cache=MemoryCache())
+
+        client.get("playergamelog")
+        client.get("playergamelog")
+
+        assert counter(metrics, "cache_hits_total", endpoint="playergamelog", kind="fresh") == 1
+        assert counter(metrics, "requests_total", endpoint="playergamelog", status="200") == 1
+
+    def test_breaker_rejections_and_state(self, mock_transport_client):
+        """Open breakers show up as rejections and as a state gauge."""
+        metrics = ClientMetrics()
+        client = mock_transport_client(
+            flaky_handler(100),
+            metrics=metrics,
+            max_retries=0,
+            circuit_breakers=CircuitBreakerRegistry(failure_threshold=1),
+        )
+
+        with pytest.raises(ServerError):
+            client.get("playergamelog")
+        with pytest.raises(CircuitBreakerError):
+            client.get("playergamelog")
+
+        assert counter(metrics, "breaker_rejections_total", endpoint="playergamelog") == 1
+        gauges = metrics.snapshot()["gauges"]["circuit_breaker_state"]
+        assert gauges == [{"labels": {"breaker": "playergamelog"}, "value": 2}]
+
+    def test_disabled_by_default(self, mock_transport_client):
+        """Clients without metrics record nothing."""
+        client = mock_transport_client(flaky_handler(0))
+        client.get("playergamelog")
+        assert client.metrics is None
@@ -0,0 +1,106 @@
+"""Tests for negative caching."""
+
+import httpx
+import pytest
+
+from goldsberry.client.cache import MemoryCache
+from goldsberry.client.exceptions import NotFoundError
+from goldsberry.client.negative import NegativeCache, is_empty_result
+
+EMPTY = {"resultSets": [{"name": "PlayerStats", "headers": ["PLAYER_ID"], "rowSet": []}]}
+FULL = {"resultSets": [{"name": "PlayerStats", "headers": ["PLAYER_ID"], "rowSet": [[1]]}]}
+
+
+def counting_handler(status=200, payload=EMPTY):
+    """Mock transport handler that counts requests."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if status != 200:
+            return httpx.Response(status)
+        return httpx.Response(200, json=payload)
+
+    handler.calls = calls
+    return handler
+
+
+class TestIsEmptyResult:
+    """Tests for is_empty_result."""
+
+    def test_empty_result_sets(self):
+        """Result sets without rows are empty."""
+        assert is_empty_result(EMPTY)
+        assert is_empty_result({"resultSet": {"rowSet": []}})
+
+    def test_non_empty(self):
+        """Any row, or no result sets at all, is not empty."""
+        assert not is_empty_result(FULL)
+        assert not is_empty_result({"resultSets": []})
+        assert not is_empty_result({"meta": {}})
+
+
+class TestNegativeCache:
+    """Tests for NegativeCache."""
+
+    def test_not_found_raises(self):
+        """Remembered 404s raise NotFoundError."""
+        cache = NegativeCache()
+        cache.record_not_found("key")
+        with pytest.raises(NotFoundError) as exc_info:
+            cache.lookup("key")
+        assert exc_info.value.context["cached"] is True
+
+    def test_bounded(self):
+        """Oldest entries are evicted beyond max_entries."""
+        cache = NegativeCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.record_empty(key, b"{}")
+        assert len(cache) == 2
+        assert cache.lookup("a") is None
+
+    def test_rejects_non_positive_ttl(self):
+        """The TTL must be positive."""
+        with pytest.raises(ValueError):
+            NegativeCache(ttl=0)
+
+
+class TestClientNegativeCache:
+    """Tests for negative caching in BaseClient."""
+
+    def test_not_found_skips_network(self, mock_transport_client):
+        """A repeated 404 is raised without a request."""
+        handler = counting_handler(status=404)
+        client = mock_transport_client(handler, negative_cache=NegativeCache())
+        for _ in range(3):
+            with pytest.raises(NotFoundError):
+                client.get("boxscoretraditionalv2", {"GameID": "0022499999"})
+        assert len(handler.calls) == 1
+
+    async def test_empty_result_skips_network_async(self, mock_transport_client):
+        """Empty responses are answered locally (async)."""
+        handler = counting_handler()
+        client = mock_transport_client(handler, negative_cache=NegativeCache())
+        first = await client.get_async("playergamelog", {"PlayerID": 1})
+        second = await client.get_async("playergamelog", {"PlayerID": 1})
+        assert first == second == EMPTY
+        assert len(handler.calls) == 1
+
+    def test_empty_result_not_in_response_cache(self, mock_transport_client):
+        """Empty responses get the negative TTL, not the response cache's."""
+        cache = MemoryCache()
+        client = mock_transport_client(
+            counting_handler(), cache=cache, negative_cache=NegativeCache()
+        )
+        client.get("playergamelog", {"PlayerID": 1})
+        assert len(cache) == 0
+        assert len(client.negative_cache) == 1
+
+    def test_disabled_by_default(self, mock_transport_client):
+        """Without a negative cache every probe hits the network."""
+        handler = counting_handler(status=404)
+        client = mock_transport_client(handler)
+        for _ in range(2):
+            with pytest.raises(NotFoundError):
+                client.get("boxscoretraditionalv2", {"GameID": "0022499999"})
+        assert len(handler.calls) == 2
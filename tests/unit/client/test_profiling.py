@@ -0,0 +1,100 @@
+"""Tests for per-stage fetch timing."""
+
+import asyncio
+
+from goldsberry.client.base import BaseClient
+from goldsberry.client.cache import MemoryCache
+from goldsberry.client.profiling import (
+    FetchStats,
+    collect_stats,
+    count_rows,
+    current_stats,
+    fetch_with_stats,
+    fetch_with_stats_async,
+    timed_parse,
+)
+from goldsberry.endpoints.league import LeaguePlayerStatsEndpoint
+from goldsberry.endpoints.player import GameLogsEndpoint
+from goldsberry.testing import FakeNBAServer, PayloadFactory
+
+
+def fake_client(server, **kwargs):
+    """BaseClient talking to a stand-in server, without rate limiting."""
+    return BaseClient(transport=server.transport(), rate_limit_interval=0, **kwargs)
+
+
+class TestFetchStats:
+    """Tests for FetchStats and its helpers."""
+
+    def test_count_rows(self):
+        """Rows are counted across resultSets and a single resultSet."""
+        data = {"resultSets": [{"rowSet": [[1], [2]]}, {"rowSet": [[3]]}]}
+        assert count_rows(data) == 3
+        assert count_rows({"resultSet": {"rowSet": [[1]]}}) == 1
+        assert count_rows({}) == 0
+
+    def test_other(self):
+        """Time not attributed to a stage is reported as other."""
+        stats = FetchStats(total=1.0, network=0.5, decode=0.1, validate=0.2)
+        assert round(stats.other, 6) == 0.2
+        assert stats.to_dict()["other"] == stats.other
+
+    def test_not_collecting(self):
+        """Without a collector nothing is recorded."""
+        assert current_stats() is None
+        assert timed_parse(lambda data: "parsed", {"resultSets": []}) == "parsed"
+
+    def test_collect_stats_scope(self):
+        """The collector is only active inside the block."""
+        with collect_stats() as stats:
+            assert current_stats() is stats
+        assert current_stats() is None
+        assert stats.total >= 0
+
+
+class TestEndpointStats:
+    """Tests for stats collected from endpoint fetches."""
+
+    def test_fetch_with_stats(self):
+        """Every stage of a network fetch is filled in."""
+        server = FakeNBAServer(payloads=PayloadFactory(rows=40))
+        endpoint = LeaguePlayerStatsEndpoint(fake_client(server))
+
+        result, stats = fetch_with_stats(endpoint.fetch, season="2024-25")
+
+        assert len(result.players) == 40
+        assert stats.endpoint == "leaguedashplayerstats"
+        assert stats.source == "network"
+        assert stats.attempts == 1
+        assert stats.rows == 40
+        assert stats.bytes > 0
+        assert stats.network > 0
+        assert stats.decode > 0
+        assert stats.validate > 0
+        assert stats.total >= stats.network + stats.decode + stats.validate
+
+    def test_cache_hit(self):
+        """Cached fetches report the cache as their source and no network time."""
+        server = FakeNBAServer()
+        endpoint = GameLogsEndpoint(fake_client(server, cache=MemoryCache()))
+        endpoint.fetch(player_id=203999)
+
+        _, stats = fetch_with_stats(endpoint.fetch, player_id=203999)
+
+        assert stats.source == "fresh"
+        assert stats.attempts == 0
+        assert stats.network == 0
+        assert stats.rows > 0
+
+    async def test_async_and_coalesced(self):
+        """Concurrent identical async fetches: one leader, the rest coalesced."""
+        server = FakeNBAServer()
+        endpoint = GameLogsEndpoint(fake_client(server))
+
+        results = await asyncio.gather(
+            *(fetch_with_stats_async(endpoint.fetch_async, player_id=203999) for _ in range(3))
+        )
+
+        sources = sorted(stats.source for _, stats in results)
+        assert sources == ["coalesced", "coalesced", "network"]
+        assert server.requests == 1
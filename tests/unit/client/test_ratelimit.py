@@ -0,0 +1,331 @@
+"""Tests for token bucket rate limiting."""
+
+import asyncio
+import multiprocessing
+import sys
+import time
+
+import pytest
+
+from goldsberry.client.base import BaseClient
+from goldsberry.client.exceptions import (
+    ConfigurationError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+)
+from goldsberry.client.exceptions import TimeoutError as NBATimeoutError
+from goldsberry.client.ratelimit import (
+    AdaptiveRateLimiter,
+    FileTokenBucket,
+    RateLimiter,
+    TokenBucket,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_allows_burst_then_spaces(self):
+        """Test a full bucket serves `capacity` requests without waiting."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=3, clock=clock)
+
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.reserve() == pytest.approx(0.5)
+
+    def test_waiters_queue_fifo(self):
+        """Test later reservations wait longer than earlier ones."""
+        bucket = TokenBucket(rate=1.0, capacity=1, clock=FakeClock())
+        waits = [bucket.reserve() for _ in range(4)]
+        assert waits == [0.0, 1.0, 2.0, 3.0]
+
+    def test_refills_over_time_up_to_capacity(self):
+        """Test tokens accrue with elapsed time but never exceed capacity."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, capacity=2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+        clock.now += 10
+        assert bucket.tokens == 2
+
+    def test_clock_going_backwards_does_not_stall(self):
+        """Test a clock step backwards neither adds nor removes tokens."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, capacity=1, clock=clock)
+        clock.now -= 1000
+        assert bucket.reserve() == 0.0
+
+    def test_try_reserve_never_goes_into_debt(self):
+        """Test non-blocking reservations only succeed with a spare token."""
+        bucket = TokenBucket(rate=1.0, capacity=1, clock=FakeClock())
+        assert bucket.try_reserve()
+        assert not bucket.try_reserve()
+        bucket.refund()
+        assert bucket.try_reserve()
+
+    def test_delayed_reservation_is_booked_for_later(self):
+        """Test a delayed token is booked for that time and later callers queue behind it."""
+        bucket = TokenBucket(rate=1.0, capacity=1, clock=FakeClock())
+        assert bucket.reserve(delay=5.0) == 5.0
+        assert bucket.reserve() == pytest.approx(6.0)
+
+    def test_unlimited(self):
+        """Test an infinite rate never waits."""
+        bucket = TokenBucket(rate=float("inf"))
+        assert all(bucket.reserve() == 0.0 for _ in range(100))
+
+    def test_invalid(self):
+        """Test bucket settings are validated."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, capacity=0)
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_default_matches_min_interval(self):
+        """Test the default settings space requests by min_interval."""
+        limiter = RateLimiter(min_interval=0.5)
+        assert limiter.min_interval == pytest.approx(0.5)
+        assert limiter.reserve() == 0.0
+        assert limiter.reserve() == pytest.approx(0.5, abs=0.01)
+
+    def test_try_acquire_checks_both_buckets(self):
+        """Test a refused endpoint bucket returns the global token."""
+        limiter = RateLimiter(
+            min_interval=60, burst=2, endpoint_limits={"shotchartdetail": (60, 1)}
+        )
+        assert limiter.try_acquire("shotchartdetail")
+        assert not limiter.try_acquire("shotchartdetail")
+        assert limiter.try_acquire("commonallplayers")
+
+    def test_zero_interval_disables(self):
+        """Test min_interval=0 means no limiting."""
+        limiter = RateLimiter(min_interval=0)
+        assert all(limiter.reserve() == 0.0 for _ in range(10))
+
+    def test_endpoint_budget_applies_on_top(self):
+        """Test an endpoint bucket can be stricter than the global one."""
+        limiter = RateLimiter(
+            min_interval=0, endpoint_limits={"shotchartdetail": (1.0, 1)}
+        )
+        assert limiter.reserve("shotchartdetail") == 0.0
+        assert limiter.reserve("shotchartdetail") == pytest.approx(1.0, abs=0.01)
+        assert limiter.reserve("commonallplayers") == 0.0
+
+    def test_global_rate_holds_across_endpoints(self):
+        """Test a slow endpoint does not let requests share a global slot."""
+        clock = FakeClock()
+        limiter = RateLimiter()
+        limiter.bucket = TokenBucket(rate=1.0, capacity=1, clock=clock)
+        limiter.endpoint_buckets = {"slow": TokenBucket(rate=0.2, capacity=1, clock=clock)}
+
+        endpoints = ["slow", "slow", "fast", "fast", "fast", "fast"]
+        send_times = sorted(limiter.reserve(endpoint) for endpoint in endpoints)
+        gaps = [later - earlier for earlier, later in zip(send_times, send_times[1:])]
+        assert all(gap >= 1.0 - 1e-9 for gap in gaps)
+
+    async def test_cancelled_acquire_returns_token(self):
+        """Test cancelling a waiting acquire gives its token back."""
+        limiter = RateLimiter(min_interval=10)
+        assert await limiter.acquire() == 0.0
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter.bucket.tokens == pytest.approx(0.0, abs=0.01)
+
+    async def test_sync_and_async_share_budget(self):
+        """Test both acquire paths draw from one bucket."""
+        limiter = RateLimiter(min_interval=0.05)
+        limiter.acquire_sync()
+        start = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - start >= 0.04
+
+    async def test_concurrent_async_waiters_are_spaced(self):
+        """Test concurrent tasks are released one interval apart."""
+        limiter = RateLimiter(min_interval=0.02, burst=2)
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+        assert time.monotonic() - start >= 0.035
+
+
+class TestClientRateLimitConfig:
+    """Tests for BaseClient rate limit configuration."""
+
+    def test_burst_setting(self):
+        """Test rate_limit_burst sizes the global bucket."""
+        client = BaseClient(rate_limit_burst=4)
+        assert client.rate_limiter.bucket.capacity == 4
+
+    def test_custom_limiter(self):
+        """Test a pre-built limiter can be shared between clients."""
+        limiter = RateLimiter(min_interval=1.0)
+        assert BaseClient(rate_limiter=limiter).rate_limiter is limiter
+
+    def test_invalid_burst(self):
+        """Test burst must be at least one."""
+        with pytest.raises(ConfigurationError):
+            BaseClient(rate_limit_burst=0)
+
+
+def _reserve_many(path: str, count: int) -> list[float]:
+    """Reserve tokens from a shared bucket (runs in a worker process)."""
+    limiter = RateLimiter(min_interval=1.0, shared_path=path)
+    return [limiter.reserve() for _ in range(count)]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shared budgets need fcntl (POSIX only)")
+class TestSharedBudget:
+    """Tests for the file-backed, cross-process budget."""
+
+    def test_instances_share_state(self, tmp_path):
+        """Test two buckets on one file draw from the same tokens."""
+        path = tmp_path / "budget"
+        first = FileTokenBucket(path, rate=1.0, capacity=2)
+        second = FileTokenBucket(path, rate=1.0, capacity=2)
+
+        assert first.reserve() == 0.0
+        assert second.reserve() == 0.0
+        assert first.reserve() == pytest.approx(1.0, abs=0.01)
+        assert second.reserve() == pytest.approx(2.0, abs=0.01)
+
+    def test_try_reserve_and_refund(self, tmp_path):
+        """Test non-blocking reservations against the shared file."""
+        path = tmp_path / "budget"
+        first = FileTokenBucket(path, rate=0.001, capacity=1)
+        second = FileTokenBucket(path, rate=0.001, capacity=1)
+        assert first.try_reserve()
+        assert not second.try_reserve()
+        first.refund()
+        assert second.try_reserve()
+
+    def test_endpoint_buckets_use_sibling_files(self, tmp_path):
+        """Test endpoint budgets are shared through their own files."""
+        path = tmp_path / "budget"
+        limiter = RateLimiter(
+            min_interval=0, endpoint_limits={"shotchartdetail": (1.0, 1)}, shared_path=path
+        )
+        assert isinstance(limiter.endpoint_buckets["shotchartdetail"], FileTokenBucket)
+        assert (tmp_path / "budget.shotchartdetail").exists()
+
+    def test_processes_share_budget(self, tmp_path):
+        """Test worker processes queue behind each other on one budget."""
+        ctx = multiprocessing.get_context("spawn")
+        path = str(tmp_path / "budget")
+        with ctx.Pool(3) as pool:
+            waits = sorted(w for ws in pool.starmap(_reserve_many, [(path, 2)] * 3) for w in ws)
+
+        # Six reservations at 1/s from one bucket: exactly one free slot
+        assert waits[0] == 0.0
+        assert all(w > 0 for w in waits[1:])
+        assert waits[-1] == pytest.approx(5.0, abs=0.5)
+
+
+class TestAdaptiveRateLimiter:
+    """Tests for AIMD pacing."""
+
+    def make(self, **kwargs):
+        """Build an adaptive limiter with fast-moving defaults."""
+        kwargs.setdefault("min_interval", 1.0)
+        kwargs.setdefault("increase_after", 2)
+        kwargs.setdefault("increase_step", 0.5)
+        kwargs.setdefault("decrease_cooldown", 0)
+        return AdaptiveRateLimiter(**kwargs)
+
+    def test_additive_increase_when_healthy(self):
+        """Test a healthy streak raises the rate by one step."""
+        limiter = self.make()
+        for _ in range(4):
+            limiter.record(0.1)
+        assert limiter.current_rate == pytest.approx(2.0)
+
+    def test_increase_capped_at_max_rate(self):
+        """Test the rate never exceeds max_rate."""
+        limiter = self.make(max_rate=1.2)
+        for _ in range(10):
+            limiter.record(0.1)
+        assert limiter.current_rate == pytest.approx(1.2)
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            NBATimeoutError("slow", timeout=30),
+            ServerError("down", status_code=503),
+            RateLimitError("throttled"),
+        ],
+    )
+    def test_multiplicative_decrease_on_congestion(self, error):
+        """Test timeouts, 5xx and 429s halve the rate."""
+        limiter = self.make()
+        limiter.record(30.0, error)
+        assert limiter.current_rate == pytest.approx(0.5)
+
+    def test_other_errors_hold_rate(self):
+        """Test a 404 neither counts as healthy nor as congestion."""
+        limiter = self.make()
+        limiter.record(0.1)
+        limiter.record(0.1, NotFoundError("missing"))
+        limiter.record(0.1)
+        limiter.record(0.1, NotFoundError("missing"))
+        assert limiter.current_rate == pytest.approx(1.0)
+
+    def test_slow_responses_hold_rate(self):
+        """Test responses over the latency threshold block increases."""
+        limiter = self.make(latency_threshold=1.0)
+        for _ in range(4):
+            limiter.record(2.0)
+        assert limiter.current_rate == pytest.approx(1.0)
+
+    def test_decrease_floor_and_cooldown(self):
+        """Test decreases respect min_rate and the cooldown window."""
+        limiter = self.make(min_rate=0.4, decrease_cooldown=60)
+        error = ServerError("down", status_code=500)
+        limiter.record(0.1, error)
+        limiter.record(0.1, error)
+        assert limiter.current_rate == pytest.approx(0.5)
+
+        floor = self.make(min_rate=0.4)
+        for _ in range(5):
+            floor.record(0.1, error)
+        assert floor.current_rate == pytest.approx(0.4)
+
+    def test_invalid_settings(self):
+        """Test inconsistent settings are rejected."""
+        with pytest.raises(ConfigurationError):
+            AdaptiveRateLimiter(min_rate=2, max_rate=1)
+        with pytest.raises(ConfigurationError):
+            AdaptiveRateLimiter(decrease_factor=1.5)
+        with pytest.raises(ConfigurationError, match="shared_path"):
+            AdaptiveRateLimiter(shared_path="/tmp/goldsberry.rate")
+
+    def test_client_feeds_outcomes(self, mock_transport_client):
+        """Test BaseClient reports server errors to the limiter."""
+        import httpx
+
+        limiter = self.make(min_interval=0.001, max_rate=2000)
+        client = mock_transport_client(
+            lambda request: httpx.Response(503),
+            rate_limiter=limiter,
+            max_retries=0,
+            enable_circuit_breaker=False,
+        )
+        with pytest.raises(ServerError):
+            client.get("commonallplayers")
+        assert limiter.current_rate == pytest.approx(500)
@@ -0,0 +1,207 @@
+"""Tests for the retry policy."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from goldsberry.client.exceptions import (
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+)
+from goldsberry.client.exceptions import TimeoutError as NBATimeoutError
+from goldsberry.client.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+def flaky(failures, status=503, headers=None):
+    """Handler failing `failures` times before returning a payload."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) <= failures:
+            return httpx.Response(status, headers=headers or {})
+        return httpx.Response(200, json={"ok": True})
+
+    handler.calls = calls
+    return handler
+
+
+def fast_policy(**kwargs):
+    """Retry policy without backoff delays."""
+    kwargs.setdefault("base_delay", 0)
+    return RetryPolicy(**kwargs)
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After parsing."""
+
+    def test_seconds(self):
+        """Test delta-seconds values."""
+        assert parse_retry_after("7") == 7.0
+
+    def test_http_date(self):
+        """Test HTTP-date values."""
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert 25 < parse_retry_after(format_datetime(when, usegmt=True)) <= 30
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_invalid(self, value):
+        """Test missing or unparseable values."""
+        assert parse_retry_after(value) is None
+
+
+class TestRetryBudget:
+    """Tests for RetryBudget."""
+
+    def test_spends_and_refills(self):
+        """Test retries draw down the budget and requests refill it."""
+        budget = RetryBudget(ratio=0.5, initial_tokens=1)
+        assert budget.try_spend()
+        assert not budget.try_spend()
+        budget.record_request()
+        budget.record_request()
+        assert budget.try_spend()
+
+    def test_capped(self):
+        """Test the budget never exceeds max_tokens."""
+        budget = RetryBudget(ratio=1, initial_tokens=0, max_tokens=2)
+        for _ in range(10):
+            budget.record_request()
+        assert budget.tokens == 2
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy decisions."""
+
+    def test_backoff_is_capped_and_jittered(self):
+        """Test full-jitter delays stay within the exponential envelope."""
+        policy = RetryPolicy(base_delay=1, max_delay=4)
+        for retry, cap in [(1, 1), (2, 2), (3, 4), (6, 4)]:
+            assert all(0 <= policy.backoff(retry) <= cap for _ in range(20))
+        assert RetryPolicy(base_delay=1, jitter=False).backoff(3) == 4
+
+    def test_non_retryable_errors(self):
+        """Test client errors are final."""
+        assert RetryPolicy().next_delay(1, NotFoundError("missing")) is None
+
+    def test_attempt_limit(self):
+        """Test no delay is returned once max_retries is reached."""
+        policy = fast_policy(max_retries=2)
+        error = ServerError("down", status_code=500)
+        assert policy.next_delay(2, error) is not None
+        assert policy.next_delay(3, error) is None
+
+    def test_retry_after_wins(self):
+        """Test a server-provided Retry-After overrides backoff."""
+        policy = RetryPolicy()
+        assert policy.next_delay(1, RateLimitError("slow down", retry_after=3)) == 3
+
+    def test_retry_after_over_limit_is_final(self):
+        """Test very long Retry-After values are not waited out."""
+        policy = RetryPolicy(max_retry_after=10)
+        assert policy.next_delay(1, RateLimitError("slow down", retry_after=600)) is None
+
+    def test_budget_exhaustion(self):
+        """Test an empty budget stops retries."""
+        policy = fast_policy(budget=RetryBudget(initial_tokens=0, ratio=0))
+        assert policy.next_delay(1, NBATimeoutError("slow", timeout=1)) is None
+
+    def test_call_sync_retries_until_success(self):
+        """Test call_sync retries transient errors and reports each retry."""
+        results = iter([ServerError("down", status_code=503), ServerError("down", status_code=503)])
+        retries = []
+
+        def send():
+            error = next(results, None)
+            if error is not None:
+                raise error
+            return "ok"
+
+        policy = fast_policy(max_retries=3)
+        assert policy.call_sync(send, lambda *retry: retries.append(retry)) == "ok"
+        assert [attempt for attempt, _, _ in retries] == [1, 2]
+
+    async def test_call_raises_final_error(self):
+        """Test call re-raises an error the policy will not retry."""
+        calls = []
+
+        async def send():
+            calls.append(1)
+            raise NotFoundError("missing")
+
+        with pytest.raises(NotFoundError):
+            await fast_policy().call(send)
+        assert len(calls) == 1
+
+
+class TestClientRetries:
+    """Tests for retries in BaseClient."""
+
+    def test_sync_retries_server_errors(self, mock_transport_client):
+        """Test the sync path retries 5xx responses."""
+        handler = flaky(2)
+        client = mock_transport_client(handler, retry_policy=fast_policy())
+        assert client.get("commonallplayers") == {"ok": True}
+        assert len(handler.calls) == 3
+
+    async def test_async_uses_max_retries(self, mock_transport_client):
+        """Test the async path honors max_retries."""
+        handler = flaky(5)
+        client = mock_transport_client(
+            handler, retry_policy=fast_policy(max_retries=1), enable_circuit_breaker=False
+        )
+        with pytest.raises(ServerError):
+            await client.get_async("commonallplayers")
+        assert len(handler.calls) == 2
+
+    def test_zero_retries(self, mock_transport_client):
+        """Test max_retries=0 makes a single attempt."""
+        handler = flaky(1)
+        client = mock_transport_client(handler, max_retries=0)
+        with pytest.raises(ServerError):
+            client.get("commonallplayers")
+        assert len(handler.calls) == 1
+
+    async def test_429_maps_to_rate_limit_error(self, mock_transport_client):
+        """Test 429 responses raise RateLimitError with Retry-After."""
+        handler = flaky(5, status=429, headers={"Retry-After": "120"})
+        client = mock_transport_client(
+            handler, retry_policy=RetryPolicy(max_retry_after=60), enable_circuit_breaker=False
+        )
+        with pytest.raises(RateLimitError) as exc_info:
+            await client.get_async("commonallplayers")
+        assert exc_info.value.retry_after == 120
+        assert len(handler.calls) == 1
+
+    def test_429_is_retried_after_delay(self, mock_transport_client):
+        """Test a short Retry-After is honored and retried."""
+        handler = flaky(1, status=429, headers={"Retry-After": "0"})
+        client = mock_transport_client(handler)
+        assert client.get("commonallplayers") == {"ok": True}
+        assert len(handler.calls) == 2
+
+    def test_timeouts_are_retried(self, mock_transport_client):
+        """Test transport timeouts become NBATimeoutError and are retried."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ReadTimeout("slow", request=request)
+            return httpx.Response(200, json={})
+
+        client = mock_transport_client(handler, retry_policy=fast_policy())
+        assert client.get("commonallplayers") == {}
+        assert len(calls) == 2
+
+    def test_shared_budget_limits_retries(self, mock_transport_client):
+        """Test a drained budget fails fast instead of retrying."""
+        handler = flaky(10)
+        policy = fast_policy(budget=RetryBudget(ratio=0, initial_tokens=1))
+        client = mock_transport_client(handler, retry_policy=policy)
+        with pytest.raises(ServerError):
+            client.get("commonallplayers")
+        assert len(handler.calls) == 2
@@ -0,0 +1,182 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from goldsberry.client.exceptions import ServerError
+from goldsberry.client.singleflight import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for the thread-based single-flight group."""
+
+    def test_concurrent_calls_share_result(self):
+        """Test only one of several concurrent identical calls runs."""
+        flight = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def work():
+            calls.append(1)
+            release.wait(1)
+            return "result"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(flight.do("k", work)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        while flight.in_flight() == 0:
+            time.sleep(0.001)
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == ["result"] * 5
+        assert flight.in_flight() == 0
+
+    def test_exception_reaches_caller_and_clears(self):
+        """Test errors propagate and do not poison later calls."""
+        flight = SingleFlight()
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            flight.do("k", fail)
+        assert flight.do("k", lambda: 1) == 1
+
+
+class TestAsyncSingleFlight:
+    """Tests for the asyncio single-flight group."""
+
+    async def test_concurrent_calls_share_result(self):
+        """Test concurrent identical awaits run the coroutine once."""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+        assert results == ["result"] * 5
+        assert len(calls) == 1
+        assert flight.in_flight() == 0
+
+    async def test_exception_reaches_every_waiter(self):
+        """Test every waiter receives the shared exception."""
+        flight = AsyncSingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            *(flight.do("k", fail) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+
+    async def test_cancelled_waiter_does_not_cancel_others(self):
+        """Test cancelling one waiter leaves the shared call running."""
+        flight = AsyncSingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "result"
+
+        first = asyncio.ensure_future(flight.do("k", work))
+        second = asyncio.ensure_future(flight.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == "result"
+
+
+class TestClientCoalescing:
+    """Tests for coalescing inside BaseClient."""
+
+    async def test_get_async_coalesces(self, mock_transport_client):
+        """Test concurrent identical get_async calls make one request."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"resultSets": []})
+
+        client = mock_transport_client(handler)
+        params = {"GameID": "0022400001"}
+        results = await asyncio.gather(
+            *(client.get_async("boxscoretraditionalv2", params) for _ in range(4))
+        )
+        assert len(calls) == 1
+        assert all(r == {"resultSets": []} for r in results)
+
+    async def test_different_params_not_coalesced(self, mock_transport_client):
+        """Test distinct requests are not merged."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={})
+
+        client = mock_transport_client(handler)
+        await asyncio.gather(
+            client.get_async("boxscoretraditionalv2", {"GameID": "1"}),
+            client.get_async("boxscoretraditionalv2", {"GameID": "2"}),
+        )
+        assert len(calls) == 2
+
+    async def test_waiters_receive_exception(self, mock_transport_client):
+        """Test a shared failure is raised to every waiter."""
+        client = mock_transport_client(
+            lambda request: httpx.Response(500), max_retries=0, enable_circuit_breaker=False
+        )
+        results = await asyncio.gather(
+            *(client.get_async("boxscoretraditionalv2") for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, ServerError) for r in results)
+
+    def test_sync_get_coalesces_across_threads(self, mock_transport_client):
+        """Test threads sharing a client coalesce identical requests."""
+        calls = []
+        release = threading.Event()
+
+        def handler(request):
+            calls.append(request)
+            release.wait(1)
+            return httpx.Response(200, json={"ok": True})
+
+        client = mock_transport_client(handler)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(client.get("commonallplayers")))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [{"ok": True}] * 4
+
+    def test_can_be_disabled(self, mock_transport_client):
+        """Test coalesce_requests=False sends every request."""
+        client = mock_transport_client(
+            lambda request: httpx.Response(200, json={}), coalesce_requests=False
+        )
+        assert client.coalesce_requests is False
+        assert client.get("commonallplayers") == {}
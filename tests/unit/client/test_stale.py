@@ -0,0 +1,214 @@
+"""Tests for stale-while-revalidate and stale-if-error."""
+
+import asyncio
+import json
+from dataclasses import replace
+
+import httpx
+import pytest
+
+from goldsberry.client.breaker import CircuitBreakerRegistry
+from goldsberry.client.cache import MemoryCache
+from goldsberry.client.exceptions import CircuitBreakerError, NotFoundError, ServerError
+from goldsberry.client.stale import StalePolicy, StaleResponse
+
+
+class SwitchHandler:
+    """Mock transport handler that fails on demand."""
+
+    def __init__(self):
+        self.status = 200
+        self.calls = 0
+
+    def __call__(self, request):
+        self.calls += 1
+        if self.status != 200:
+            return httpx.Response(self.status)
+        return httpx.Response(200, json={"version": self.calls})
+
+
+def age_store(policy, seconds):
+    """Make every stored payload look older by seconds."""
+    entries = policy.store._entries
+    for key, entry in list(entries.items()):
+        entries[key] = replace(entry, stored_at=entry.stored_at - seconds)
+
+
+class TestStalePolicy:
+    """Tests for StalePolicy."""
+
+    def test_rejects_negative_ages(self):
+        """Negative maximum ages are invalid."""
+        with pytest.raises(ValueError):
+            StalePolicy(if_error=-1)
+
+    def test_stale_response_is_dict(self):
+        """StaleResponse compares like the payload it wraps."""
+        response = StaleResponse({"a": 1}, age=5.0)
+        assert response == {"a": 1}
+        assert response.age == 5.0
+        assert not response.revalidating
+
+
+class TestStaleIfError:
+    """Tests for serving stale payloads on error."""
+
+    def test_serves_last_good_on_server_error(self, mock_transport_client):
+        """A 5xx falls back to the stored payload."""
+        handler = SwitchHandler()
+        client = mock_transport_client(handler, max_retries=0, stale=StalePolicy())
+        assert client.get("leaguedashteamstats") == {"version": 1}
+
+        handler.status = 500
+        data = client.get("leaguedashteamstats")
+
+        assert isinstance(data, StaleResponse)
+        assert data == {"version": 1}
+        assert isinstance(data.error, ServerError)
+        assert not data.revalidating
+
+    def test_serves_last_good_when_breaker_open(self, mock_transport_client):
+        """An open circuit breaker falls back to the stored payload."""
+        handler = SwitchHandler()
+        client = mock_transport_client(
+            handler,
+            max_retries=0,
+            circuit_breakers=CircuitBreakerRegistry(failure_threshold=1),
+            stale=StalePolicy(),
+        )
+        client.get("leaguedashteamstats")
+        age_store(client.stale, 120)
+        handler.status = 500
+        client.get("leaguedashteamstats")
+
+        data = client.get("leaguedashteamstats")
+        assert isinstance(data.error, CircuitBreakerError)
+
+    def test_raises_without_payload(self, mock_transport_client):
+        """Errors propagate when nothing was stored."""
+        handler = SwitchHandler()
+        handler.status = 500
+        client = mock_transport_client(handler, max_retries=0, stale=StalePolicy())
+        with pytest.raises(ServerError):
+            client.get("leaguedashteamstats")
+
+    def test_client_errors_propagate(self, mock_transport_client):
+        """Errors outside StalePolicy.errors are raised."""
+        handler = SwitchHandler()
+        client = mock_transport_client(handler, max_retries=0, stale=StalePolicy())
+        client.get("leaguedashteamstats")
+        handler.status = 404
+        with pytest.raises(NotFoundError):
+            client.get("leaguedashteamstats")
+
+    def test_too_old_payload_not_served(self, mock_transport_client):
+        """Payloads older than if_error are not served."""
+        handler = SwitchHandler()
+        policy = StalePolicy(if_error=60)
+        client = mock_transport_client(handler, max_retries=0, stale=policy)
+        client.get("leaguedashteamstats")
+        age_store(policy, 120)
+
+        handler.status = 500
+        with pytest.raises(ServerError):
+            client.get("leaguedashteamstats")
+
+    async def test_async(self, mock_transport_client):
+        """get_async falls back the same way."""
+        handler = SwitchHandler()
+        client = mock_transport_client(handler, max_retries=0, stale=StalePolicy())
+        await client.get_async("leaguedashteamstats")
+        handler.status = 503
+
+        data = await client.get_async("leaguedashteamstats")
+        assert data == {"version": 1}
+        assert data.age >= 0
+
+
+class TestStaleWhileRevalidate:
+    """Tests for serving stale payloads while refreshing."""
+
+    def test_sync_refreshes_in_background(self, mock_transport_client):
+        """get() returns the stored payload and refreshes it on a thread."""
+        handler = SwitchHandler()
+        client = mock_transport_client(handler, stale=StalePolicy(while_revalidate=300))
+        assert client.get("leaguedashteamstats") == {"version": 1}
+        age_store(client.stale, 120)
+
+        data = client.get("leaguedashteamstats")
+        assert isinstance(data, StaleResponse)
+        assert data.revalidating
+        assert data == {"version": 1}
+
+        client.close()
+        assert handler.calls == 2
+        assert json.loads(client.stale.store.get("leaguedashteamstats").body) == {"version": 2}
+
+    async def test_async_refreshes_in_background(self, mock_transport_client):
+        """get_async() returns the stored payload and refreshes it in a task."""
+        handler = SwitchHandler()
+        client = mock_transport_client(handler, stale=StalePolicy(while_revalidate=300))
+        await client.get_async("leaguedashteamstats")
+        age_store(client.stale, 120)
+
+        first = await client.get_async("leaguedashteamstats")
+        second = await client.get_async("leaguedashteamstats")
+        assert first == second == {"version": 1}
+
+        await asyncio.gather(*client._revalidation_tasks)
+        assert handler.calls == 2
+        assert json.loads(client.stale.store.get("leaguedashteamstats").body) == {"version": 2}
+
+    def test_fresh_cache_takes_precedence(self, mock_transport_client):
+        """Unexpired cache entries are served as plain dicts."""
+        handler = SwitchHandler()
+        client = mock_transport_client(
+            handler, cache=MemoryCache(), stale=StalePolicy(while_revalidate=300)
+        )
+        client.get("leaguedashteamstats")
+
+        data = client.get("leaguedashteamstats")
+        assert not isinstance(data, StaleResponse)
+        assert handler.calls == 1
+
+    def test_young_payload_not_refreshed(self, mock_transport_client):
+        """Payloads younger than revalidate_after are served without a refresh."""
+        handler = SwitchHandler()
+        policy = StalePolicy(while_revalidate=300, revalidate_after=60)
+        client = mock_transport_client(handler, stale=policy)
+        client.get("leaguedashteamstats")
+
+        for _ in range(3):
+            data = client.get("leaguedashteamstats")
+            assert isinstance(data, StaleResponse)
+            assert not data.revalidating
+        client.close()
+        assert handler.calls == 1
+
+    def test_cache_ttl_sets_refresh_age(self, mock_transport_client):
+        """With a cache configured, its TTL decides when to refresh."""
+        handler = SwitchHandler()
+        client = mock_transport_client(
+            handler, cache=MemoryCache(), cache_ttl=600, stale=StalePolicy(while_revalidate=900)
+        )
+        client.get("leaguedashteamstats")
+        client.cache.clear()
+        age_store(client.stale, 120)
+
+        assert not client.get("leaguedashteamstats").revalidating
+        client.close()
+        assert handler.calls == 1
+
+    def test_background_failure_is_logged(self, mock_transport_client, caplog):
+        """A failed refresh keeps the stored payload."""
+        handler = SwitchHandler()
+        client = mock_transport_client(
+            handler, max_retries=0, stale=StalePolicy(while_revalidate=300)
+        )
+        client.get("leaguedashteamstats")
+        age_store(client.stale, 120)
+        handler.status = 500
+
+        assert client.get("leaguedashteamstats") == {"version": 1}
+        client.close()
+        assert "Background refresh of leaguedashteamstats failed" in caplog.text
@@ -0,0 +1,212 @@
+"""Tests for streaming result set parsing."""
+
+import json
+
+import httpx
+import pytest
+
+from goldsberry.client.exceptions import ParseError, ServerError
+from goldsberry.client.metrics import ClientMetrics
+from goldsberry.client.profiling import collect_stats
+from goldsberry.client.streaming import (
+    ResultSetHeader,
+    ResultSetParser,
+    aiter_result_sets,
+    iter_result_sets,
+)
+
+
+def expected_items(payload):
+    """Headers and rows a payload should stream as."""
+    result_sets = payload.get("resultSets", payload.get("resultSet"))
+    if isinstance(result_sets, dict):
+        result_sets = [result_sets]
+    items = []
+    for index, result_set in enumerate(result_sets):
+        items.append(ResultSetHeader(index, result_set.get("name"), result_set.get("headers")))
+        items.extend(result_set.get("rowSet", []))
+    return items
+
+
+def chunked(data, size):
+    """Split bytes into chunks of a fixed size."""
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def big_payload(rows):
+    """A play-by-play sized payload."""
+    return {
+        "resource": "playbyplayv2",
+        "parameters": {"GameID": "0022400001"},
+        "resultSets": [
+            {
+                "name": "PlayByPlay",
+                "headers": ["GAME_ID", "EVENTNUM", "HOMEDESCRIPTION", "SCOREMARGIN"],
+                "rowSet": [
+                    ["0022400001", i, f"Dončić 25' 3PT Jump Shot ({i} PTS)", None]
+                    for i in range(rows)
+                ],
+            },
+            {"name": "AvailableVideo", "headers": ["VIDEO_AVAILABLE_FLAG"], "rowSet": [[1]]},
+        ],
+    }
+
+
+class TestResultSetParser:
+    """Tests for ResultSetParser."""
+
+    @pytest.mark.parametrize("size", [1, 7, 64, 4096])
+    def test_fixtures_match_json_loads(self, fixtures_dir, size):
+        """Every fixture streams to the same headers and rows at any chunk size."""
+        for path in sorted(fixtures_dir.rglob("*.json")):
+            payload = json.loads(path.read_text())
+            if not isinstance(payload, dict) or "resultSets" not in payload:
+                continue
+            items = list(iter_result_sets(chunked(path.read_bytes(), size)))
+            assert items == expected_items(payload), path.name
+
+    def test_single_result_set(self):
+        """A single resultSet object is streamed like a one-element list."""
+        payload = {"resultSet": {"name": "Only", "headers": ["A"], "rowSet": [[1.5], [-2e3]]}}
+        items = list(iter_result_sets(chunked(json.dumps(payload).encode(), 3)))
+        assert items == [ResultSetHeader(0, "Only", ["A"]), [1.5], [-2000.0]]
+
+    def test_headers_emitted_before_rows(self):
+        """Headers arrive before any row is decoded."""
+        parser = ResultSetParser()
+        items = parser.feed(b'{"resultSets": [{"name": "X", "headers": ["A"], "rowSet": [[1], [2')
+        assert items == [ResultSetHeader(0, "X", ["A"]), [1]]
+        assert parser.feed(b"]]}]}") == [[2]]
+        assert parser.close() == []
+        assert parser.done
+
+    def test_numbers_split_across_chunks(self):
+        """A number cut at a chunk boundary is not decoded early."""
+        parser = ResultSetParser()
+        body = b'{"resultSets": [{"name": "X", "headers": ["A"], "rowSet": []}], "n": 12'
+        parser.feed(body)
+        parser.feed(b"34}")
+        assert parser.close() == []
+
+    def test_truncated(self):
+        """A body ending early raises ParseError."""
+        with pytest.raises(ParseError, match="ended before"):
+            list(iter_result_sets([b'{"resultSets": [{"name": "X", "rowSet": [[1]']))
+
+    def test_invalid(self):
+        """A body that is not a resultSets payload raises ParseError."""
+        with pytest.raises(ParseError):
+            list(iter_result_sets([b"<html>Access Denied</html>"]))
+
+    def test_memory_stays_flat(self):
+        """Only a small window of a large body is ever buffered."""
+        body = json.dumps(big_payload(20_000)).encode()
+        parser = ResultSetParser()
+        peak = rows = 0
+        for chunk in chunked(body, 8192):
+            rows += sum(isinstance(item, list) for item in parser.feed(chunk))
+            peak = max(peak, parser.buffered)
+        rows += sum(isinstance(item, list) for item in parser.close())
+
+        assert rows == 20_001
+        assert len(body) > 1_000_000
+        assert peak < 9_000
+
+    async def test_async(self):
+        """aiter_result_sets consumes async chunk iterators."""
+        payload = big_payload(10)
+
+        async def chunks():
+            for chunk in chunked(json.dumps(payload).encode(), 50):
+                yield chunk
+
+        assert [item async for item in aiter_result_sets(chunks())] == expected_items(payload)
+
+
+class TestClientStreaming:
+    """Tests for BaseClient.stream and stream_async."""
+
+    def test_stream(self, mock_transport_client):
+        """Rows are streamed from a chunked response body."""
+        payload = big_payload(100)
+        body = json.dumps(payload).encode()
+
+        def handler(request):
+            return httpx.Response(200, content=iter(chunked(body, 256)))
+
+        client = mock_transport_client(handler)
+        items = list(client.stream("playbyplayv2", {"GameID": "0022400001"}))
+        assert items == expected_items(payload)
+
+    def test_retries_before_body(self, mock_transport_client):
+        """Errors before the body starts are retried."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(503, text="busy")
+            return httpx.Response(200, json=big_payload(2))
+
+        client = mock_transport_client(handler)
+        client.retry_policy.base_delay = 0
+
+        assert len(list(client.stream("playbyplayv2"))) == 5
+        assert len(calls) == 2
+
+    async def test_stream_async(self, mock_transport_client):
+        """stream_async yields the same items."""
+        payload = big_payload(20)
+        client = mock_transport_client(lambda request: httpx.Response(200, json=payload))
+
+        items = [item async for item in client.stream_async("playbyplayv2")]
+        assert items == expected_items(payload)
+
+    def test_attempt_recorded(self, mock_transport_client):
+        """Hooks, metrics and FetchStats see the streamed attempt and its size."""
+        body = json.dumps(big_payload(50)).encode()
+        metrics = ClientMetrics()
+        client = mock_transport_client(
+            lambda request: httpx.Response(200, content=iter(chunked(body, 256))),
+            metrics=metrics,
+        )
+        events = []
+        client.on_request(lambda event: events.append("request"))
+        client.on_response(lambda event: events.append((event.status_code, event.size)))
+
+        with collect_stats() as stats:
+            list(client.stream("playbyplayv2"))
+
+        assert events == ["request", (200, len(body))]
+        assert stats.attempts == 1
+        assert stats.bytes == len(body)
+        assert stats.network > 0
+        (series,) = metrics.snapshot()["counters"]["response_bytes_total"]
+        assert series["value"] == len(body)
+
+    def test_error_recorded(self, mock_transport_client):
+        """Failed attempts before the body starts are recorded like any other."""
+        client = mock_transport_client(lambda request: httpx.Response(500, text="down"))
+        client.retry_policy.max_retries = 0
+        statuses = []
+        client.on_response(lambda event: statuses.append(event.status_code))
+
+        with collect_stats() as stats, pytest.raises(ServerError):
+            list(client.stream("playbyplayv2"))
+        assert statuses == [500]
+        assert stats.bytes == len(b"down")
+
+    async def test_attempt_recorded_async(self, mock_transport_client):
+        """stream_async records the attempt once the body is read."""
+        payload = big_payload(20)
+        client = mock_transport_client(lambda request: httpx.Response(200, json=payload))
+        sizes = []
+        client.on_response(lambda event: sizes.append(event.size))
+
+        with collect_stats() as stats:
+            items = [item async for item in client.stream_async("playbyplayv2")]
+
+        assert items == expected_items(payload)
+        assert stats.attempts == 1
+        assert sizes == [stats.bytes]
+        assert stats.bytes > 0
@@ -0,0 +1,217 @@
+"""Tests for season-aware cache TTLs."""
+
+import datetime
+
+import httpx
+import pytest
+
+from goldsberry.client import ttl as ttl_module
+from goldsberry.client.cache import MemoryCache
+from goldsberry.client.ttl import (
+    TTLPolicy,
+    TTLRule,
+    current_season_year,
+    eastern_today,
+    game_season_year,
+    parse_game_date,
+    payload_is_final,
+    season_start_year,
+)
+from goldsberry.enums.common import Season
+
+TODAY = datetime.date(2025, 1, 15)
+
+
+def policy(**kwargs):
+    """TTL policy pinned to the 2024-25 season."""
+    return TTLPolicy(today=lambda: TODAY, **kwargs)
+
+
+class TestSeasonHelpers:
+    """Tests for season parsing helpers."""
+
+    def test_season_start_year(self):
+        """Season strings and enums give their starting year."""
+        assert season_start_year("2015-16") == 2015
+        assert season_start_year(Season.SEASON_2023_24) == 2023
+        assert season_start_year("") is None
+
+    def test_game_season_year(self):
+        """Game IDs encode their season."""
+        assert game_season_year("0022400001") == 2024
+        assert game_season_year("0029700001") == 1997
+        assert game_season_year("bogus") is None
+
+    @pytest.mark.parametrize(
+        ("date", "year"),
+        [
+            (datetime.date(2024, 10, 1), 2024),
+            (datetime.date(2025, 4, 20), 2024),
+            (datetime.date(2025, 8, 1), 2024),
+        ],
+    )
+    def test_current_season_year(self, date, year):
+        """Seasons roll over in October."""
+        assert current_season_year(date) == year
+
+    def test_eastern_today(self):
+        """The default date is today in US/Eastern."""
+        assert abs(eastern_today() - datetime.datetime.now(datetime.timezone.utc).date()).days <= 1
+        assert current_season_year() == current_season_year(eastern_today())
+
+    def test_parse_game_date(self):
+        """Both game date formats parse."""
+        assert parse_game_date("2025-01-14T00:00:00") == datetime.date(2025, 1, 14)
+        assert parse_game_date("JAN 14, 2025") == datetime.date(2025, 1, 14)
+        assert parse_game_date("TBD") is None
+        assert parse_game_date(None) is None
+
+
+def game_payload(headers, *rows):
+    """A one result set game payload."""
+    return {"resultSets": [{"name": "GameSummary", "headers": headers, "rowSet": list(rows)}]}
+
+
+class TestPayloadIsFinal:
+    """Tests for inferring finality from game payloads."""
+
+    @pytest.mark.parametrize(
+        ("status", "final"),
+        [(1, False), (2, False), (3, True)],
+    )
+    def test_game_status(self, status, final):
+        """GAME_STATUS_ID decides, even for past game dates."""
+        data = game_payload(
+            ["GAME_DATE_EST", "GAME_ID", "GAME_STATUS_ID"],
+            ["2025-01-01T00:00:00", "0022400123", status],
+        )
+        assert payload_is_final(data, "0022400123", TODAY) is final
+
+    def test_result_and_date(self):
+        """A W/L result or a game date two days old means final."""
+        assert payload_is_final(
+            game_payload(["GAME_ID", "WL"], ["0022400123", "W"]), "0022400123", TODAY
+        )
+        assert payload_is_final(
+            game_payload(["GAME_ID", "GAME_DATE"], ["0022400123", "JAN 13, 2025"]),
+            "0022400123",
+            TODAY,
+        )
+        for date in ("JAN 14, 2025", "JAN 15, 2025"):
+            assert (
+                payload_is_final(
+                    game_payload(["GAME_ID", "GAME_DATE"], ["0022400123", date]),
+                    "0022400123",
+                    TODAY,
+                )
+                is None
+            )
+
+    def test_other_games_ignored(self):
+        """Rows for other games do not count."""
+        data = game_payload(["GAME_ID", "GAME_STATUS_ID"], ["0022400999", 3])
+        assert payload_is_final(data, "0022400123", TODAY) is None
+
+    def test_unknown(self, load_fixture):
+        """Payloads without status columns are not conclusive."""
+        data = load_fixture("game/boxscore_traditional_response.json")
+        assert payload_is_final(data, "0022400001", TODAY) is None
+        assert payload_is_final({"resource": "x"}, "0022400001", TODAY) is None
+
+
+class TestTTLPolicy:
+    """Tests for TTLPolicy."""
+
+    def test_past_season_cached_forever(self):
+        """Finished seasons never expire."""
+        assert policy()("playercareerstats", {"Season": "2015-16"}) is None
+
+    def test_current_season_uses_current_ttl(self):
+        """Current-season tables expire after current_ttl."""
+        assert policy(current_ttl=600)("leaguedashplayerstats", {"Season": "2024-25"}) == 600
+
+    def test_endpoint_ttls(self):
+        """Per-endpoint TTLs replace current_ttl but not history."""
+        ttl = policy(endpoint_ttls={"commonallplayers": 86400})
+        assert ttl("commonallplayers", {"Season": "2024-25"}) == 86400
+        assert ttl("commonallplayers", {"Season": "2020-21"}) is None
+
+    def test_current_game_is_live(self):
+        """Current-season games use live_game_ttl until marked final."""
+        ttl = policy(live_game_ttl=30)
+        params = {"GameID": "0022400123"}
+        assert ttl("boxscoretraditionalv2", params) == 30
+
+        ttl.mark_final("0022400123")
+        assert ttl("boxscoretraditionalv2", params) is None
+
+    def test_observe_marks_final(self):
+        """A payload showing the game is over marks it final."""
+        ttl = policy(live_game_ttl=30)
+        params = {"GameID": "0022400123"}
+
+        ttl.observe("boxscoresummaryv2", params, game_payload(["GAME_STATUS_ID"], [2]))
+        assert ttl("boxscoretraditionalv2", params) == 30
+
+        ttl.observe("boxscoresummaryv2", params, game_payload(["GAME_STATUS_ID"], [3]))
+        assert ttl.is_final("0022400123")
+        assert ttl("boxscoretraditionalv2", params) is None
+
+    def test_final_games_are_bounded(self, monkeypatch):
+        """Only the most recently used final games are remembered."""
+        monkeypatch.setattr(ttl_module, "MAX_FINAL_GAMES", 2)
+        ttl = policy(final_games=["0022400001", "0022400002"])
+        assert ttl.is_final("0022400001")
+
+        ttl.mark_final("0022400003")
+        assert ttl.is_final("0022400001")
+        assert not ttl.is_final("0022400002")
+        assert ttl.is_final("0022400003")
+
+    def test_past_season_game_is_history(self):
+        """Games from past seasons never expire."""
+        assert policy()("boxscoreadvancedv2", {"GameID": "0022300001"}) is None
+
+    def test_rules_take_precedence(self):
+        """Custom rules are checked first."""
+        ttl = policy(
+            rules=[
+                TTLRule(ttl=0, endpoints=("scoreboardv2",)),
+                TTLRule(ttl=5, when=lambda endpoint, params: "LastNGames" in (params or {})),
+            ]
+        )
+        assert ttl("scoreboardv2", {"Season": "2015-16"}) == 0
+        assert ttl("leaguedashplayerstats", {"Season": "2015-16", "LastNGames": 5}) == 5
+        assert ttl("leaguedashplayerstats", {"Season": "2015-16"}) is None
+
+    def test_rejects_negative_ttl(self):
+        """Negative TTLs are invalid."""
+        with pytest.raises(ValueError):
+            TTLPolicy(live_game_ttl=-1)
+
+    def test_as_client_cache_ttl(self, mock_transport_client):
+        """BaseClient accepts the policy as cache_ttl."""
+        cache = MemoryCache()
+        client = mock_transport_client(
+            lambda request: httpx.Response(200, json={}),
+            cache=cache,
+            cache_ttl=policy(rules=[TTLRule(ttl=0, endpoints=("scoreboardv2",))]),
+        )
+        client.get("playercareerstats", {"Season": "2015-16"})
+        client.get("scoreboardv2")
+
+        assert len(cache) == 1
+        assert cache.get("playercareerstats?Season=2015-16").expires_at is None
+
+    def test_client_observes_payload(self, mock_transport_client):
+        """The client lets the policy see a response before caching it."""
+        cache = MemoryCache()
+        payload = game_payload(["GAME_ID", "GAME_STATUS_ID"], ["0022400123", 3])
+        client = mock_transport_client(
+            lambda request: httpx.Response(200, json=payload),
+            cache=cache,
+            cache_ttl=policy(),
+        )
+        client.get("boxscoresummaryv2", {"GameID": "0022400123"})
+
+        assert cache.get("boxscoresummaryv2?GameID=0022400123").expires_at is None
@@ -0,0 +1,191 @@
+"""Tests for parse_nba_response."""
+
+import copy
+from typing import Optional
+
+import pytest
+from pydantic import ConfigDict, Field, ValidationError
+
+from goldsberry.client.stale import StaleResponse
+from goldsberry.models.base import (
+    NBABaseModel,
+    NBAResponse,
+    _primary_rows,
+    list_adapter,
+    parse_nba_response,
+    parse_rows,
+    row_converter,
+)
+from goldsberry.models.game import PlayerBoxscoreTraditional
+from goldsberry.models.league import PlayerStats
+from goldsberry.models.player import GameLog, PlayerInfo
+from goldsberry.models.team import Coach
+
+
+def reference_parse(data, model_class):
+    """The envelope-first parse parse_nba_response must match."""
+    dicts = NBAResponse[model_class](**data).get_dicts(0)
+    return [model_class(**d) for d in dicts]
+
+
+@pytest.fixture
+def player_list_data(load_fixture):
+    """Load player list fixture."""
+    return load_fixture("player/player_list_response.json")
+
+
+class TestParseNBAResponse:
+    """Tests for the single-pass parse."""
+
+    @pytest.mark.parametrize(
+        ("fixture", "model_class"),
+        [
+            ("player/player_list_response.json", PlayerInfo),
+            ("player/game_logs_response.json", GameLog),
+        ],
+    )
+    def test_matches_envelope_parse(self, load_fixture, fixture, model_class):
+        """Fixtures parse to the same models as the NBAResponse path."""
+        data = load_fixture(fixture)
+        assert parse_nba_response(data, model_class) == reference_parse(data, model_class)
+
+    def test_singular_result_set(self, player_list_data):
+        """Payloads using resultSet instead of resultSets are parsed."""
+        data = dict(player_list_data)
+        data["resultSet"] = data.pop("resultSets")
+        assert parse_nba_response(data, PlayerInfo) == reference_parse(player_list_data, PlayerInfo)
+
+    def test_dict_subclasses_take_fast_path(self, player_list_data):
+        """Dict subclasses like StaleResponse are parsed in a single pass."""
+        stale = StaleResponse(player_list_data, age=30.0)
+        assert _primary_rows(stale) is not None
+        assert parse_nba_response(stale, PlayerInfo) == reference_parse(
+            player_list_data, PlayerInfo
+        )
+
+    def test_input_not_modified(self, player_list_data):
+        """Parsing leaves the payload untouched."""
+        original = copy.deepcopy(player_list_data)
+        parse_nba_response(player_list_data, PlayerInfo)
+        assert player_list_data == original
+
+    def test_malformed_envelope_raises(self, player_list_data):
+        """Malformed payloads raise the same errors as before."""
+        data = copy.deepcopy(player_list_data)
+        data["resultSets"][0]["rowSet"][0] = "not a row"
+        with pytest.raises(ValidationError):
+            parse_nba_response(data, PlayerInfo)
+
+        del data["resource"]
+        with pytest.raises(ValidationError):
+            parse_nba_response(data, PlayerInfo)
+
+    def test_malformed_secondary_set_raises(self, player_list_data):
+        """A malformed non-primary result set is still rejected."""
+        data = copy.deepcopy(player_list_data)
+        data["resultSets"].append({"name": "Extra", "headers": [1], "rowSet": []})
+        with pytest.raises(ValidationError):
+            parse_nba_response(data, PlayerInfo)
+
+    def test_no_result_sets(self):
+        """A payload without result sets raises ValueError."""
+        with pytest.raises(ValueError, match="No result sets"):
+            parse_nba_response({"resource": "x", "resultSets": []}, PlayerInfo)
+
+
+def loop_parse(model_class, headers, rows):
+    """The per-row loop parse_rows must match."""
+    return [model_class(**dict(zip(headers, row))) for row in rows]
+
+
+@pytest.fixture
+def player_stats_set(load_fixture):
+    """First result set of the league player stats fixture."""
+    return load_fixture("league/player_stats_response.json")["resultSets"][0]
+
+
+class TestParseRows:
+    """Tests for cached row converters."""
+
+    @pytest.mark.parametrize(
+        ("fixture", "index", "model_class"),
+        [
+            ("league/player_stats_response.json", 0, PlayerStats),
+            ("game/boxscore_traditional_response.json", 0, PlayerBoxscoreTraditional),
+            ("team/roster_response.json", 1, Coach),
+        ],
+    )
+    def test_matches_loop(self, load_fixture, fixture, index, model_class):
+        """Converted rows equal the dict-per-row loop."""
+        result_set = load_fixture(fixture)["resultSets"][index]
+        headers, rows = result_set["headers"], result_set["rowSet"]
+        assert parse_rows(model_class, headers, rows) == loop_parse(model_class, headers, rows)
+
+    def test_cached_per_layout(self, player_stats_set):
+        """Converters are reused per layout and rebuilt when columns move."""
+        headers = tuple(player_stats_set["headers"])
+        assert row_converter(PlayerStats, headers) is row_converter(PlayerStats, headers)
+
+        order = list(reversed(range(len(headers))))
+        moved = [headers[i] for i in order]
+        rows = [[row[i] for i in order] for row in player_stats_set["rowSet"]]
+        assert row_converter(PlayerStats, tuple(moved)) is not row_converter(PlayerStats, headers)
+        assert parse_rows(PlayerStats, moved, rows) == loop_parse(
+            PlayerStats, player_stats_set["headers"], player_stats_set["rowSet"]
+        )
+
+    def test_new_columns_ignored(self, player_stats_set):
+        """Columns the model does not know are skipped."""
+        headers = player_stats_set["headers"] + ["NEW_STAT"]
+        rows = [row + [1.0] for row in player_stats_set["rowSet"]]
+        assert parse_rows(PlayerStats, headers, rows) == loop_parse(PlayerStats, headers, rows)
+
+    def test_schema_drift(self, player_stats_set, caplog):
+        """A layout missing required fields falls back and raises as before."""
+        headers = [h if h != "PLAYER_NAME" else "PLAYER" for h in player_stats_set["headers"]]
+
+        assert row_converter(PlayerStats, tuple(headers)) is None
+        assert "PLAYER_NAME" in caplog.text
+        with pytest.raises(ValidationError):
+            parse_rows(PlayerStats, headers, player_stats_set["rowSet"])
+
+    def test_missing_optional_field_warns(self, caplog):
+        """A layout missing an optional field is converted but logged."""
+        headers = ("a",)
+
+        class Model(NBABaseModel):
+            a: int
+            b: Optional[int] = Field(default=None, alias="B")
+
+        assert row_converter(Model, headers) is not None
+        assert "'B'" in caplog.text
+        assert parse_rows(Model, list(headers), [[1]]) == [Model(a=1)]
+
+    def test_forbid_keeps_unknown_columns(self):
+        """Models forbidding extra input still reject unknown columns."""
+
+        class Strict(NBABaseModel):
+            model_config = ConfigDict(extra="forbid")
+            a: int
+
+        with pytest.raises(ValidationError):
+            parse_rows(Strict, ["a", "NEW_STAT"], [[1, 2]])
+
+    def test_short_rows(self, player_stats_set):
+        """Rows of another width are parsed like the loop would."""
+        headers = player_stats_set["headers"] + ["NICKNAME"]
+        rows = player_stats_set["rowSet"]
+        assert parse_rows(PlayerStats, headers, rows) == loop_parse(PlayerStats, headers, rows)
+
+    def test_batch_error_location(self, player_stats_set):
+        """Validation errors name the failing row."""
+        rows = [list(row) for row in player_stats_set["rowSet"]]
+        rows[2][player_stats_set["headers"].index("PLAYER_ID")] = "not an id"
+
+        with pytest.raises(ValidationError) as exc_info:
+            parse_rows(PlayerStats, player_stats_set["headers"], rows)
+        assert exc_info.value.errors()[0]["loc"] == (2, "PLAYER_ID")
+
+    def test_adapter_cached(self):
+        """One TypeAdapter is built per model."""
+        assert list_adapter(PlayerStats) is list_adapter(PlayerStats)
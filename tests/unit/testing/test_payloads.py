@@ -0,0 +1,77 @@
+"""Tests for the stand-in server's payload factory."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from goldsberry.endpoints.game import BoxscoreAdvancedEndpoint, BoxscoreTraditionalEndpoint
+from goldsberry.endpoints.league import LeaguePlayerStatsEndpoint, LeagueTeamStatsEndpoint
+from goldsberry.endpoints.player import CareerStatsEndpoint
+from goldsberry.endpoints.team import (
+    TeamGameLogsEndpoint,
+    TeamRosterEndpoint,
+    TeamSeasonStatsEndpoint,
+)
+from goldsberry.testing import ENDPOINT_SCHEMAS, PayloadFactory
+
+
+class TestPayloadFactory:
+    """Tests for PayloadFactory."""
+
+    def test_synthetic_shape(self):
+        """Synthetic payloads have resultSets with matching headers and rows."""
+        data = PayloadFactory(rows=4).payload("leaguedashplayerstats", {"Season": "2024-25"})
+
+        assert data["resource"] == "leaguedashplayerstats"
+        assert data["parameters"] == {"Season": "2024-25"}
+        (result_set,) = data["resultSets"]
+        assert result_set["name"] == "LeagueDashPlayerStats"
+        assert len(result_set["rowSet"]) == 4
+        assert all(len(row) == len(result_set["headers"]) for row in result_set["rowSet"])
+
+    def test_deterministic(self):
+        """The same request always gets the same payload."""
+        factory = PayloadFactory()
+        params = {"GameID": "0022400001"}
+        assert factory.payload("boxscoretraditionalv2", params) == factory.payload(
+            "boxscoretraditionalv2", params
+        )
+
+    def test_echoes_ids(self):
+        """Query IDs are echoed into matching columns."""
+        data = PayloadFactory(rows=2).payload("playercareerstats", {"PlayerID": "203999"})
+        result_set = data["resultSets"][0]
+        column = result_set["headers"].index("PLAYER_ID")
+        assert {row[column] for row in result_set["rowSet"]} == {203999}
+
+    def test_unknown_endpoint(self):
+        """Unknown endpoints raise KeyError."""
+        with pytest.raises(KeyError):
+            PayloadFactory().payload("nosuchendpoint")
+
+    def test_templates_from_fixtures(self, fixtures_dir):
+        """Fixture files become templates keyed by resource."""
+        factory = PayloadFactory()
+        assert factory.load_fixtures(fixtures_dir) >= len(ENDPOINT_SCHEMAS) - 1
+
+        data = factory.payload("commonteamroster", {"TeamID": "1"})
+        assert data["parameters"] == {"TeamID": "1"}
+        assert data["resultSets"][0]["rowSet"][0][4] == "Payton Pritchard"
+
+    @pytest.mark.parametrize(
+        "endpoint_class",
+        [
+            BoxscoreAdvancedEndpoint,
+            BoxscoreTraditionalEndpoint,
+            CareerStatsEndpoint,
+            LeaguePlayerStatsEndpoint,
+            LeagueTeamStatsEndpoint,
+            TeamGameLogsEndpoint,
+            TeamRosterEndpoint,
+            TeamSeasonStatsEndpoint,
+        ],
+    )
+    def test_endpoints_parse_synthetic_payloads(self, endpoint_class):
+        """Every endpoint parser accepts synthetic payloads."""
+        data = PayloadFactory(rows=3).payload(endpoint_class.ENDPOINT)
+        assert endpoint_class(Mock())._parse_response(data) is not None
@@ -0,0 +1,174 @@
+"""Tests for the stand-in NBA Stats server."""
+
+import random
+
+import httpx
+import pytest
+
+from goldsberry.client.base import BaseClient
+from goldsberry.client.exceptions import (
+    ConfigurationError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+    TimeoutError as NBATimeoutError,
+)
+from goldsberry.endpoints.player import GameLogsEndpoint, PlayerListEndpoint
+from goldsberry.testing import FakeNBAServer, Faults, constant, lognormal, uniform
+from goldsberry.testing import server as server_module
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def fake_client(server, **kwargs):
+    """BaseClient talking to server, without rate limiting or retries."""
+    kwargs.setdefault("max_retries", 0)
+    kwargs.setdefault("enable_circuit_breaker", False)
+    return BaseClient(transport=server.transport(), rate_limit_interval=0, **kwargs)
+
+
+class TestLatencyModels:
+    """Tests for latency models."""
+
+    def test_models(self):
+        """Latency models draw from their distributions."""
+        rng = random.Random(0)
+        assert constant(0.2)(rng) == 0.2
+        assert 0.1 <= uniform(0.1, 0.3)(rng) <= 0.3
+        assert lognormal(0.2)(rng) > 0
+
+
+class TestFakeNBAServer:
+    """Tests for FakeNBAServer."""
+
+    def test_serves_endpoints(self):
+        """Endpoint classes fetch and parse responses from the server."""
+        server = FakeNBAServer()
+        client = fake_client(server)
+
+        assert PlayerListEndpoint(client).fetch()
+        assert GameLogsEndpoint(client).fetch(player_id=203999)
+        assert server.status_counts == {200: 2}
+
+    def test_unknown_endpoint(self):
+        """Unknown endpoints return 404."""
+        with pytest.raises(NotFoundError):
+            fake_client(FakeNBAServer()).get("nosuchendpoint")
+
+    def test_error_injection(self):
+        """error_rate=1 turns every response into a 5xx."""
+        server = FakeNBAServer(faults=Faults(error_rate=1.0))
+        with pytest.raises(ServerError):
+            fake_client(server).get("commonallplayers")
+
+    def test_throttle_injection(self):
+        """throttle_rate=1 returns 429 with Retry-After."""
+        server = FakeNBAServer(faults=Faults(throttle_rate=1.0, retry_after=7))
+        with pytest.raises(RateLimitError) as exc_info:
+            fake_client(server).get("commonallplayers")
+        assert exc_info.value.context["retry_after"] == 7
+
+    def test_hang_times_out(self):
+        """Hung requests raise a timeout after the client's read timeout."""
+        server = FakeNBAServer(faults=Faults(timeout_rate=1.0, hang_seconds=60))
+        with pytest.raises(NBATimeoutError):
+            fake_client(server, timeout=0.05).get("commonallplayers")
+
+    def test_rate_based_blocking(self):
+        """Exceeding max_rate blocks the client for block_seconds."""
+        clock = FakeClock()
+        server = FakeNBAServer(
+            faults=Faults(max_rate=2, rate_window=1.0, block_seconds=5), clock=clock
+        )
+        statuses = [
+            server.respond("GET", "/stats/commonallplayers", {}).status_code for _ in range(4)
+        ]
+        assert statuses == [200, 200, 429, 429]
+
+        clock.now = 5
+        assert server.respond("GET", "/stats/commonallplayers", {}).status_code == 200
+
+    async def test_retries_recover(self):
+        """BaseClient retries through injected errors end-to-end."""
+        server = FakeNBAServer(faults=Faults(error_rate=0.5), seed=3)
+        client = fake_client(server, max_retries=10)
+        client.retry_policy.base_delay = 0
+
+        for game in range(5):
+            await client.get_async("boxscoretraditionalv2", {"GameID": f"00224000{game:02d}"})
+        assert server.status_counts[200] == 5
+
+    def test_body_cache_bounded(self, monkeypatch):
+        """Encoded payloads are cached up to BODY_CACHE_SIZE requests."""
+        monkeypatch.setattr(server_module, "BODY_CACHE_SIZE", 3)
+        server = FakeNBAServer()
+        for game in range(10):
+            server.respond("GET", "/stats/boxscoretraditionalv2", {"GameID": f"00224000{game:02d}"})
+        assert len(server._bodies) == 3
+
+    async def test_asgi_app(self):
+        """The server is also an ASGI application."""
+        server = FakeNBAServer()
+        transport = httpx.ASGITransport(app=server)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            response = await client.get("/stats/leaguedashteamstats", params={"Season": "2024-25"})
+
+        assert response.status_code == 200
+        assert response.json()["parameters"] == {"Season": "2024-25"}
+
+
+class TestClientTransports:
+    """Tests for BaseClient's transport and async_transport."""
+
+    async def test_shared_transport(self):
+        """A transport implementing both interfaces serves sync and async clients."""
+        server = FakeNBAServer()
+        client = fake_client(server)
+
+        client.get("commonallplayers")
+        await client.get_async("commonallplayers")
+        assert server.status_counts == {200: 2}
+
+    async def test_separate_transports(self):
+        """Sync-only and async-only transports go to their own client."""
+        sync_server, async_server = FakeNBAServer(), FakeNBAServer()
+
+        class SyncOnly(httpx.BaseTransport):
+            def handle_request(self, request):
+                return sync_server.transport().handle_request(request)
+
+        class AsyncOnly(httpx.AsyncBaseTransport):
+            async def handle_async_request(self, request):
+                return await async_server.transport().handle_async_request(request)
+
+        client = BaseClient(
+            transport=SyncOnly(), async_transport=AsyncOnly(), rate_limit_interval=0
+        )
+        client.get("commonallplayers")
+        await client.get_async("commonallplayers")
+
+        assert sync_server.requests == 1
+        assert async_server.requests == 1
+
+    async def test_async_only_transport(self):
+        """An async-only transport serves async requests and refuses sync ones."""
+        server = FakeNBAServer()
+
+        class AsyncOnly(httpx.AsyncBaseTransport):
+            async def handle_async_request(self, request):
+                return await server.transport().handle_async_request(request)
+
+        client = BaseClient(transport=AsyncOnly(), rate_limit_interval=0)
+        await client.get_async("commonallplayers")
+        assert server.requests == 1
+
+        with pytest.raises(ConfigurationError):
+            client.get("commonallplayers")